@@ -0,0 +1,84 @@
+"""Run every benchmark, or the ones named on the command line.
+
+`--json PATH` also writes the results, with the Python version and platform
+they were measured on, so runs can be compared between releases.
+
+    python -m benchmarks
+    python -m benchmarks adapters asgi --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+from dataclasses import asdict
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional
+
+from . import __path__ as package_path
+from ._harness import Result, report
+
+
+def available() -> list[str]:
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules(package_path)
+        if not module.name.startswith("_")
+    )
+
+
+def environment() -> dict[str, Any]:
+    try:
+        cross_web_version: Optional[str] = version("cross-web")
+    except PackageNotFoundError:
+        cross_web_version = None
+
+    return {
+        "cross_web": cross_web_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        choices=available(),
+        metavar="benchmark",
+        help=f"benchmarks to run, all by default: {', '.join(available())}",
+    )
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    exit_code = 0
+    results: dict[str, list[Result]] = {}
+
+    for name in args.benchmarks or available():
+        print(f"# {name}")
+        results[name] = importlib.import_module(f".{name}", __package__).run()
+        exit_code |= report(results[name])
+        print()
+
+    if args.json is not None:
+        data = {
+            **environment(),
+            "benchmarks": {
+                name: [asdict(result) for result in module_results]
+                for name, module_results in results.items()
+            },
+        }
+        args.json.write_text(json.dumps(data, indent=2) + "\n")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Small helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class Result:
+    name: str
+    value: float
+    unit: str = "ns"
+    budget: Optional[float] = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.value > self.budget
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    number: int = 10_000,
+    repeat: int = 5,
+) -> Result:
+    """Time `func` and return the best per-call duration in nanoseconds."""
+    timings = timeit.Timer(func).repeat(repeat=repeat, number=number)
+
+    return Result(name, min(timings) / number * 1e9)
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine that never suspends, without an event loop.
+
+    Avoids measuring event loop overhead for code that only awaits
+    immediately available data, such as an in-memory ASGI `receive`.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+
+    coro.close()
+    raise RuntimeError("The coroutine suspended")
+
+
+def report(results: Iterable[Result]) -> int:
+    """Print `results` as a table and return a process exit code.
+
+    The exit code is non-zero when any result exceeds its budget.
+    """
+    results = list(results)
+    width = max((len(result.name) for result in results), default=0)
+    failed = False
+
+    for result in results:
+        line = f"{result.name:<{width}}  {result.value:>14,.1f} {result.unit}"
+
+        if result.budget is not None:
+            status = "FAIL" if result.over_budget else "ok"
+            line += f"  (budget {result.budget:,.1f} {result.unit}: {status})"
+            failed = failed or result.over_budget
+
+        print(line)
+
+    return 1 if failed else 0
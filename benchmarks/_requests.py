@@ -0,0 +1,253 @@
+"""Native framework requests with realistic header, query and cookie sizes.
+
+Each builder imports its framework lazily and raises `ImportError` when the
+framework is not installed, so benchmarks can skip it. Requests carry a JSON
+body, or a URL-encoded form body when built with `form=True`.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+from urllib.parse import urlencode
+
+PATH = "/graphql"
+QUERY = {f"param{index}": f"value{index}" for index in range(10)}
+QUERY_STRING = urlencode(QUERY)
+COOKIES = {f"cookie{index}": f"{index:032x}" for index in range(5)}
+COOKIE_HEADER = "; ".join(f"{name}={value}" for name, value in COOKIES.items())
+HEADERS = {
+    "Host": "api.example.com",
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/128.0",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Accept-Language": "en-GB,en;q=0.9",
+    "Authorization": "Bearer " + "a" * 64,
+    "Content-Type": "application/json; charset=utf-8",
+    "Cookie": COOKIE_HEADER,
+    "Origin": "https://app.example.com",
+    "Referer": "https://app.example.com/dashboard",
+    **{f"X-Custom-{index}": f"value-{index}" for index in range(10)},
+}
+BODY = b'{"query": "{ viewer { id name } }", "variables": {}}'
+HEADERS["Content-Length"] = str(len(BODY))
+FORM = {
+    "query": "query Viewer($id: ID!) { user(id: $id) { id name email } }",
+    "variables": '{"id": "1"}',
+    "operationName": "Viewer",
+    **{f"field{index}": f"value{index}" for index in range(5)},
+}
+FORM_BODY = urlencode(FORM).encode()
+FORM_HEADERS = {
+    **HEADERS,
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Content-Length": str(len(FORM_BODY)),
+}
+
+
+def body(*, form: bool = False) -> bytes:
+    return FORM_BODY if form else BODY
+
+
+def headers(*, form: bool = False) -> dict[str, str]:
+    return FORM_HEADERS if form else HEADERS
+
+
+def asgi_scope(*, form: bool = False) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "https",
+        "server": ("api.example.com", 443),
+        "root_path": "",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "query_string": QUERY_STRING.encode(),
+        "headers": [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers(form=form).items()
+        ],
+        "path_params": {},
+    }
+
+
+async def asgi_receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": BODY, "more_body": False}
+
+
+async def asgi_form_receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": FORM_BODY, "more_body": False}
+
+
+def _receive(form: bool) -> Any:
+    return asgi_form_receive if form else asgi_receive
+
+
+def wsgi_environ(*, form: bool = False) -> dict[str, Any]:
+    from io import BytesIO
+
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": "POST",
+        "SCRIPT_NAME": "",
+        "PATH_INFO": PATH,
+        "QUERY_STRING": QUERY_STRING,
+        "SERVER_NAME": "api.example.com",
+        "SERVER_PORT": "443",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "wsgi.url_scheme": "https",
+        "wsgi.input": BytesIO(body(form=form)),
+        "wsgi.errors": BytesIO(),
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+        "wsgi.version": (1, 0),
+    }
+
+    for name, value in headers(form=form).items():
+        key = name.upper().replace("-", "_")
+
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+
+        environ[key] = value
+
+    return environ
+
+
+def starlette_request(*, form: bool = False) -> Any:
+    from starlette.requests import Request
+
+    return Request(asgi_scope(form=form), _receive(form))
+
+
+@lru_cache(maxsize=None)
+def _litestar_route() -> tuple[Any, Any]:
+    from litestar import Litestar, post
+
+    @post(PATH)
+    async def handler() -> None: ...
+
+    return Litestar([handler]), handler
+
+
+def litestar_request(*, form: bool = False) -> Any:
+    from litestar import Request
+
+    # Litestar reads the body size limit from the route handler
+    app, handler = _litestar_route()
+    scope = {**asgi_scope(form=form), "app": app, "route_handler": handler}
+
+    return Request(scope, _receive(form))
+
+
+def quart_request(*, form: bool = False) -> Any:
+    from quart import Request
+    from werkzeug.datastructures import Headers
+
+    request = Request(
+        "POST",
+        "https",
+        PATH,
+        QUERY_STRING.encode(),
+        Headers(headers(form=form)),
+        "",
+        "1.1",
+        scope=asgi_scope(form=form),
+        send_push_promise=None,
+    )
+    request.body.set_result(body(form=form))
+
+    return request
+
+
+def sanic_request(*, form: bool = False) -> Any:
+    from sanic import Sanic
+    from sanic.compat import Header
+    from sanic.request import Request
+
+    app = Sanic.get_app("benchmarks", force_create=True)
+    request = Request(
+        f"{PATH}?{QUERY_STRING}".encode(),
+        Header(headers(form=form)),
+        "1.1",
+        "POST",
+        None,
+        app,
+    )
+    request.body = body(form=form)
+
+    return request
+
+
+def django_request(*, form: bool = False) -> Any:
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(ALLOWED_HOSTS=["*"], USE_TZ=True)
+
+    from django.core.handlers.wsgi import WSGIRequest
+
+    return WSGIRequest(wsgi_environ(form=form))
+
+
+def flask_request(*, form: bool = False) -> Any:
+    from flask import Request
+
+    return Request(wsgi_environ(form=form))
+
+
+def chalice_request(*, form: bool = False) -> Any:
+    from chalice.app import Request
+
+    return Request(
+        {
+            "headers": headers(form=form),
+            "multiValueQueryStringParameters": {
+                name: [value] for name, value in QUERY.items()
+            },
+            "pathParameters": None,
+            "stageVariables": None,
+            "body": body(form=form).decode(),
+            "isBase64Encoded": False,
+            "requestContext": {
+                "httpMethod": "POST",
+                "stage": "prod",
+                "domainName": "api.example.com",
+                "path": PATH,
+                "resourcePath": PATH,
+            },
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def _aiohttp_mocks() -> dict[str, Any]:
+    from unittest import mock
+
+    # `make_mocked_request` creates these for every request otherwise, which
+    # costs more than building the request itself
+    return {
+        name: mock.Mock(_reading_paused=False)
+        for name in ("app", "loop", "protocol", "transport", "writer")
+    }
+
+
+def aiohttp_request(*, form: bool = False) -> Any:
+    from aiohttp.streams import StreamReader
+    from aiohttp.test_utils import make_mocked_request
+    from multidict import CIMultiDict
+
+    mocks = _aiohttp_mocks()
+    payload = StreamReader(mocks["protocol"], 2**16, loop=mocks["loop"])
+    payload.feed_data(body(form=form))
+    payload.feed_eof()
+
+    return make_mocked_request(
+        "POST",
+        f"{PATH}?{QUERY_STRING}",
+        headers=CIMultiDict(headers(form=form)),
+        payload=payload,
+        **mocks,
+    )
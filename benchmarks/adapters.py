@@ -0,0 +1,179 @@
+"""Per-request cost of every framework adapter.
+
+For each adapter this benchmark measures constructing it and the first
+access to each of the properties a handler reads: `method`, `headers`,
+`query_params`, `cookies`, `url`, the body and the form data. Every
+measurement uses a fresh native request and a fresh adapter, built before
+the clock starts, so neither the framework's nor the adapter's caches are
+warm, just like on a real request. Requests use the header, query and cookie
+sizes from `benchmarks._requests`, form data is read from a URL-encoded
+form post.
+
+Adapters whose framework is not installed are skipped. Run the whole suite
+with `python -m benchmarks --json results.json` to save the results.
+
+    python -m benchmarks.adapters
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from cross_web.request._aiohttp import AiohttpHTTPRequestAdapter
+from cross_web.request._asgi import ASGIRequestAdapter
+from cross_web.request._chalice import ChaliceHTTPRequestAdapter
+from cross_web.request._django import (
+    AsyncDjangoHTTPRequestAdapter,
+    DjangoHTTPRequestAdapter,
+)
+from cross_web.request._flask import (
+    AsyncFlaskHTTPRequestAdapter,
+    FlaskHTTPRequestAdapter,
+)
+from cross_web.request._litestar import LitestarRequestAdapter
+from cross_web.request._quart import QuartHTTPRequestAdapter
+from cross_web.request._sanic import SanicHTTPRequestAdapter
+from cross_web.request._starlette import StarletteRequestAdapter
+from cross_web.request._wsgi import WSGIRequestAdapter
+
+from . import _requests
+from ._harness import Result, report
+
+NUMBER = 1_000
+REPEAT = 5
+PROPERTIES = ("method", "headers", "query_params", "cookies", "url")
+
+
+class Case(NamedTuple):
+    name: str
+    build_request: Callable[..., Any]
+    adapter: Callable[[Any], Any]
+    is_async: bool
+
+
+def asgi_request(*, form: bool = False) -> Any:
+    receive = _requests.asgi_form_receive if form else _requests.asgi_receive
+
+    return _requests.asgi_scope(form=form), receive
+
+
+CASES = [
+    Case("aiohttp", _requests.aiohttp_request, AiohttpHTTPRequestAdapter, True),
+    Case("asgi", asgi_request, lambda request: ASGIRequestAdapter(*request), True),
+    Case("chalice", _requests.chalice_request, ChaliceHTTPRequestAdapter, False),
+    Case("django", _requests.django_request, DjangoHTTPRequestAdapter, False),
+    Case(
+        "django (async)",
+        _requests.django_request,
+        AsyncDjangoHTTPRequestAdapter,
+        True,
+    ),
+    Case("flask", _requests.flask_request, FlaskHTTPRequestAdapter, False),
+    Case("flask (async)", _requests.flask_request, AsyncFlaskHTTPRequestAdapter, True),
+    Case("litestar", _requests.litestar_request, LitestarRequestAdapter, True),
+    Case("quart", _requests.quart_request, QuartHTTPRequestAdapter, True),
+    Case("sanic", _requests.sanic_request, SanicHTTPRequestAdapter, True),
+    Case("starlette", _requests.starlette_request, StarletteRequestAdapter, True),
+    Case("wsgi", _requests.wsgi_environ, WSGIRequestAdapter, False),
+]
+
+
+async def measure_each(
+    name: str,
+    setup: Callable[[], Any],
+    func: Callable[[Any], Any],
+    *,
+    is_async: bool = False,
+) -> Result:
+    """Best per-call duration of `func` on objects made by `setup`, untimed."""
+    best = float("inf")
+
+    for _ in range(REPEAT):
+        items = [setup() for _ in range(NUMBER)]
+
+        if is_async:
+            start = time.perf_counter_ns()
+            for item in items:
+                await func(item)
+        else:
+            start = time.perf_counter_ns()
+            for item in items:
+                func(item)
+
+        best = min(best, time.perf_counter_ns() - start)
+
+    return Result(name, best / NUMBER)
+
+
+def get_body(adapter: Any) -> Any:
+    return adapter.get_body() if hasattr(adapter, "get_body") else adapter.body
+
+
+async def get_form_data(adapter: Any) -> Any:
+    form_data = adapter.get_form_data()
+
+    return await form_data if asyncio.iscoroutine(form_data) else form_data
+
+
+async def measure_case(case: Case) -> list[Result]:
+    def new_adapter(form: bool = False) -> Any:
+        return case.adapter(case.build_request(form=form))
+
+    results = [
+        await measure_each(f"{case.name}: construct", case.build_request, case.adapter)
+    ]
+
+    for prop in PROPERTIES:
+        results.append(
+            await measure_each(
+                f"{case.name}: {prop}",
+                new_adapter,
+                lambda adapter, prop=prop: getattr(adapter, prop),
+            )
+        )
+
+    results.append(
+        await measure_each(
+            f"{case.name}: get_body", new_adapter, get_body, is_async=case.is_async
+        )
+    )
+
+    try:
+        await get_form_data(new_adapter(form=True))
+    except NotImplementedError:
+        # Chalice has no form parsing
+        return results
+
+    results.append(
+        await measure_each(
+            f"{case.name}: get_form_data",
+            lambda: new_adapter(form=True),
+            lambda adapter: adapter.get_form_data(),
+            is_async=case.is_async,
+        )
+    )
+
+    return results
+
+
+def run() -> list[Result]:
+    results = []
+
+    for case in CASES:
+        try:
+            case.build_request()
+        except ImportError:
+            continue
+
+        # Some frameworks need a running event loop to build their requests
+        results.extend(asyncio.run(measure_case(case)))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,63 @@
+"""Per-request overhead of `from_asgi` compared with `from_starlette`.
+
+Both build an `AsyncHTTPRequest` from the same ASGI scope and read what a
+typical GraphQL handler needs: method, a few headers, query parameters,
+cookies, the URL and the body. `from_starlette` first builds a Starlette
+`Request`, `from_asgi` decodes the raw scope directly.
+
+    python -m benchmarks.asgi
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from cross_web.request import AsyncHTTPRequest
+
+from . import _requests
+from ._harness import Result, measure, report, run_coroutine
+
+
+async def handle(request: AsyncHTTPRequest) -> tuple[Any, ...]:
+    return (
+        request.method,
+        request.content_type,
+        request.headers.get("authorization"),
+        request.headers.get("user-agent"),
+        request.query_params.get("param1"),
+        request.cookies.get("cookie1"),
+        request.url,
+        await request.get_body(),
+    )
+
+
+def run() -> list[Result]:
+    scope = _requests.asgi_scope()
+    receive = _requests.asgi_receive
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("from_asgi", lambda: AsyncHTTPRequest.from_asgi(scope, receive)),
+    ]
+
+    try:
+        from starlette.requests import Request
+    except ImportError:
+        pass
+    else:
+        cases.insert(
+            0,
+            (
+                "from_starlette",
+                lambda: AsyncHTTPRequest.from_starlette(Request(scope, receive)),
+            ),
+        )
+
+    return [
+        measure(name, lambda build=build: run_coroutine(handle(build())))
+        for name, build in cases
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,42 @@
+"""ETags and conditional requests on a read-heavy JSON endpoint.
+
+Reports the cost of computing the ETag of a 100 KB body, and of a
+conditional request that short-circuits to `304 Not Modified`.
+
+    python -m benchmarks.conditional
+"""
+
+from __future__ import annotations
+
+import sys
+
+from cross_web.conditional import compute_etag, conditional_response
+from cross_web.request import AsyncHTTPRequest
+from cross_web.request._testing import TestingRequestAdapter
+from cross_web.response import Response
+
+from ._harness import Result, measure, report, run_coroutine
+
+PAYLOAD = b'{"items": [' + b'{"id": 1, "name": "example"},' * 3_500 + b"{}]}"
+ETAG = compute_etag(PAYLOAD)
+REQUEST = AsyncHTTPRequest(
+    TestingRequestAdapter(method="GET", headers={"If-None-Match": ETAG})
+)
+
+
+def not_modified() -> Response:
+    response = Response(status_code=200, body=PAYLOAD)
+    return run_coroutine(conditional_response(REQUEST, response))
+
+
+def run() -> list[Result]:
+    assert not_modified().status_code == 304
+
+    return [
+        measure("etag", lambda: compute_etag(PAYLOAD), number=1_000),
+        measure("conditional request: 304", not_modified, number=1_000),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
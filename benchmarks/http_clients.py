@@ -0,0 +1,205 @@
+"""Per-request cost of the testing `HttpClient`s, with and without a session.
+
+Without a session every request sets up and tears down the framework's test
+harness: a test client, a test server or the app's lifespan. Inside
+`async with client:` the harness is started once and reused. This benchmark
+sends the same small GET request `REQUESTS` times in both modes, and once
+more as a batch through `gather()`, to a minimal app for every client whose
+framework is installed.
+
+    python -m benchmarks.http_clients
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+import uuid
+from collections.abc import Callable
+
+from cross_web.testing import HttpClient, RequestSpec
+
+from ._harness import Result, report
+
+REQUESTS = 200
+CONCURRENCY = 10
+
+
+def aiohttp_client() -> HttpClient:
+    from aiohttp import web
+
+    from cross_web.testing.clients.aiohttp import AiohttpHttpClient
+
+    async def ping(request: web.Request) -> web.Response:
+        return web.Response(text="pong")
+
+    app = web.Application()
+    app.router.add_get("/ping", ping)
+
+    return AiohttpHttpClient(app)
+
+
+def chalice_client() -> HttpClient:
+    from chalice.app import Chalice
+
+    from cross_web.testing.clients.chalice import ChaliceHttpClient
+
+    app = Chalice("benchmarks")
+
+    @app.route("/ping")
+    def ping() -> str:
+        return "pong"
+
+    return ChaliceHttpClient(app)
+
+
+def django_client() -> HttpClient:
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(ALLOWED_HOSTS=["*"], USE_TZ=True)
+
+    from django.http import HttpRequest, HttpResponse
+
+    from cross_web.testing.clients.django import DjangoHttpClient
+
+    def ping(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("pong")
+
+    return DjangoHttpClient(ping)
+
+
+def flask_client() -> HttpClient:
+    from flask import Flask
+
+    from cross_web.testing.clients.flask import FlaskHttpClient
+
+    app = Flask("benchmarks")
+    app.add_url_rule("/ping", view_func=lambda: "pong")
+
+    return FlaskHttpClient(app)
+
+
+def litestar_client() -> HttpClient:
+    from litestar import Litestar, get
+
+    from cross_web.testing.clients.litestar import LitestarHttpClient
+
+    @get("/ping", sync_to_thread=False)
+    def ping() -> str:
+        return "pong"
+
+    return LitestarHttpClient(Litestar([ping], logging_config=None))
+
+
+def quart_client() -> HttpClient:
+    from quart import Quart
+
+    from cross_web.testing.clients.quart import QuartHttpClient
+
+    app = Quart("benchmarks")
+
+    @app.get("/ping")
+    async def ping() -> str:
+        return "pong"
+
+    return QuartHttpClient(app)
+
+
+def sanic_client() -> HttpClient:
+    from sanic import Sanic
+    from sanic.request import Request
+    from sanic.response import HTTPResponse, text
+
+    from cross_web.testing.clients.sanic import SanicHttpClient
+
+    # Sanic app names are global, and the benchmarks build one app per run
+    app = Sanic(f"benchmarks_{uuid.uuid4().hex[:8]}")
+
+    @app.get("/ping")
+    async def ping(request: Request) -> HTTPResponse:
+        return text("pong")
+
+    return SanicHttpClient(app)
+
+
+def starlette_client() -> HttpClient:
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from cross_web.testing.clients.starlette import StarletteHttpClient
+
+    async def ping(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("pong")
+
+    return StarletteHttpClient(Starlette(routes=[Route("/ping", ping)]))
+
+
+CLIENTS: list[tuple[str, Callable[[], HttpClient]]] = [
+    ("aiohttp", aiohttp_client),
+    ("chalice", chalice_client),
+    ("django", django_client),
+    ("flask", flask_client),
+    ("litestar", litestar_client),
+    ("quart", quart_client),
+    ("sanic", sanic_client),
+    ("starlette", starlette_client),
+]
+
+
+async def send_requests(client: HttpClient) -> float:
+    """Nanoseconds per request for `REQUESTS` sequential requests."""
+    start = time.perf_counter_ns()
+
+    for _ in range(REQUESTS):
+        response = await client.get("/ping")
+        assert response.status_code == 200
+
+    return (time.perf_counter_ns() - start) / REQUESTS
+
+
+async def gather_requests(client: HttpClient) -> float:
+    """Nanoseconds per request for `REQUESTS` requests sent with `gather()`."""
+    start = time.perf_counter_ns()
+
+    responses = await client.gather(
+        [RequestSpec("/ping") for _ in range(REQUESTS)], concurrency=CONCURRENCY
+    )
+    assert all(response.status_code == 200 for response in responses)
+
+    return (time.perf_counter_ns() - start) / REQUESTS
+
+
+async def compare(name: str, client: HttpClient) -> list[Result]:
+    per_call = await send_requests(client)
+
+    async with client:
+        in_session = await send_requests(client)
+        gathered = await gather_requests(client)
+
+    return [
+        Result(f"{name}: per call", per_call),
+        Result(f"{name}: session", in_session),
+        Result(f"{name}: gather", gathered),
+    ]
+
+
+def run() -> list[Result]:
+    results: list[Result] = []
+
+    for name, build_client in CLIENTS:
+        try:
+            client = build_client()
+        except ImportError:
+            continue
+
+        results.extend(asyncio.run(compare(name, client)))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,68 @@
+"""Cold import time of `cross_web`.
+
+Every measurement runs in a fresh interpreter so nothing is cached in
+`sys.modules`. The benchmark fails when the best bare `import cross_web`
+exceeds the budget, which can be tuned with the `CROSS_WEB_IMPORT_BUDGET_MS`
+environment variable. The other snippets are reported for reference.
+
+    python -m benchmarks.import_time
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+from ._harness import Result, report
+
+RUNS = 10
+DEFAULT_BUDGET_MS = 30.0
+
+SNIPPETS = {
+    "from cross_web import Response": "from cross_web import Response",
+    "from cross_web import AsyncHTTPRequest": "from cross_web import AsyncHTTPRequest",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - start)
+"""
+
+
+def cold_import_ms(snippet: str) -> float:
+    timings = []
+
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(snippet=snippet)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output) * 1000)
+
+    return min(timings)
+
+
+def run() -> list[Result]:
+    budget = float(os.environ.get("CROSS_WEB_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+
+    return [
+        Result(
+            "import cross_web",
+            cold_import_ms("import cross_web"),
+            unit="ms",
+            budget=budget,
+        ),
+        *(
+            Result(name, cold_import_ms(snippet), unit="ms")
+            for name, snippet in SNIPPETS.items()
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
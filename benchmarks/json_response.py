@@ -0,0 +1,73 @@
+"""Building JSON responses.
+
+JSON responses were built by hand with `json.dumps(data)`, which produces a
+`str` that the framework encodes again, and `Response.json()` decoded the
+body even when the object it came from was at hand. `Response.json_response`
+serializes straight to bytes with the configured codec and keeps the
+original object for `json()`. This benchmark compares both for a medium
+sized payload.
+
+    python -m benchmarks.json_response
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from cross_web.codecs import set_json_codec
+from cross_web.response import Response
+
+from ._harness import Result, measure, report
+
+DATA = {
+    "users": [
+        {"id": index, "name": f"user {index}", "email": f"user{index}@example.com"}
+        for index in range(100)
+    ]
+}
+
+
+def by_hand() -> Response:
+    return Response(
+        status_code=200,
+        body=json.dumps(DATA),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def run() -> list[Result]:
+    results = [
+        measure("by hand: build", by_hand, number=1_000),
+        measure("by hand: build + json()", lambda: by_hand().json(), number=1_000),
+    ]
+
+    for codec in ("json", "orjson", "msgspec"):
+        try:
+            set_json_codec(codec)
+        except ImportError:
+            continue
+
+        try:
+            results.append(
+                measure(
+                    f"json_response ({codec}): build",
+                    lambda: Response.json_response(DATA),
+                    number=1_000,
+                )
+            )
+            results.append(
+                measure(
+                    f"json_response ({codec}): build + json()",
+                    lambda: Response.json_response(DATA).json(),
+                    number=1_000,
+                )
+            )
+        finally:
+            set_json_codec("json")
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
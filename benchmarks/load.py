@@ -0,0 +1,55 @@
+"""Throughput and tail latency of the same handler on every framework.
+
+Runs a closed-loop `run_load()` workload of `REQUESTS` small GET requests,
+`CONCURRENCY` at a time, against the minimal apps of `http_clients` inside one
+client session, and reports the throughput and the p50 and p99 latencies.
+
+    python -m benchmarks.load
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from cross_web.testing import HttpClient, LoadResult, RequestSpec, run_load
+
+from ._harness import Result, report
+from .http_clients import CLIENTS
+
+REQUESTS = 500
+CONCURRENCY = 10
+
+
+async def load(client: HttpClient) -> LoadResult:
+    async with client:
+        return await run_load(
+            client, RequestSpec("/ping"), count=REQUESTS, concurrency=CONCURRENCY
+        )
+
+
+def run() -> list[Result]:
+    results: list[Result] = []
+
+    for name, build_client in CLIENTS:
+        try:
+            client = build_client()
+        except ImportError:
+            continue
+
+        result = asyncio.run(load(client))
+        assert result.errors == 0 and set(result.status_codes) == {200}
+
+        results.extend(
+            [
+                Result(f"{name}: throughput", result.throughput, unit="req/s"),
+                Result(f"{name}: p50", result.p50),
+                Result(f"{name}: p99", result.p99),
+            ]
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,73 @@
+"""Repeated property access on a single request.
+
+GraphQL servers resolve many fields per request, and resolvers tend to read
+the same request data (auth headers, cookies, query params) over and over.
+This benchmark reads every memoized adapter property `ACCESSES` times per
+request and compares it with recomputing the value on every access, which is
+what the adapters did before their properties were memoized.
+
+    python -m benchmarks.memoized_properties
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from cross_web.request._aiohttp import AiohttpHTTPRequestAdapter
+from cross_web.request._chalice import ChaliceHTTPRequestAdapter
+from cross_web.request._django import DjangoHTTPRequestAdapter
+from cross_web.request._flask import FlaskHTTPRequestAdapter
+from cross_web.request._litestar import LitestarRequestAdapter
+from cross_web.request._starlette import StarletteRequestAdapter
+
+from . import _requests
+from ._harness import Result, measure, report
+
+PROPERTIES = ("headers", "cookies", "query_params", "url", "content_type")
+ACCESSES = 10
+
+CASES: list[tuple[str, type[Any], Callable[[], Any]]] = [
+    ("aiohttp", AiohttpHTTPRequestAdapter, _requests.aiohttp_request),
+    ("chalice", ChaliceHTTPRequestAdapter, _requests.chalice_request),
+    ("django", DjangoHTTPRequestAdapter, _requests.django_request),
+    ("flask", FlaskHTTPRequestAdapter, _requests.flask_request),
+    ("litestar", LitestarRequestAdapter, _requests.litestar_request),
+    ("starlette", StarletteRequestAdapter, _requests.starlette_request),
+]
+
+
+def run() -> list[Result]:
+    results = []
+
+    for name, adapter_class, build_request in CASES:
+        try:
+            request = build_request()
+        except ImportError:
+            continue
+
+        getters = [getattr(adapter_class, prop).func for prop in PROPERTIES]
+
+        def memoized() -> None:
+            adapter = adapter_class(request)
+
+            for _ in range(ACCESSES):
+                for prop in PROPERTIES:
+                    getattr(adapter, prop)
+
+        def recomputed() -> None:
+            adapter = adapter_class(request)
+
+            for _ in range(ACCESSES):
+                for getter in getters:
+                    getter(adapter)
+
+        results.append(measure(f"{name}: recomputed", recomputed, number=1_000))
+        results.append(measure(f"{name}: memoized", memoized, number=1_000))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,125 @@
+"""Per-request memory footprint of the request and response types.
+
+Every request allocates an adapter, an `AsyncHTTPRequest` and, for form
+posts, a `FormData`. This benchmark measures the bytes allocated per
+instance of the slotted types and compares them with plain classes holding
+the same attributes in an instance `__dict__`, which is how these types were
+laid out before they used `__slots__`.
+
+Slotted adapters keep their cached properties in a `_cache` dict, allocated
+on the first cached read, which the `__dict__` classes don't need: they
+store cached values in their instance `__dict__`. Adapters are measured
+without and with that dict, empty, and the per-request totals include it,
+as nearly every request reads a cached property.
+
+    python -m benchmarks.memory
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from collections.abc import Callable
+from itertools import chain
+from typing import Any
+
+from cross_web.request import AsyncHTTPRequest
+from cross_web.request._base import FormData
+from cross_web.request._django import AsyncDjangoHTTPRequestAdapter
+from cross_web.request._starlette import StarletteRequestAdapter
+from cross_web.response import Cookie, Response
+
+from ._harness import Result, report
+
+INSTANCES = 10_000
+
+PER_REQUEST = (StarletteRequestAdapter, AsyncHTTPRequest, FormData)
+TYPES = (
+    StarletteRequestAdapter,
+    AsyncDjangoHTTPRequestAdapter,
+    AsyncHTTPRequest,
+    FormData,
+    Response,
+    Cookie,
+)
+
+
+def slot_names(cls: type) -> list[str]:
+    slots = (getattr(base, "__slots__", ()) for base in cls.__mro__)
+    return list(chain.from_iterable(slots))
+
+
+def with_dict(cls: type) -> Callable[[], Any]:
+    """A plain class storing the same attributes in its instance `__dict__`."""
+    names = [name for name in slot_names(cls) if name != "_cache"]
+
+    def __init__(self: Any) -> None:
+        for name in names:
+            setattr(self, name, None)
+
+    return type(f"{cls.__name__}WithDict", (), {"__init__": __init__})
+
+
+def slotted(cls: type, *, cache: bool = True) -> Callable[[], Any]:
+    names = slot_names(cls)
+
+    def factory() -> Any:
+        instance = object.__new__(cls)
+
+        for name in names:
+            if name != "_cache":
+                # Also works for frozen dataclasses
+                object.__setattr__(instance, name, None)
+            elif cache:
+                object.__setattr__(instance, name, {})
+
+        return instance
+
+    return factory
+
+
+def bytes_per_instance(factory: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(INSTANCES)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Exclude the list holding the instances
+    return (allocated - baseline - sys.getsizeof(instances)) / INSTANCES
+
+
+def run() -> list[Result]:
+    results = []
+
+    for cls in TYPES:
+        results.append(
+            Result(f"{cls.__name__}: __dict__", bytes_per_instance(with_dict(cls)), "B")
+        )
+        results.append(
+            Result(
+                f"{cls.__name__}: __slots__",
+                bytes_per_instance(slotted(cls, cache=False)),
+                "B",
+            )
+        )
+
+        if "_cache" in slot_names(cls):
+            results.append(
+                Result(
+                    f"{cls.__name__}: __slots__ + _cache",
+                    bytes_per_instance(slotted(cls)),
+                    "B",
+                )
+            )
+
+    for label, make in (("__dict__", with_dict), ("__slots__", slotted)):
+        factories = [make(cls) for cls in PER_REQUEST]
+        per_request = sum(bytes_per_instance(factory) for factory in factories)
+        results.append(Result(f"per request: {label}", per_request, "B"))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
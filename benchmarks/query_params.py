@@ -0,0 +1,101 @@
+"""Query parameter access on long query strings.
+
+Adapters used to copy the framework's multidict into a new dict
+(`GET.dict()`, `args.to_dict()`, a comprehension over Sanic's arguments)
+whenever `query_params` was built, dropping repeated keys along the way.
+`QueryParams` wraps the native object instead. This benchmark builds the
+view for a query string with `PARAMS` parameters and reads `READS` of them,
+comparing it with the copy-based approach.
+
+    python -m benchmarks.query_params
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from cross_web.request._base import QueryParams
+
+from ._harness import Result, measure, report
+
+PARAMS = 300
+READS = 5
+ITEMS = [(f"param{index % (PARAMS // 2)}", f"value{index}") for index in range(PARAMS)]
+QUERY_STRING = urlencode(ITEMS)
+KEYS = [f"param{index}" for index in range(READS)]
+
+
+def django_params() -> tuple[Any, Callable[[Any], Any]]:
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(ALLOWED_HOSTS=["*"], USE_TZ=True)
+
+    from django.http import QueryDict
+
+    return QueryDict(QUERY_STRING), lambda params: params.dict()
+
+
+def flask_params() -> tuple[Any, Callable[[Any], Any]]:
+    from werkzeug.datastructures import ImmutableMultiDict
+
+    return ImmutableMultiDict(parse_qsl(QUERY_STRING)), lambda params: params.to_dict()
+
+
+def sanic_params() -> tuple[Any, Callable[[Any], Any]]:
+    from urllib.parse import parse_qs
+
+    from sanic.request.parameters import RequestParameters
+
+    def copy(params: Any) -> Any:
+        return {key: params.get(key, None) for key in params}
+
+    return RequestParameters(parse_qs(QUERY_STRING)), copy
+
+
+def aiohttp_params() -> tuple[Any, Callable[[Any], Any]]:
+    from multidict import MultiDict, MultiDictProxy
+
+    return MultiDictProxy(MultiDict(parse_qsl(QUERY_STRING))), lambda p: p.copy()
+
+
+CASES: list[tuple[str, Callable[[], tuple[Any, Callable[[Any], Any]]]]] = [
+    ("aiohttp", aiohttp_params),
+    ("django", django_params),
+    ("flask", flask_params),
+    ("sanic", sanic_params),
+]
+
+
+def run() -> list[Result]:
+    results = []
+
+    for name, build in CASES:
+        try:
+            native, copy = build()
+        except ImportError:
+            continue
+
+        def copied() -> None:
+            params = copy(native)
+
+            for key in KEYS:
+                params.get(key)
+
+        def wrapped() -> None:
+            params = QueryParams(native)
+
+            for key in KEYS:
+                params.get(key)
+
+        results.append(measure(f"{name}: copied", copied, number=2_000))
+        results.append(measure(f"{name}: QueryParams", wrapped, number=2_000))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
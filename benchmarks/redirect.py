@@ -0,0 +1,41 @@
+"""Building redirects to a fixed URL.
+
+`Response.redirect` encodes every query parameter on each call, including
+the ones that never change, such as an OAuth `client_id` and `scope`.
+`RedirectTemplate` encodes the static parameters once, so each call only
+encodes the dynamic ones. This benchmark builds an authorization redirect
+with both.
+
+    python -m benchmarks.redirect
+"""
+
+from __future__ import annotations
+
+import sys
+
+from cross_web.response import RedirectTemplate, Response
+
+from ._harness import Result, measure, report
+
+URL = "https://auth.example.com/oauth/authorize"
+STATIC = {
+    "client_id": "3f5b0c2e-8d7a-4c1b-9e6f-0a1b2c3d4e5f",
+    "response_type": "code",
+    "redirect_uri": "https://app.example.com/callback",
+    "scope": "openid email profile",
+}
+DYNAMIC = {"state": "af0ifjsldkj"}
+TEMPLATE = RedirectTemplate(URL, STATIC)
+
+
+def run() -> list[Result]:
+    return [
+        measure(
+            "Response.redirect", lambda: Response.redirect(URL, {**STATIC, **DYNAMIC})
+        ),
+        measure("RedirectTemplate", lambda: TEMPLATE(DYNAMIC)),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
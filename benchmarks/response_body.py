@@ -0,0 +1,66 @@
+"""Converting a 1 MB response body to a framework response.
+
+`Response.body` used to accept `str` only, so binary or pre-serialized
+payloads were decoded into a `str` and encoded again by the framework: two
+full copies per response. Binary bodies are now passed through as is. This
+benchmark converts a 1 MB payload with `to_fastapi()` and reports the time
+and the memory allocated per conversion.
+
+    python -m benchmarks.response_body
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from cross_web.response import Response
+
+from ._harness import Result, measure, report
+
+PAYLOAD = b'{"rows": [' + b'"0123456789abcdef",' * 55_000 + b'""]}'
+
+
+def allocated(func: Callable[[], Any]) -> float:
+    """Peak bytes allocated while running `func` once."""
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return float(peak)
+
+
+def run() -> list[Result]:
+    try:
+        import fastapi  # noqa: F401
+    except ImportError:
+        return []
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        (
+            "str (decoded)",
+            lambda: Response(status_code=200, body=PAYLOAD.decode()).to_fastapi(),
+        ),
+        ("bytes", lambda: Response(status_code=200, body=PAYLOAD).to_fastapi()),
+        (
+            "memoryview",
+            lambda: Response(status_code=200, body=memoryview(PAYLOAD)).to_fastapi(),
+        ),
+    ]
+    results = []
+
+    for name, convert in cases:
+        results.append(measure(f"{name}: time", convert, number=50))
+        results.append(Result(f"{name}: allocated", allocated(convert), unit="B"))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,71 @@
+"""Converting a `Response` to each framework's native response.
+
+Every converter maps the status, headers, cookies and body onto the
+framework's own constructor and set-cookie API, without intermediate copies.
+This benchmark converts a small JSON response with two cookies and reports
+the per-call time for every installed framework.
+
+    python -m benchmarks.response_conversion
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from cross_web.response import Cookie, Response
+
+from ._harness import Result, measure, report
+
+RESPONSE = Response(
+    status_code=200,
+    body=b'{"id": 1, "name": "example"}',
+    headers={"Content-Type": "application/json", "Cache-Control": "no-store"},
+    cookies=[
+        Cookie(name="session", value="abc123", secure=True, max_age=3600),
+        Cookie(name="theme", value="dark", secure=False, samesite="strict"),
+    ],
+)
+
+
+def configure_django() -> None:
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(ALLOWED_HOSTS=["*"], USE_TZ=True)
+
+
+CASES: list[tuple[str, Callable[[], Any]]] = [
+    ("aiohttp", RESPONSE.to_aiohttp),
+    ("chalice", RESPONSE.to_chalice),
+    ("django", RESPONSE.to_django),
+    ("fastapi", RESPONSE.to_fastapi),
+    ("flask", RESPONSE.to_flask),
+    ("litestar", RESPONSE.to_litestar),
+    ("quart", RESPONSE.to_quart),
+    ("sanic", RESPONSE.to_sanic),
+]
+
+
+def run() -> list[Result]:
+    try:
+        configure_django()
+    except ImportError:
+        pass
+
+    results = []
+
+    for name, convert in CASES:
+        try:
+            convert()
+        except ImportError:
+            continue
+
+        results.append(measure(name, convert, number=2_000))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,54 @@
+"""Sending a `Response` to an ASGI server.
+
+Pure-ASGI apps used to call `to_fastapi()` and then the Starlette response,
+which builds a `MutableHeaders`, a cookie jar and the response object before
+emitting any message. `Response.send_asgi(send)` writes the two ASGI
+messages directly. This benchmark compares both paths for a small JSON
+response with a cookie.
+
+    python -m benchmarks.send_asgi
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from cross_web.response import Cookie, Response
+
+from ._harness import Result, measure, report, run_coroutine
+from ._requests import asgi_receive, asgi_scope
+
+RESPONSE = Response(
+    status_code=200,
+    body=b'{"id": 1, "name": "example"}',
+    headers={"Content-Type": "application/json"},
+    cookies=[Cookie(name="session", value="abc123", secure=True)],
+)
+SCOPE = asgi_scope()
+
+
+async def send(message: dict[str, Any]) -> None:
+    pass
+
+
+def run() -> list[Result]:
+    results = [
+        measure("send_asgi", lambda: run_coroutine(RESPONSE.send_asgi(send))),
+    ]
+
+    try:
+        import fastapi  # noqa: F401
+    except ImportError:
+        return results
+
+    def via_fastapi() -> None:
+        run_coroutine(RESPONSE.to_fastapi()(SCOPE, asgi_receive, send))
+
+    results.append(measure("to_fastapi + __call__", via_fastapi))
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -0,0 +1,64 @@
+"""Per-request overhead of `from_wsgi` compared with `from_flask`.
+
+Both build a `SyncHTTPRequest` for a fresh WSGI environ and read what a
+webhook handler typically needs: method, a few headers, query parameters,
+cookies, the URL and the body. `from_flask` first builds a Flask (Werkzeug)
+`Request`, `from_wsgi` reads the environ directly.
+
+    python -m benchmarks.wsgi
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from cross_web.request import SyncHTTPRequest
+
+from . import _requests
+from ._harness import Result, measure, report
+
+
+def handle(request: SyncHTTPRequest) -> tuple[Any, ...]:
+    return (
+        request.method,
+        request.content_type,
+        request.headers.get("authorization"),
+        request.headers.get("user-agent"),
+        request.query_params.get("param1"),
+        request.cookies.get("cookie1"),
+        request.url,
+        request.get_body(),
+    )
+
+
+def run() -> list[Result]:
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("from_wsgi", lambda: SyncHTTPRequest.from_wsgi(_requests.wsgi_environ())),
+    ]
+
+    try:
+        from flask import Request
+    except ImportError:
+        pass
+    else:
+        cases.insert(
+            0,
+            (
+                "from_flask",
+                lambda: SyncHTTPRequest.from_flask(Request(_requests.wsgi_environ())),
+            ),
+        )
+
+    # Building the environ is part of both cases, measure it on its own too
+    results = [measure("wsgi_environ()", _requests.wsgi_environ)]
+    results.extend(
+        measure(name, lambda build=build: handle(build())) for name, build in cases
+    )
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(report(run()))
@@ -160,6 +160,22 @@ def mypy(session: nox.Session) -> None:
     session.run("mypy", "src")
 
 
+@nox.session(python=["3.12"])
+def benchmarks(session: nox.Session) -> None:
+    """Run the benchmarks, e.g. `nox -s benchmarks -- adapters --json out.json`."""
+    session.run_install(
+        "uv",
+        "sync",
+        "--dev",
+        "--group",
+        "integrations",
+        "--no-default-groups",
+        f"--python={session.virtualenv.location}",
+        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
+    )
+    session.run("python", "-m", "benchmarks", *session.posargs)
+
+
 @nox.session(python=["3.12"])
 def coverage(session: nox.Session) -> None:
     """Combine coverage data and generate reports."""
@@ -1,19 +1,101 @@
-from .exceptions import HTTPException
-from .protocols import BaseRequestProtocol
-from .request import AsyncHTTPRequest
-from .request._aiohttp import AiohttpHTTPRequestAdapter
-from .request._base import AsyncHTTPRequestAdapter, FormData, SyncHTTPRequestAdapter
-from .request._chalice import ChaliceHTTPRequestAdapter
-from .request._django import AsyncDjangoHTTPRequestAdapter, DjangoHTTPRequestAdapter
-from .request._flask import AsyncFlaskHTTPRequestAdapter, FlaskHTTPRequestAdapter
-from .request._litestar import LitestarRequestAdapter
-from .request._quart import QuartHTTPRequestAdapter
-from .request._sanic import SanicHTTPRequestAdapter
-from .request._starlette import StarletteRequestAdapter
-from .request._testing import TestingRequestAdapter
-from .response import Cookie, Response
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .codecs import JSONCodec, get_json_codec, set_json_codec
+    from .compression import Compression
+    from .conditional import (
+        compute_etag,
+        conditional_response,
+        conditional_response_sync,
+    )
+    from .exceptions import HTTPException
+    from .protocols import BaseRequestProtocol
+    from .request import AsyncHTTPRequest, SyncHTTPRequest
+    from .request._aiohttp import AiohttpHTTPRequestAdapter, MultipartLimits
+    from .request._asgi import ASGIRequestAdapter
+    from .request._base import (
+        AsyncHTTPRequestAdapter,
+        FormData,
+        Headers,
+        QueryParams,
+        SyncHTTPRequestAdapter,
+    )
+    from .request._chalice import ChaliceHTTPRequestAdapter
+    from .request._django import (
+        AsyncDjangoHTTPRequestAdapter,
+        DjangoHTTPRequestAdapter,
+    )
+    from .request._flask import AsyncFlaskHTTPRequestAdapter, FlaskHTTPRequestAdapter
+    from .request._litestar import LitestarRequestAdapter
+    from .request._quart import QuartHTTPRequestAdapter
+    from .request._sanic import SanicHTTPRequestAdapter
+    from .request._starlette import StarletteRequestAdapter
+    from .request._testing import TestingRequestAdapter
+    from .request._wsgi import WSGIRequestAdapter
+    from .response import Cookie, RedirectTemplate, Response, StreamingResponse
+
+# Public names are resolved on first access (PEP 562) so that importing
+# `cross_web` only loads the modules that are actually used.
+_LAZY_IMPORTS = {
+    "ASGIRequestAdapter": ".request._asgi",
+    "AiohttpHTTPRequestAdapter": ".request._aiohttp",
+    "AsyncDjangoHTTPRequestAdapter": ".request._django",
+    "AsyncFlaskHTTPRequestAdapter": ".request._flask",
+    "AsyncHTTPRequest": ".request",
+    "AsyncHTTPRequestAdapter": ".request._base",
+    "BaseRequestProtocol": ".protocols",
+    "ChaliceHTTPRequestAdapter": ".request._chalice",
+    "Compression": ".compression",
+    "Cookie": ".response",
+    "DjangoHTTPRequestAdapter": ".request._django",
+    "FlaskHTTPRequestAdapter": ".request._flask",
+    "FormData": ".request._base",
+    "HTTPException": ".exceptions",
+    "Headers": ".request._base",
+    "JSONCodec": ".codecs",
+    "LitestarRequestAdapter": ".request._litestar",
+    "MultipartLimits": ".request._aiohttp",
+    "QuartHTTPRequestAdapter": ".request._quart",
+    "QueryParams": ".request._base",
+    "RedirectTemplate": ".response",
+    "Response": ".response",
+    "SanicHTTPRequestAdapter": ".request._sanic",
+    "StarletteRequestAdapter": ".request._starlette",
+    "StreamingResponse": ".response",
+    "SyncHTTPRequest": ".request",
+    "SyncHTTPRequestAdapter": ".request._base",
+    "TestingRequestAdapter": ".request._testing",
+    "WSGIRequestAdapter": ".request._wsgi",
+    "compute_etag": ".conditional",
+    "conditional_response": ".conditional",
+    "conditional_response_sync": ".conditional",
+    "get_json_codec": ".codecs",
+    "set_json_codec": ".codecs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the module so the next lookup skips __getattr__ entirely
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
+    "ASGIRequestAdapter",
     "AiohttpHTTPRequestAdapter",
     "AsyncDjangoHTTPRequestAdapter",
     "AsyncFlaskHTTPRequestAdapter",
@@ -21,16 +103,30 @@ __all__ = [
     "AsyncHTTPRequestAdapter",
     "BaseRequestProtocol",
     "ChaliceHTTPRequestAdapter",
+    "Compression",
     "Cookie",
     "DjangoHTTPRequestAdapter",
     "FlaskHTTPRequestAdapter",
     "FormData",
     "HTTPException",
+    "Headers",
+    "JSONCodec",
     "LitestarRequestAdapter",
+    "MultipartLimits",
     "QuartHTTPRequestAdapter",
+    "QueryParams",
+    "RedirectTemplate",
     "Response",
     "SanicHTTPRequestAdapter",
     "StarletteRequestAdapter",
+    "StreamingResponse",
+    "SyncHTTPRequest",
     "SyncHTTPRequestAdapter",
     "TestingRequestAdapter",
+    "WSGIRequestAdapter",
+    "compute_etag",
+    "conditional_response",
+    "conditional_response_sync",
+    "get_json_codec",
+    "set_json_codec",
 ]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import MISSING, dataclass, fields
+from functools import wraps
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, cast, overload
+
+_T = TypeVar("_T")
+
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+else:
+    # Only type checkers need this, avoid importing typing_extensions at runtime
+    def dataclass_transform(**kwargs: Any) -> Callable[[_T], _T]:
+        return lambda func: func
+
+
+def _add_slots(cls: type[_T]) -> type[_T]:
+    """Recreate a dataclass with `__slots__`, like `dataclass(slots=True)`."""
+    inherited_slots = set(
+        chain.from_iterable(getattr(base, "__slots__", ()) for base in cls.__mro__[1:])
+    )
+    field_names = tuple(
+        field.name
+        for field in fields(cast(Any, cls))
+        if field.name not in inherited_slots
+    )
+
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+
+    # Class level defaults would conflict with the slot descriptors, the
+    # generated __init__ already holds them.
+    for name in field_names:
+        namespace.pop(name, None)
+
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    # Python 3.9's generated __init__ leaves `init=False` fields to their
+    # class level default, which the slots replace: set them explicitly
+    init_defaults = [
+        (field.name, field.default)
+        for field in fields(cast(Any, cls))
+        if not field.init and field.default is not MISSING
+    ]
+
+    if init_defaults:
+        namespace["__init__"] = _with_defaults(namespace["__init__"], init_defaults)
+
+    metaclass: Any = type(cls)
+    slotted_cls = cast("type[_T]", metaclass(cls.__name__, cls.__bases__, namespace))
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    return slotted_cls
+
+
+def _with_defaults(
+    init: Callable[..., None], defaults: list[tuple[str, Any]]
+) -> Callable[..., None]:
+    @wraps(init)
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        for name, default in defaults:
+            # Also works for frozen dataclasses
+            object.__setattr__(self, name, default)
+
+        init(self, *args, **kwargs)
+
+    return __init__
+
+
+@overload
+def slotted_dataclass(cls: type[_T]) -> type[_T]: ...
+
+
+@overload
+def slotted_dataclass(*, frozen: bool = False) -> Callable[[type[_T]], type[_T]]: ...
+
+
+@dataclass_transform()
+def slotted_dataclass(cls: Optional[type[_T]] = None, *, frozen: bool = False) -> Any:
+    """
+    `@dataclass(slots=True)` on Python 3.10+, with an equivalent fallback for
+    Python 3.9 where the `slots` argument is not available.
+
+    Use `@slotted_dataclass(frozen=True)` for immutable, hashable instances.
+    """
+
+    def wrap(cls: type[_T]) -> type[_T]:
+        if sys.version_info >= (3, 10):
+            return dataclass(slots=True, frozen=frozen)(cls)
+
+        return _add_slots(dataclass(frozen=frozen)(cls))
+
+    if cls is None:
+        return wrap
+
+    return wrap(cls)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Protocol, Union, cast
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+JSONInput: TypeAlias = Union[str, bytes, bytearray, memoryview]
+
+
+class JSONCodec(Protocol):
+    """
+    Encodes and decodes JSON. `loads` must raise `ValueError` (or a subclass)
+    when the input is not valid JSON.
+    """
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: JSONInput) -> Any: ...
+
+
+class StdlibJSONCodec:
+    __slots__ = ()
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: JSONInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    __slots__ = ("_orjson",)
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return cast(bytes, self._orjson.dumps(obj))
+
+    def loads(self, data: JSONInput) -> Any:
+        # orjson.JSONDecodeError is a ValueError subclass
+        return self._orjson.loads(data)
+
+
+class MsgspecJSONCodec:
+    __slots__ = ("_encoder", "_decoder", "_decode_error")
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+
+_factories: dict[str, Callable[[], JSONCodec]] = {
+    "json": StdlibJSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecJSONCodec,
+}
+_codec: JSONCodec = StdlibJSONCodec()
+
+
+def register_json_codec(name: str, factory: Callable[[], JSONCodec]) -> None:
+    """Make a codec available to `set_json_codec` under `name`."""
+    _factories[name] = factory
+
+
+def set_json_codec(codec: Union[str, JSONCodec]) -> None:
+    """
+    Set the codec used for every JSON operation in cross-web, either by name
+    ("json", "orjson", "msgspec" or a registered name) or as an instance.
+    """
+    global _codec
+
+    if isinstance(codec, str):
+        try:
+            factory = _factories[codec]
+        except KeyError:
+            raise ValueError(f"Unknown JSON codec: {codec!r}") from None
+
+        codec = factory()
+
+    _codec = codec
+
+
+def get_json_codec() -> JSONCodec:
+    """Return the codec currently used by cross-web."""
+    return _codec
+
+
+__all__ = [
+    "JSONCodec",
+    "MsgspecJSONCodec",
+    "OrjsonCodec",
+    "StdlibJSONCodec",
+    "get_json_codec",
+    "register_json_codec",
+    "set_json_codec",
+]
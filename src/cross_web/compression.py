@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import asyncio
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import replace
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Mapping,
+    Optional,
+    Protocol,
+    TypeVar,
+    cast,
+)
+
+from .response import Body, BodyStream, Response, StreamingResponse, _get_header
+
+if TYPE_CHECKING:
+    from .request import AsyncHTTPRequest, SyncHTTPRequest
+
+_R = TypeVar("_R", bound=Response)
+
+DEFAULT_ENCODINGS = ("br", "zstd", "gzip")
+DEFAULT_LEVELS = {"br": 4, "zstd": 3, "gzip": 6}
+
+
+class _StreamEncoder(Protocol):
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress `chunk` and return everything needed to decode it."""
+
+    def finish(self) -> bytes: ...
+
+
+class _Encoder(Protocol):
+    def compress(self, data: Any) -> bytes: ...
+
+    def stream(self) -> _StreamEncoder: ...
+
+
+class _GzipEncoder:
+    __slots__ = ("level",)
+
+    def __init__(self, level: int) -> None:
+        self.level = level
+
+    def _compressobj(self) -> Any:
+        # wbits 16 + MAX_WBITS writes a gzip header and trailer
+        return zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: Any) -> bytes:
+        # zlib is much faster than the pure Python `gzip.compress()`
+        compressor = self._compressobj()
+        return cast(bytes, compressor.compress(data) + compressor.flush())
+
+    def stream(self) -> _StreamEncoder:
+        return _GzipStreamEncoder(self._compressobj())
+
+
+class _GzipStreamEncoder:
+    __slots__ = ("_compressor",)
+
+    def __init__(self, compressor: Any) -> None:
+        self._compressor = compressor
+
+    def compress(self, chunk: bytes) -> bytes:
+        # A sync flush emits the chunk now, like the uncompressed stream would
+        compressed = self._compressor.compress(chunk)
+        return cast(bytes, compressed + self._compressor.flush(zlib.Z_SYNC_FLUSH))
+
+    def finish(self) -> bytes:
+        return cast(bytes, self._compressor.flush())
+
+
+class _BrotliEncoder:
+    __slots__ = ("_brotli", "level")
+
+    def __init__(self, level: int) -> None:
+        import brotli
+
+        self._brotli = brotli
+        self.level = level
+
+    def compress(self, data: Any) -> bytes:
+        return cast(bytes, self._brotli.compress(data, quality=self.level))
+
+    def stream(self) -> _StreamEncoder:
+        return _BrotliStreamEncoder(self._brotli.Compressor(quality=self.level))
+
+
+class _BrotliStreamEncoder:
+    __slots__ = ("_compressor",)
+
+    def __init__(self, compressor: Any) -> None:
+        self._compressor = compressor
+
+    def compress(self, chunk: bytes) -> bytes:
+        compressed = self._compressor.process(chunk)
+        return cast(bytes, compressed + self._compressor.flush())
+
+    def finish(self) -> bytes:
+        return cast(bytes, self._compressor.finish())
+
+
+class _ZstdEncoder:
+    __slots__ = ("_zstandard", "_compressor")
+
+    def __init__(self, level: int) -> None:
+        import zstandard
+
+        self._zstandard = zstandard
+        self._compressor = zstandard.ZstdCompressor(level=level)
+
+    def compress(self, data: Any) -> bytes:
+        return cast(bytes, self._compressor.compress(data))
+
+    def stream(self) -> _StreamEncoder:
+        return _ZstdStreamEncoder(
+            self._compressor.compressobj(), self._zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+
+class _ZstdStreamEncoder:
+    __slots__ = ("_compressor", "_flush_block")
+
+    def __init__(self, compressor: Any, flush_block: int) -> None:
+        self._compressor = compressor
+        self._flush_block = flush_block
+
+    def compress(self, chunk: bytes) -> bytes:
+        compressed = self._compressor.compress(chunk)
+        return cast(bytes, compressed + self._compressor.flush(self._flush_block))
+
+    def finish(self) -> bytes:
+        return cast(bytes, self._compressor.flush())
+
+
+_ENCODERS: dict[str, Callable[[int], _Encoder]] = {
+    "br": _BrotliEncoder,
+    "gzip": _GzipEncoder,
+    "zstd": _ZstdEncoder,
+}
+
+
+class Compression:
+    """
+    A response compression policy, shared by every framework. Picks the best
+    encoding from the request's `Accept-Encoding` header and compresses the
+    response body, or each chunk of a `StreamingResponse`.
+
+    `encodings` lists the encodings to offer in order of preference, the ones
+    whose library is not installed (`brotli` for "br", `zstandard` for
+    "zstd") are skipped. Bodies smaller than `minimum_size` bytes are sent
+    as is, and bodies or chunks of at least `thread_threshold` bytes are
+    compressed in a worker thread by `compress()`.
+    """
+
+    __slots__ = ("minimum_size", "thread_threshold", "_encoders")
+
+    def __init__(
+        self,
+        *,
+        encodings: Iterable[str] = DEFAULT_ENCODINGS,
+        levels: Optional[Mapping[str, int]] = None,
+        minimum_size: int = 500,
+        thread_threshold: int = 256 * 1024,
+    ) -> None:
+        levels = {**DEFAULT_LEVELS, **(levels or {})}
+
+        self.minimum_size = minimum_size
+        self.thread_threshold = thread_threshold
+        self._encoders: dict[str, _Encoder] = {}
+
+        for encoding in encodings:
+            try:
+                factory = _ENCODERS[encoding]
+            except KeyError:
+                raise ValueError(f"Unsupported encoding: {encoding!r}") from None
+
+            try:
+                self._encoders[encoding] = factory(levels[encoding])
+            except ImportError:
+                continue
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        """The available encodings, in order of preference."""
+        return tuple(self._encoders)
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """Return the encoding to use for an `Accept-Encoding` value, if any."""
+        if not accept_encoding:
+            return None
+
+        return _negotiate(accept_encoding, self.encodings)
+
+    async def compress(self, request: AsyncHTTPRequest, response: _R) -> _R:
+        """
+        Return a compressed copy of `response`, or `response` itself when it
+        should not be compressed.
+        """
+        encoding = self._select(request.headers.get("accept-encoding"), response)
+
+        if encoding is None:
+            return response
+
+        encoder = self._encoders[encoding]
+
+        if isinstance(response, StreamingResponse):
+            stream = self._compress_stream(encoder, response.stream, offload=True)
+            return _with_encoding(response, encoding, stream=stream)
+
+        data = _body_bytes(response.body)
+
+        if (response.content_length or 0) >= self.thread_threshold:
+            # Keep the event loop responsive while compressing large bodies
+            compressed = await asyncio.to_thread(encoder.compress, data)
+        else:
+            compressed = encoder.compress(data)
+
+        return _with_encoding(response, encoding, body=compressed)
+
+    def compress_sync(self, request: SyncHTTPRequest, response: _R) -> _R:
+        """Like `compress()`, for sync views. Always compresses inline."""
+        encoding = self._select(request.headers.get("accept-encoding"), response)
+
+        if encoding is None:
+            return response
+
+        encoder = self._encoders[encoding]
+
+        if isinstance(response, StreamingResponse):
+            stream: BodyStream
+            if isinstance(response.stream, AsyncIterable):
+                stream = self._compress_stream(encoder, response.stream, offload=False)
+            else:
+                stream = _compress_sync_stream(encoder, response.stream)
+
+            return _with_encoding(response, encoding, stream=stream)
+
+        compressed = encoder.compress(_body_bytes(response.body))
+
+        return _with_encoding(response, encoding, body=compressed)
+
+    def _select(
+        self, accept_encoding: Optional[str], response: Response
+    ) -> Optional[str]:
+        if response.status_code < 200 or response.status_code in (204, 304):
+            return None
+
+        if response.headers is not None and _get_header(
+            response.headers, "content-encoding"
+        ):
+            return None
+
+        if not isinstance(response, StreamingResponse) and (
+            response.content_length is None
+            or response.content_length < self.minimum_size
+        ):
+            return None
+
+        return self.negotiate(accept_encoding)
+
+    def _compress_stream(
+        self, encoder: _Encoder, stream: BodyStream, *, offload: bool
+    ) -> AsyncIterator[bytes]:
+        thread_threshold = self.thread_threshold
+
+        async def compressed() -> AsyncIterator[bytes]:
+            stream_encoder = encoder.stream()
+
+            if isinstance(stream, AsyncIterable):
+                chunks: Any = stream
+            else:
+                chunks = _iterate_async(stream)
+
+            async for chunk in chunks:
+                if offload and len(chunk) >= thread_threshold:
+                    data = await asyncio.to_thread(stream_encoder.compress, chunk)
+                else:
+                    data = stream_encoder.compress(chunk)
+
+                if data:
+                    yield data
+
+            yield stream_encoder.finish()
+
+        return compressed()
+
+
+def _compress_sync_stream(
+    encoder: _Encoder, stream: Iterable[bytes]
+) -> Iterator[bytes]:
+    stream_encoder = encoder.stream()
+
+    for chunk in stream:
+        if data := stream_encoder.compress(chunk):
+            yield data
+
+    yield stream_encoder.finish()
+
+
+async def _iterate_async(stream: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in stream:
+        yield chunk
+
+
+@lru_cache(maxsize=128)
+def _negotiate(accept_encoding: str, encodings: tuple[str, ...]) -> Optional[str]:
+    # Browsers send a handful of distinct values, so the parsing is cached
+    qualities: dict[str, float] = {}
+
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+
+        quality = 1.0
+        params = params.strip()
+
+        if params.startswith(("q=", "Q=")):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+
+        qualities[name] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best: Optional[str] = None
+    best_quality = 0.0
+
+    # Ties go to the server's preference, which is the order of `encodings`
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def _body_bytes(body: Body | None) -> Any:
+    if isinstance(body, str):
+        return body.encode("utf-8")
+
+    # Compressors accept any buffer, there is no need to copy binary bodies
+    return body if body is not None else b""
+
+
+def _with_encoding(response: _R, encoding: str, **changes: Any) -> _R:
+    headers: dict[str, str] = {}
+    vary: Optional[str] = None
+
+    for name, value in (response.headers or {}).items():
+        lower_name = name.lower()
+
+        # The converters compute the new length from the compressed body
+        if lower_name == "content-length":
+            continue
+
+        if lower_name == "vary":
+            vary = value
+            continue
+
+        # A strong ETag identifies the exact bytes, which compression changes
+        if lower_name == "etag" and not value.startswith("W/"):
+            value = f"W/{value}"
+
+        headers[name] = value
+
+    headers["Content-Encoding"] = encoding
+
+    if vary is None:
+        headers["Vary"] = "Accept-Encoding"
+    elif vary.strip() == "*" or "accept-encoding" in vary.lower():
+        headers["Vary"] = vary
+    else:
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+    compressed = replace(response, headers=headers, **changes)
+    json_source = response._json_source
+    body = compressed.body
+
+    # `replace()` skips init=False fields: keep `json()` working on compressed
+    # `json_response()` results, it can't decode the compressed body
+    if json_source is not None and json_source[0] is response.body and body:
+        compressed._json_source = (body, json_source[1])
+
+    return compressed
+
+
+__all__ = ["Compression"]
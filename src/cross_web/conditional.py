@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import AsyncIterable
+from dataclasses import replace
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional, Union
+
+from .response import Body, Response, StreamingResponse, _get_header
+
+if TYPE_CHECKING:
+    from .request import AsyncHTTPRequest, SyncHTTPRequest
+
+# Headers a 304 response should repeat, RFC 9110 section 15.4.5
+_NOT_MODIFIED_HEADERS = frozenset(
+    {"cache-control", "content-location", "date", "etag", "expires", "vary"}
+)
+
+
+def compute_etag(body: Body | None, *, weak: bool = False) -> str:
+    """
+    Return a quoted ETag for `body`. Binary bodies are hashed without being
+    copied.
+    """
+    if body is None:
+        body = b""
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    return _format_etag(_digest(body), weak)
+
+
+async def conditional_response(
+    request: AsyncHTTPRequest,
+    response: Response,
+    *,
+    weak: bool = False,
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """
+    Add an `ETag` to `response` and return `304 Not Modified` instead when
+    the request's `If-None-Match` or `If-Modified-Since` header matches.
+    A naive `last_modified` is taken as UTC.
+
+    An `ETag` already set on the response is used as is. A streaming body
+    without one is read to the end and hashed before anything is sent, so
+    all of its chunks are held in memory at once. Set an `ETag` on large
+    or unbounded streams to send them through unbuffered.
+    """
+    if not _is_cacheable(request.method, response):
+        return response
+
+    if isinstance(response, StreamingResponse) and not _has_etag(response):
+        if isinstance(response.stream, AsyncIterable):
+            chunks = [chunk async for chunk in response.stream]
+        else:
+            chunks = list(response.stream)
+
+        response, etag = _buffered(response, chunks, weak)
+    else:
+        etag = _response_etag(response, weak)
+
+    return _evaluate(request, response, etag, last_modified)
+
+
+def conditional_response_sync(
+    request: SyncHTTPRequest,
+    response: Response,
+    *,
+    weak: bool = False,
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """Like `conditional_response()`, for sync views."""
+    if not _is_cacheable(request.method, response):
+        return response
+
+    if isinstance(response, StreamingResponse) and not _has_etag(response):
+        if isinstance(response.stream, AsyncIterable):
+            raise TypeError("Sync views can only stream sync iterables")
+
+        response, etag = _buffered(response, list(response.stream), weak)
+    else:
+        etag = _response_etag(response, weak)
+
+    return _evaluate(request, response, etag, last_modified)
+
+
+def _digest(data: Union[bytes, bytearray, memoryview]) -> str:
+    # BLAKE2 is faster than MD5 and SHA-1 on 64-bit CPUs
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _buffered(
+    response: StreamingResponse, chunks: list[bytes], weak: bool
+) -> tuple[StreamingResponse, str]:
+    # Every chunk is kept to be sent later, but they are hashed one by one
+    # rather than joined into a second copy of the body
+    digest = hashlib.blake2b(digest_size=16)
+
+    for chunk in chunks:
+        digest.update(chunk)
+
+    return replace(response, stream=chunks), _format_etag(digest.hexdigest(), weak)
+
+
+def _format_etag(digest: str, weak: bool) -> str:
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def _is_cacheable(method: str, response: Response) -> bool:
+    return method in ("GET", "HEAD") and 200 <= response.status_code < 300
+
+
+def _has_etag(response: Response) -> bool:
+    return (
+        response.headers is not None
+        and _get_header(response.headers, "etag") is not None
+    )
+
+
+def _response_etag(response: Response, weak: bool) -> str:
+    if response.headers is not None and (etag := _get_header(response.headers, "etag")):
+        return etag
+
+    return compute_etag(response.body, weak=weak)
+
+
+def _evaluate(
+    request: Union[AsyncHTTPRequest, SyncHTTPRequest],
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime],
+) -> Response:
+    headers = {
+        name: value
+        for name, value in (response.headers or {}).items()
+        if name.lower() != "etag"
+    }
+    headers["ETag"] = etag
+
+    if last_modified is not None:
+        last_modified = _to_utc(last_modified)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    elif last_modified_header := _get_header(headers, "last-modified"):
+        last_modified = _parse_date(last_modified_header)
+
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None:
+        # If-Modified-Since is ignored when If-None-Match is sent
+        not_modified = _etag_matches(if_none_match, etag)
+    elif last_modified is not None and (
+        if_modified_since := _parse_date(request.headers.get("if-modified-since"))
+    ):
+        not_modified = last_modified.replace(microsecond=0) <= if_modified_since
+    else:
+        not_modified = False
+
+    if not not_modified:
+        return replace(response, headers=headers)
+
+    return Response(
+        status_code=304,
+        headers={
+            name: value
+            for name, value in headers.items()
+            if name.lower() in _NOT_MODIFIED_HEADERS
+        },
+        cookies=response.cookies,
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses the weak comparison, RFC 9110 section 13.1.2
+    opaque_tag = etag.removeprefix("W/")
+
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+
+    try:
+        return _to_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_utc(value: datetime) -> datetime:
+    # Naive datetimes are taken as UTC, like HTTP dates without a zone
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc)
+
+
+__all__ = ["compute_etag", "conditional_response", "conditional_response_sync"]
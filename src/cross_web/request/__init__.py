@@ -1,33 +1,49 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Mapping, Optional, Any
-
-from typing_extensions import Self
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Mapping, Optional, Any
 
 if TYPE_CHECKING:
     from starlette.requests import Request as StarletteRequest
+    from typing_extensions import Self
+
+    from ._asgi import Receive, Scope
+    from ._wsgi import WSGIEnvironment
 
 from ._base import (
+    DEFAULT_CHUNK_SIZE,
     AsyncHTTPRequestAdapter,
     FormData,
+    Headers,
     HTTPMethod,
     PathParams,
     QueryParams,
+    SyncHTTPRequestAdapter,
 )
-from ._starlette import StarletteRequestAdapter
 from ._testing import TestingRequestAdapter
 
 
 class AsyncHTTPRequest:
+    __slots__ = ("_adapter",)
+
     def __init__(self, adapter: AsyncHTTPRequestAdapter) -> None:
         self._adapter = adapter
 
     @classmethod
     def from_starlette(cls, request: StarletteRequest) -> Self:
+        # Import here to keep `import cross_web.request` free of adapter modules
+        from ._starlette import StarletteRequestAdapter
+
         adapter = StarletteRequestAdapter(request)
 
         return cls(adapter)
 
+    @classmethod
+    def from_asgi(cls, scope: Scope, receive: Receive) -> Self:
+        """Read the request straight from an ASGI `scope` and `receive` pair."""
+        from ._asgi import ASGIRequestAdapter
+
+        return cls(ASGIRequestAdapter(scope, receive))
+
     @classmethod
     def from_fastapi(cls, request: StarletteRequest) -> Self:
         return cls.from_starlette(request)
@@ -104,8 +120,8 @@ class AsyncHTTPRequest:
         return self._adapter.path_params
 
     @property
-    def headers(self) -> Mapping[str, str]:
-        """The request headers (case-insensitive keys recommended)."""
+    def headers(self) -> Headers:
+        """The request headers, with case-insensitive names."""
         return self._adapter.headers
 
     @property
@@ -127,8 +143,114 @@ class AsyncHTTPRequest:
         """Return the raw request body as bytes."""
         return await self._adapter.get_body()
 
+    async def get_json(self) -> Any:
+        """Return the request body decoded as JSON, cached per request."""
+        return await self._adapter.get_json()
+
+    def stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Iterate over the request body in chunks of at most `chunk_size` bytes."""
+        return self._adapter.stream(chunk_size)
+
     async def get_form_data(self) -> FormData:
         """
         Return parsed form data (multipart/form-data or application/x-www-form-urlencoded).
         """
         return await self._adapter.get_form_data()
+
+
+class SyncHTTPRequest:
+    """The synchronous counterpart of `AsyncHTTPRequest`."""
+
+    __slots__ = ("_adapter",)
+
+    def __init__(self, adapter: SyncHTTPRequestAdapter) -> None:
+        self._adapter = adapter
+
+    @classmethod
+    def from_wsgi(cls, environ: WSGIEnvironment) -> Self:
+        """Read the request straight from a WSGI `environ`."""
+        from ._wsgi import WSGIRequestAdapter
+
+        return cls(WSGIRequestAdapter(environ))
+
+    @classmethod
+    def from_django(cls, request: Any) -> Self:
+        # Import here to avoid circular imports and optional Django dependency
+        from ._django import DjangoHTTPRequestAdapter
+
+        adapter = DjangoHTTPRequestAdapter(request)
+        return cls(adapter)
+
+    @classmethod
+    def from_flask(cls, request: Any) -> Self:
+        # Import here to avoid circular imports and optional Flask dependency
+        from ._flask import FlaskHTTPRequestAdapter
+
+        adapter = FlaskHTTPRequestAdapter(request)
+        return cls(adapter)
+
+    @classmethod
+    def from_chalice(cls, request: Any) -> Self:
+        # Import here to avoid circular imports and optional Chalice dependency
+        from ._chalice import ChaliceHTTPRequestAdapter
+
+        adapter = ChaliceHTTPRequestAdapter(request)
+        return cls(adapter)
+
+    @property
+    def method(self) -> HTTPMethod:
+        """The HTTP method of the request."""
+        return self._adapter.method
+
+    @property
+    def query_params(self) -> QueryParams:
+        """The query parameters of the request."""
+        return self._adapter.query_params
+
+    @property
+    def path_params(self) -> PathParams:
+        """The path parameters of the request."""
+        return self._adapter.path_params
+
+    @property
+    def headers(self) -> Headers:
+        """The request headers, with case-insensitive names."""
+        return self._adapter.headers
+
+    @property
+    def content_type(self) -> Optional[str]:
+        """The 'Content-Type' header value, if present."""
+        return self._adapter.content_type
+
+    @property
+    def url(self) -> str:
+        """The URL of the request."""
+        return self._adapter.url
+
+    @property
+    def cookies(self) -> Mapping[str, str]:
+        """The request cookies."""
+        return self._adapter.cookies
+
+    def get_body(self) -> bytes:
+        """Return the raw request body as bytes."""
+        body = self._adapter.body
+
+        if isinstance(body, str):
+            return body.encode("utf-8")
+
+        return body
+
+    def get_json(self) -> Any:
+        """Return the request body decoded as JSON, cached per request."""
+        return self._adapter.get_json()
+
+    def stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the request body in chunks of at most `chunk_size` bytes."""
+        return self._adapter.stream(chunk_size)
+
+    def get_form_data(self) -> FormData:
+        """
+        Return parsed form data (multipart/form-data or application/x-www-form-urlencoded).
+        """
+        return self._adapter.get_form_data()
@@ -1,115 +1,273 @@
 from __future__ import annotations
 
-from io import BytesIO
-from typing import TYPE_CHECKING, Any, Mapping, Optional, cast
+from tempfile import SpooledTemporaryFile
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Mapping, Optional, cast
 
-from ._base import AsyncHTTPRequestAdapter, FormData, HTTPMethod, QueryParams
+from .._compat import slotted_dataclass
+from ..exceptions import HTTPException
+from ._base import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncHTTPRequestAdapter,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    iter_chunks,
+    memoized_property,
+)
 
 if TYPE_CHECKING:
-    from aiohttp import web
+    from aiohttp import StreamReader, web
+    from aiohttp.multipart import BodyPartReader
+
+
+@slotted_dataclass
+class MultipartLimits:
+    """
+    Limits applied while reading `multipart/form-data` bodies.
+
+    Uploaded files are written in chunks to a `SpooledTemporaryFile`, which
+    stays in memory up to `spool_max_size` bytes and is moved to disk after
+    that. The files belong to the caller, who can close them once the
+    request is handled, otherwise they are deleted when garbage collected.
+    `max_part_size` and `max_size` (in bytes, `None` for no limit) are
+    checked as the body is read, raising `HTTPException(413)` as soon as
+    they are exceeded.
+    """
+
+    spool_max_size: int = 1024 * 1024
+    max_part_size: Optional[int] = None
+    max_size: Optional[int] = None
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(413, "Request body too large")
+
+
+def _check_content_length(request: web.Request, limits: MultipartLimits) -> None:
+    if limits.max_size is not None and (request.content_length or 0) > limits.max_size:
+        raise _too_large()
+
+
+async def _read_multipart(
+    request: web.Request, limits: MultipartLimits, body: Optional[bytes] = None
+) -> FormData:
+    """
+    Parse a multipart body incrementally, from the request payload or from
+    `body` when it was already read.
+    """
+    from aiohttp.multipart import BodyPartReader, MultipartReader
+
+    _check_content_length(request, limits)
+
+    if body is None:
+        reader = await request.multipart()
+    else:
+        reader = MultipartReader(request.headers, _memory_stream(request, body))
+
+    data: dict[str, Any] = {}
+    files: dict[str, Any] = {}
+    total = 0
+
+    try:
+        while field := await reader.next():
+            assert isinstance(field, BodyPartReader)
+            assert field.name
+
+            if field.filename:
+                # A repeated field name keeps the last file, like other fields
+                if replaced := files.pop(field.name, None):
+                    replaced.close()
+
+                file = SpooledTemporaryFile(max_size=limits.spool_max_size)
+                files[field.name] = file
+                total = await _read_part(field, file, total, limits)
+                file.seek(0)
+            else:
+                buffer = bytearray()
+                total = await _read_part(field, buffer, total, limits)
+                data[field.name] = field.decode(bytes(buffer)).decode(
+                    field.get_charset(default="utf-8")
+                )
+    except BaseException:
+        for file in files.values():
+            file.close()
+        raise
+
+    return FormData(files=files, form=data)
+
+
+def _memory_stream(request: web.Request, body: bytes) -> StreamReader:
+    from asyncio import get_running_loop
+
+    from aiohttp import StreamReader
+
+    # Only public API: the stream shares the request's protocol, and its limit
+    # keeps the buffered body below the mark that would pause the connection
+    stream = StreamReader(
+        request.protocol,
+        limit=max(len(body), DEFAULT_CHUNK_SIZE),
+        loop=get_running_loop(),
+    )
+    stream.feed_data(body)
+    stream.feed_eof()
+
+    return stream
+
+
+async def _read_part(
+    field: BodyPartReader,
+    target: IO[bytes] | bytearray,
+    total: int,
+    limits: MultipartLimits,
+) -> int:
+    """Copy a part into `target` chunk by chunk, returning the new total size."""
+    size = 0
+
+    while chunk := await field.read_chunk(limits.chunk_size):
+        size += len(chunk)
+        total += len(chunk)
+
+        if limits.max_part_size is not None and size > limits.max_part_size:
+            raise _too_large()
+        if limits.max_size is not None and total > limits.max_size:
+            raise _too_large()
+
+        if isinstance(target, bytearray):
+            target += chunk
+        else:
+            target.write(chunk)
+
+    return total
 
 
 class AiohttpHTTPRequestAdapter(AsyncHTTPRequestAdapter):
+    __slots__ = (
+        "request",
+        "_body",
+        "_form_data",
+        "_multipart_limits",
+        "_retain_body",
+    )
+
     def __init__(
         self,
         request: web.Request,
         body: Optional[bytes] = None,
         form_data: Optional[FormData] = None,
+        *,
+        multipart_limits: Optional[MultipartLimits] = None,
+        retain_body: bool = False,
     ) -> None:
         self.request = request
         self._body = body
         self._form_data = form_data
+        self._multipart_limits = multipart_limits or MultipartLimits()
+        self._retain_body = retain_body
 
     @classmethod
-    async def create(cls, request: web.Request) -> "AiohttpHTTPRequestAdapter":
-        """Create an adapter and pre-read the body to avoid PayloadAccessError"""
-        content_type = request.headers.get("content-type", "")
-        form_data = None
-        body = None
-
-        if content_type.startswith("multipart/form-data"):
-            # Pre-process multipart data
-            reader = await request.multipart()
-            data: dict[str, Any] = {}
-            files: dict[str, Any] = {}
-
-            while field := await reader.next():
-                from aiohttp.multipart import BodyPartReader
+    async def create(
+        cls,
+        request: web.Request,
+        *,
+        read_body: bool = True,
+        multipart_limits: Optional[MultipartLimits] = None,
+        retain_body: bool = False,
+    ) -> "AiohttpHTTPRequestAdapter":
+        """Create an adapter and pre-read the body to avoid PayloadAccessError
 
-                assert isinstance(field, BodyPartReader)
-                assert field.name
+        Pass `read_body=False` to leave non-multipart bodies unread, so they
+        can be consumed incrementally with `stream()`.
 
-                if field.filename:
-                    files[field.name] = BytesIO(await field.read(decode=False))
-                else:
-                    data[field.name] = await field.text()
+        Multipart bodies are parsed without keeping the raw body, so
+        `get_body()` returns `b""` for them. Pass `retain_body=True` when the
+        raw body is needed as well, for example to verify a signature.
+        """
+        adapter = cls(
+            request, multipart_limits=multipart_limits, retain_body=retain_body
+        )
 
-            form_data = FormData(files=files, form=data)
-        else:
+        if adapter._is_multipart:
+            # Pre-process multipart data
+            await adapter.get_form_data()
+        elif read_body:
             # For non-multipart requests, read the body
-            body = await request.read()
+            await adapter.get_body()
 
-        return cls(request, body, form_data)
+        return adapter
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return cast(QueryParams, self.request.query.copy())  # type: ignore[attr-defined]
+        return QueryParams(self.request.query)
 
-    @property
+    @memoized_property
     def path_params(self) -> Mapping[str, Any]:
         return cast(Mapping[str, Any], dict(self.request.match_info))
 
     async def get_body(self) -> bytes:
-        if self._form_data is not None:
-            return b""
         if self._body is None:
+            if self._form_data is not None:
+                # The payload was consumed while parsing the multipart body
+                return b""
             self._body = await self.request.read()
         return self._body
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        if self._body is not None or self._form_data is not None:
+            for chunk in iter_chunks(await self.get_body(), chunk_size):
+                yield chunk
+            return
+
+        async for chunk in self.request.content.iter_chunked(chunk_size):
+            yield chunk
+
     @property
     def method(self) -> HTTPMethod:
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return self.request.headers
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers(self.request.headers)
 
     async def get_form_data(self) -> FormData:
-        if self._form_data is not None:
-            return self._form_data
+        if self._form_data is None:
+            self._form_data = await self._parse_form_data()
 
-        if self.content_type and self.content_type.startswith("multipart/form-data"):
-            # Process multipart data
-            reader = await self.request.multipart()
-            data: dict[str, Any] = {}
-            files: dict[str, Any] = {}
+        return self._form_data
 
-            while field := await reader.next():
-                from aiohttp.multipart import BodyPartReader
+    async def _parse_form_data(self) -> FormData:
+        if self._is_multipart:
+            if self._retain_body and self._body is None:
+                _check_content_length(self.request, self._multipart_limits)
+                self._body = await self.request.read()
 
-                assert isinstance(field, BodyPartReader)
-                assert field.name
+            # Parses from memory if the body was already read
+            return await _read_multipart(
+                self.request, self._multipart_limits, self._body
+            )
 
-                if field.filename:
-                    files[field.name] = BytesIO(await field.read(decode=False))
-                else:
-                    data[field.name] = await field.text()
+        # For URL-encoded form data, aiohttp keeps the body it read so
+        # get_body() can still return it afterwards
+        post_data = await self.request.post()
+        self._body = await self.request.read()
 
-            self._form_data = FormData(files=files, form=data)
-            return self._form_data
-        else:
-            # For URL-encoded form data
-            post_data = await self.request.post()
-            return FormData(files={}, form=dict(post_data))
+        return FormData(files={}, form=dict(post_data))
 
     @property
+    def _is_multipart(self) -> bool:
+        return (self.content_type or "").startswith("multipart/form-data")
+
+    @memoized_property
     def content_type(self) -> Optional[str]:
         return self.headers.get("content-type")
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return str(self.request.url)
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return self.request.cookies
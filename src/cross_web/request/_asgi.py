@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, MutableMapping
+from typing import Any, AsyncIterator, Callable, Mapping, Optional, cast
+from urllib.parse import parse_qsl
+
+from ..exceptions import HTTPException
+from ._base import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncHTTPRequestAdapter,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    iter_chunks,
+    memoized_property,
+    parse_cookie_header,
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+
+_DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443}
+
+
+class ASGIRequestAdapter(AsyncHTTPRequestAdapter):
+    """
+    Reads the request straight from an ASGI `scope` and `receive` callable,
+    without building a framework `Request` first. Every property is decoded
+    from the raw scope on first access.
+    """
+
+    __slots__ = ("scope", "receive", "_body", "_stream_consumed")
+
+    def __init__(self, scope: Scope, receive: Receive) -> None:
+        self.scope = scope
+        self.receive = receive
+        self._body: Optional[bytes] = None
+        self._stream_consumed = False
+
+    @property
+    def method(self) -> HTTPMethod:
+        return cast(HTTPMethod, self.scope["method"])
+
+    @memoized_property
+    def query_params(self) -> QueryParams:
+        return QueryParams.from_query_string(self.scope.get("query_string", b""))
+
+    @property
+    def path_params(self) -> Mapping[str, Any]:
+        # Set by routers such as Starlette's
+        return cast(Mapping[str, Any], self.scope.get("path_params", {}))
+
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers.from_raw(self.scope["headers"])
+
+    @memoized_property
+    def content_type(self) -> Optional[str]:
+        return self.headers.get("content-type")
+
+    @memoized_property
+    def url(self) -> str:
+        scheme = self.scope.get("scheme", "http")
+        # Servers include the root path in `path`, Starlette reads it the same way
+        path = self.scope["path"]
+        host = self.headers.get("host")
+
+        if host is not None:
+            url = f"{scheme}://{host}{path}"
+        elif (server := self.scope.get("server")) is None:
+            url = path
+        else:
+            host, port = server
+            if port == _DEFAULT_PORTS.get(scheme):
+                url = f"{scheme}://{host}{path}"
+            else:
+                url = f"{scheme}://{host}:{port}{path}"
+
+        if query_string := self.scope.get("query_string"):
+            url += "?" + query_string.decode("latin-1")
+
+        return url
+
+    @memoized_property
+    def cookies(self) -> Mapping[str, str]:
+        return parse_cookie_header(self.headers.get("cookie"))
+
+    async def get_body(self) -> bytes:
+        if self._body is None:
+            self._body = b"".join([chunk async for chunk in self.stream()])
+
+        return self._body
+
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        if self._body is not None:
+            for chunk in iter_chunks(self._body, chunk_size):
+                yield chunk
+            return
+
+        if self._stream_consumed:
+            raise RuntimeError("The request body has already been consumed")
+
+        self._stream_consumed = True
+
+        while True:
+            message = await self.receive()
+
+            if message["type"] == "http.disconnect":
+                raise HTTPException(400, "Client disconnected")
+
+            # Chunks are yielded as sent by the server, like Starlette does
+            if chunk := message.get("body", b""):
+                yield chunk
+
+            if not message.get("more_body", False):
+                break
+
+    async def get_form_data(self) -> FormData:
+        content_type = self.content_type or ""
+
+        if content_type.startswith("multipart/form-data"):
+            # python-multipart is only needed for multipart bodies
+            from starlette.datastructures import Headers as StarletteHeaders
+            from starlette.formparsers import MultiPartParser
+
+            parser = MultiPartParser(
+                StarletteHeaders(raw=self.scope["headers"]),
+                cast("AsyncGenerator[bytes, None]", self.stream()),
+            )
+            multipart_data = await parser.parse()
+
+            return FormData(files=multipart_data, form=multipart_data)
+
+        # Other bodies, such as JSON, aren't form data and are left unread
+        if not content_type.startswith("application/x-www-form-urlencoded"):
+            return FormData(files={}, form={})
+
+        body = await self.get_body()
+        form = dict(parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True))
+
+        return FormData(files={}, form=form)
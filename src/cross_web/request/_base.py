@@ -1,17 +1,318 @@
+from __future__ import annotations
+
 import abc
-from collections.abc import Mapping
-from dataclasses import dataclass
-from typing import Any, Literal, Optional, Union
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from urllib.parse import parse_qsl
+
+from .._compat import slotted_dataclass
+from ..codecs import get_json_codec
+from ..exceptions import HTTPException
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 HTTPMethod = Literal[
     "GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "TRACE"
 ]
 
-QueryParams = Mapping[str, Optional[str]]
 PathParams = Mapping[str, Any]
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_T = TypeVar("_T")
+_MISSING: Any = object()
+
+
+def iter_chunks(body: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Split an already buffered body into chunks of at most `chunk_size` bytes.
+
+    A body that fits in one chunk is yielded as is. Larger bodies are sliced
+    through a `memoryview` and each slice is copied into its own `bytes`
+    object, since `stream()` yields `bytes`, so one chunk is copied at a time
+    rather than the whole body at once.
+    """
+    if len(body) <= chunk_size:
+        if body:
+            yield body
+        return
+
+    view = memoryview(body)
+
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size].tobytes()
+
+
+class _MultiValueDict(dict[str, list[str]]):
+    # Maps each name to its values, indexing returns the last one (like
+    # Starlette and Django) and `getlist` returns all of them.
+    def get(self, key: str, default: Any = None) -> Any:
+        values = super().get(key)
+        return values[-1] if values else default
+
+    def getlist(self, key: str) -> list[str]:
+        return list(super().get(key, ()))
+
+
+class QueryParams(Mapping[str, Optional[str]]):
+    """
+    Immutable, multi-value view over a framework's query parameters.
+
+    Wraps the native object (a multidict, `QueryDict`, plain dict, ...)
+    without copying it. Indexing returns a single value, as the framework
+    does, and `getlist()` returns every value for a key.
+    """
+
+    __slots__ = ("_params", "_keys")
+
+    def __init__(self, params: Optional[Mapping[str, Any]] = None) -> None:
+        self._params: Mapping[str, Any] = {} if params is None else params
+        self._keys: Optional[dict[str, None]] = None
+
+    @classmethod
+    def from_query_string(cls, query_string: Union[str, bytes]) -> Self:
+        """Parse a raw query string, such as ASGI `scope["query_string"]`."""
+        if isinstance(query_string, bytes):
+            query_string = query_string.decode("latin-1")
+
+        if "%" in query_string or "+" in query_string:
+            pairs = parse_qsl(query_string, keep_blank_values=True)
+        else:
+            # Nothing to unquote, splitting is much cheaper than parse_qsl
+            pairs = [
+                (key, value)
+                for key, _, value in (
+                    pair.partition("=") for pair in query_string.split("&") if pair
+                )
+            ]
+
+        params = _MultiValueDict()
+
+        for key, value in pairs:
+            params.setdefault(key, []).append(value)
+
+        return cls(params)
+
+    def __getitem__(self, key: str) -> Optional[str]:
+        # `get` rather than indexing, as some frameworks (Sanic) store lists
+        # and only return a single value from `get`
+        value = self._params.get(key, _MISSING)
+
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value  # type: ignore[no-any-return]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._params.get(key, _MISSING)
+
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._params
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._unique_keys())
+
+    def __len__(self) -> int:
+        return len(self._unique_keys())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.multi_items()!r})"
+
+    def getlist(self, key: str) -> list[str]:
+        """Return every value for `key`, or an empty list if it is missing."""
+        params = self._params
+
+        if getall := getattr(params, "getall", None):
+            return list(getall(key, []))
+
+        if getlist := getattr(params, "getlist", None):
+            try:
+                return list(getlist(key))
+            except KeyError:
+                return []
+
+        if key in params:
+            return [params[key]]
+
+        return []
+
+    def multi_items(self) -> list[tuple[str, str]]:
+        """Return every `(key, value)` pair, including repeated keys."""
+        return [(key, value) for key in self for value in self.getlist(key)]
+
+    def _unique_keys(self) -> dict[str, None]:
+        # Multidicts yield a key once per value, deduplicate on first use
+        if self._keys is None:
+            self._keys = dict.fromkeys(self._params)
+
+        return self._keys
+
+
+def parse_cookie_header(cookie_header: Optional[str]) -> dict[str, str]:
+    """Parse a `Cookie` request header into a dict of names to values."""
+    cookies: dict[str, str] = {}
+
+    if not cookie_header:
+        return cookies
+
+    for chunk in cookie_header.split(";"):
+        name, separator, value = chunk.partition("=")
+
+        if not separator:
+            continue
+
+        value = value.strip()
+
+        if len(value) > 1 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+
+        cookies[name.strip()] = value
+
+    return cookies
+
+
+RawHeaders = Iterable[tuple[bytes, bytes]]
+HeaderItems = Iterable[tuple[str, str]]
+
+
+def _decode_items(source: Any) -> list[tuple[str, str]]:
+    items = source.items() if isinstance(source, Mapping) else source
+
+    return [(name.lower(), value) for name, value in items]
+
+
+def _decode_raw(source: RawHeaders) -> list[tuple[str, str]]:
+    return [
+        (name.decode("latin-1").lower(), value.decode("latin-1"))
+        for name, value in source
+    ]
+
+
+def _decode_wsgi(environ: Mapping[str, Any]) -> list[tuple[str, str]]:
+    items = [
+        (key[5:].replace("_", "-").lower(), value)
+        for key, value in environ.items()
+        if key.startswith("HTTP_")
+    ]
+
+    # The only headers without the HTTP_ prefix
+    if content_type := environ.get("CONTENT_TYPE"):
+        items.append(("content-type", content_type))
+    if content_length := environ.get("CONTENT_LENGTH"):
+        items.append(("content-length", content_length))
+
+    return items
+
 
-@dataclass
+class Headers(Mapping[str, str]):
+    """
+    Immutable, case-insensitive view over request headers.
+
+    The source (a mapping, ASGI header pairs or a WSGI environ) is only
+    decoded on first access. Names are lowercased once, so lookups are a
+    single dict access. When a header is repeated, indexing returns the first
+    value and `getlist()` returns all of them.
+    """
+
+    __slots__ = ("_source", "_decode", "_items", "_lookup")
+
+    def __init__(
+        self, headers: Union[Mapping[str, str], HeaderItems, None] = None
+    ) -> None:
+        self._source: Any = {} if headers is None else headers
+        self._decode: Callable[[Any], list[tuple[str, str]]] = _decode_items
+        self._items: Optional[list[tuple[str, str]]] = None
+        self._lookup: Optional[dict[str, str]] = None
+
+    @classmethod
+    def from_raw(cls, raw: RawHeaders) -> Self:
+        """Build from `(name, value)` byte pairs, such as ASGI `scope["headers"]`."""
+        headers = cls(raw)  # type: ignore[arg-type]
+        headers._decode = _decode_raw
+        return headers
+
+    @classmethod
+    def from_wsgi(cls, environ: Mapping[str, Any]) -> Self:
+        """Build from the `HTTP_*` and `CONTENT_*` keys of a WSGI environ."""
+        headers = cls(environ)
+        headers._decode = _decode_wsgi
+        return headers
+
+    def __getitem__(self, key: str) -> str:
+        return self._get_lookup()[key.lower()]
+
+    @overload
+    def get(self, key: str) -> Optional[str]: ...
+
+    @overload
+    def get(self, key: str, default: Union[str, _T]) -> Union[str, _T]: ...
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._get_lookup().get(key.lower(), default)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.lower() in self._get_lookup()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_lookup())
+
+    def __len__(self) -> int:
+        return len(self._get_lookup())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Headers):
+            return self._get_lookup() == other._get_lookup()
+        if isinstance(other, Mapping):
+            return self._get_lookup() == {
+                name.lower(): value for name, value in other.items()
+            }
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.multi_items()!r})"
+
+    def getlist(self, key: str) -> list[str]:
+        """Return every value for `key`, or an empty list if it is missing."""
+        key = key.lower()
+        return [value for name, value in self.multi_items() if name == key]
+
+    def multi_items(self) -> list[tuple[str, str]]:
+        """Return every `(name, value)` pair, with lowercased names."""
+        if self._items is None:
+            self._items = self._decode(self._source)
+
+        return self._items
+
+    def _get_lookup(self) -> dict[str, str]:
+        if self._lookup is None:
+            items = self.multi_items()
+            lookup = dict(items)
+
+            if len(lookup) != len(items):
+                # Repeated headers, keep the first value instead of the last
+                lookup = {}
+                for name, value in items:
+                    lookup.setdefault(name, value)
+
+            self._lookup = lookup
+
+        return self._lookup
+
+
+@slotted_dataclass
 class FormData:
     files: Mapping[str, Any]
     form: Mapping[str, Any]
@@ -20,12 +321,61 @@ class FormData:
         return self.form.get(key)
 
 
-class SyncHTTPRequestAdapter(abc.ABC):
+class memoized_property(Generic[_T]):
+    """
+    Like `functools.cached_property`, but the value is stored in the `_cache`
+    dict provided by `MemoizedMixin` so it also works on classes using
+    `__slots__`. The getter runs at most once per instance.
+    """
+
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: MemoizedMixin, owner: Optional[type] = None) -> _T: ...
+
+    def __get__(
+        self, instance: Optional[MemoizedMixin], owner: Optional[type] = None
+    ) -> Union[Self, _T]:
+        if instance is None:
+            return self
+
+        try:
+            cache = instance._cache
+        except AttributeError:
+            cache = instance._cache = {}
+
+        try:
+            return cache[self.name]  # type: ignore[no-any-return]
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value
+
+
+class MemoizedMixin:
+    """Provides the per-instance storage used by `memoized_property`."""
+
+    __slots__ = ("_cache",)
+
+    _cache: dict[str, Any]
+
+
+class SyncHTTPRequestAdapter(MemoizedMixin, abc.ABC):
     """
     Abstract Base Class defining the interface for accessing HTTP request data
     in a framework-agnostic way for synchronous operations.
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def method(self) -> HTTPMethod:
@@ -46,9 +396,8 @@ class SyncHTTPRequestAdapter(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def headers(self) -> Mapping[str, str]:
-        """The request headers. Header names should ideally be case-insensitive."""
-        # Note: Real implementations might need to handle case-insensitivity
+    def headers(self) -> Headers:
+        """The request headers, with case-insensitive names."""
         raise NotImplementedError
 
     @property
@@ -63,6 +412,42 @@ class SyncHTTPRequestAdapter(abc.ABC):
         """Return the raw request body as bytes or string."""
         raise NotImplementedError
 
+    def stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the request body in chunks of at most `chunk_size` bytes.
+
+        The default implementation slices the buffered `body`.
+        """
+        body = self.body
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        return iter_chunks(body, chunk_size)
+
+    def get_json(self) -> Any:
+        """
+        Return the body decoded as JSON with the configured codec, see
+        `cross_web.codecs.set_json_codec`. The result is cached, so calling
+        this again returns the same object.
+
+        Raises `HTTPException` with a 400 status when the body is not valid JSON.
+        """
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = {}
+
+        if "get_json" not in cache:
+            try:
+                cache["get_json"] = get_json_codec().loads(self.body)
+            except ValueError as exc:
+                raise HTTPException(
+                    400, "Unable to parse request body as JSON"
+                ) from exc
+
+        return cache["get_json"]
+
     @property
     @abc.abstractmethod
     def post_data(self) -> Mapping[str, Union[str, bytes]]:
@@ -97,12 +482,14 @@ class SyncHTTPRequestAdapter(abc.ABC):
         raise NotImplementedError
 
 
-class AsyncHTTPRequestAdapter(abc.ABC):
+class AsyncHTTPRequestAdapter(MemoizedMixin, abc.ABC):
     """
     Abstract Base Class defining the interface for accessing HTTP request data
     in a framework-agnostic way.
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def method(self) -> HTTPMethod:
@@ -123,9 +510,8 @@ class AsyncHTTPRequestAdapter(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def headers(self) -> Mapping[str, str]:
-        """The request headers. Header names should ideally be case-insensitive."""
-        # Note: Real implementations might need to handle case-insensitivity
+    def headers(self) -> Headers:
+        """The request headers, with case-insensitive names."""
         raise NotImplementedError
 
     @property
@@ -139,6 +525,42 @@ class AsyncHTTPRequestAdapter(abc.ABC):
         """Return the raw request body as bytes."""
         raise NotImplementedError
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Iterate over the request body in chunks, without buffering it when the
+        framework can read it incrementally. `chunk_size` is an upper bound
+        used where the framework lets us pick the chunk size.
+
+        The default implementation slices the buffered body from `get_body()`.
+        """
+        for chunk in iter_chunks(await self.get_body(), chunk_size):
+            yield chunk
+
+    async def get_json(self) -> Any:
+        """
+        Return the body decoded as JSON with the configured codec, see
+        `cross_web.codecs.set_json_codec`. The result is cached, so calling
+        this again returns the same object.
+
+        Raises `HTTPException` with a 400 status when the body is not valid JSON.
+        """
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = {}
+
+        if "get_json" not in cache:
+            try:
+                cache["get_json"] = get_json_codec().loads(await self.get_body())
+            except ValueError as exc:
+                raise HTTPException(
+                    400, "Unable to parse request body as JSON"
+                ) from exc
+
+        return cache["get_json"]
+
     @abc.abstractmethod
     async def get_form_data(self) -> FormData:
         """
@@ -2,19 +2,29 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Mapping, Optional, Union, cast
 
-from ._base import FormData, HTTPMethod, QueryParams, SyncHTTPRequestAdapter
+from ._base import (
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    SyncHTTPRequestAdapter,
+    memoized_property,
+    parse_cookie_header,
+)
 
 if TYPE_CHECKING:
     from chalice.app import Request
 
 
 class ChaliceHTTPRequestAdapter(SyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: Request) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return self.request.query_params or {}
+        return QueryParams(self.request.query_params)
 
     @property
     def path_params(self) -> Mapping[str, Any]:
@@ -28,9 +38,9 @@ class ChaliceHTTPRequestAdapter(SyncHTTPRequestAdapter):
     def method(self) -> HTTPMethod:
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return self.request.headers
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers(self.request.headers)
 
     @property
     def post_data(self) -> Mapping[str, Union[str, bytes]]:
@@ -46,11 +56,11 @@ class ChaliceHTTPRequestAdapter(SyncHTTPRequestAdapter):
         # Chalice doesn't support form data
         raise NotImplementedError("Chalice does not support form data")
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         return self.request.headers.get("Content-Type", None)
 
-    @property
+    @memoized_property
     def url(self) -> str:
         # Construct URL from context
         context = self.request.context
@@ -69,24 +79,13 @@ class ChaliceHTTPRequestAdapter(SyncHTTPRequestAdapter):
         if self.request.query_params:
             from urllib.parse import urlencode
 
-            query_string = urlencode(self.request.query_params)
+            query_string = urlencode(self.query_params.multi_items())
             url = f"{url}?{query_string}"
 
         return url
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         # Chalice doesn't have direct cookie support
         # Cookies would come in the Cookie header
-        cookie_header = self.request.headers.get("Cookie", "")
-        if not cookie_header:
-            return {}
-
-        cookies = {}
-        for cookie in cookie_header.split(";"):
-            cookie = cookie.strip()
-            if "=" in cookie:
-                name, value = cookie.split("=", 1)
-                cookies[name] = value
-
-        return cookies
+        return parse_cookie_header(self.request.headers.get("Cookie"))
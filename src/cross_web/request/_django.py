@@ -5,9 +5,11 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional, Union, cast
 from ._base import (
     AsyncHTTPRequestAdapter,
     FormData,
+    Headers,
     HTTPMethod,
     QueryParams,
     SyncHTTPRequestAdapter,
+    memoized_property,
 )
 
 if TYPE_CHECKING:
@@ -15,12 +17,14 @@ if TYPE_CHECKING:
 
 
 class DjangoHTTPRequestAdapter(SyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: HttpRequest) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return cast(QueryParams, self.request.GET.dict())
+        return QueryParams(self.request.GET)
 
     @property
     def path_params(self) -> Mapping[str, Any]:
@@ -38,9 +42,9 @@ class DjangoHTTPRequestAdapter(SyncHTTPRequestAdapter):
 
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return cast(Mapping[str, str], self.request.headers)
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers.from_wsgi(self.request.META)
 
     @property
     def post_data(self) -> Mapping[str, Union[str, bytes]]:
@@ -56,26 +60,28 @@ class DjangoHTTPRequestAdapter(SyncHTTPRequestAdapter):
             form=cast(Mapping[str, Union[str, bytes]], self.request.POST),
         )
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         return cast(Optional[str], self.request.content_type)
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return cast(str, self.request.build_absolute_uri())
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return cast(Mapping[str, str], self.request.COOKIES)
 
 
 class AsyncDjangoHTTPRequestAdapter(AsyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: HttpRequest) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return cast(QueryParams, self.request.GET.dict())
+        return QueryParams(self.request.GET)
 
     @property
     def path_params(self) -> Mapping[str, Any]:
@@ -89,13 +95,13 @@ class AsyncDjangoHTTPRequestAdapter(AsyncHTTPRequestAdapter):
 
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return cast(Mapping[str, str], self.request.headers)
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers.from_wsgi(self.request.META)
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
-        return self.headers.get("Content-type")
+        return self.headers.get("content-type")
 
     async def get_body(self) -> bytes:
         return cast(bytes, self.request.body)
@@ -106,10 +112,10 @@ class AsyncDjangoHTTPRequestAdapter(AsyncHTTPRequestAdapter):
             form=cast(Mapping[str, Union[str, bytes]], self.request.POST),
         )
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return cast(str, self.request.build_absolute_uri())
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return cast(Mapping[str, str], self.request.COOKIES)
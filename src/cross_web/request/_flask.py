@@ -5,9 +5,11 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional, Union, cast
 from ._base import (
     AsyncHTTPRequestAdapter,
     FormData,
+    Headers,
     HTTPMethod,
     QueryParams,
     SyncHTTPRequestAdapter,
+    memoized_property,
 )
 
 if TYPE_CHECKING:
@@ -15,12 +17,14 @@ if TYPE_CHECKING:
 
 
 class FlaskHTTPRequestAdapter(SyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: Request) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return self.request.args.to_dict()
+        return QueryParams(self.request.args)
 
     @property
     def path_params(self) -> Mapping[str, Any]:
@@ -34,9 +38,9 @@ class FlaskHTTPRequestAdapter(SyncHTTPRequestAdapter):
     def method(self) -> HTTPMethod:
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return self.request.headers  # type: ignore
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers.from_wsgi(self.request.environ)
 
     @property
     def post_data(self) -> Mapping[str, Union[str, bytes]]:
@@ -52,26 +56,28 @@ class FlaskHTTPRequestAdapter(SyncHTTPRequestAdapter):
             form=self.request.form,
         )
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         return self.request.content_type
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return self.request.url
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return self.request.cookies
 
 
 class AsyncFlaskHTTPRequestAdapter(AsyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: Request) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return self.request.args.to_dict()
+        return QueryParams(self.request.args)
 
     @property
     def path_params(self) -> Mapping[str, Any]:
@@ -81,13 +87,13 @@ class AsyncFlaskHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def method(self) -> HTTPMethod:
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         return self.request.content_type
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return self.request.headers  # type: ignore
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers.from_wsgi(self.request.environ)
 
     async def get_body(self) -> bytes:
         return self.request.data
@@ -98,10 +104,10 @@ class AsyncFlaskHTTPRequestAdapter(AsyncHTTPRequestAdapter):
             form=self.request.form,
         )
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return self.request.url
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return self.request.cookies
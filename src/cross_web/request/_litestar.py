@@ -1,20 +1,30 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Mapping, Optional, cast
-
-from ._base import AsyncHTTPRequestAdapter, FormData, HTTPMethod, QueryParams
+from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping, Optional, cast
+
+from ._base import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncHTTPRequestAdapter,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    memoized_property,
+)
 
 if TYPE_CHECKING:
     from litestar import Request
 
 
 class LitestarRequestAdapter(AsyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: Request[Any, Any, Any]) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return self.request.query_params
+        return QueryParams(self.request.query_params)
 
     @property
     def path_params(self) -> Mapping[str, Any]:
@@ -24,11 +34,11 @@ class LitestarRequestAdapter(AsyncHTTPRequestAdapter):
     def method(self) -> HTTPMethod:
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return self.request.headers
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers.from_raw(self.request.scope["headers"])
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         content_type, params = self.request.content_type
 
@@ -41,15 +51,23 @@ class LitestarRequestAdapter(AsyncHTTPRequestAdapter):
     async def get_body(self) -> bytes:
         return await self.request.body()
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        # Litestar yields the chunks as received from the ASGI server
+        async for chunk in self.request.stream():
+            if chunk:
+                yield chunk
+
     async def get_form_data(self) -> FormData:
         multipart_data = await self.request.form()
 
         return FormData(form=multipart_data, files=multipart_data)
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return str(self.request.url)
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return self.request.cookies
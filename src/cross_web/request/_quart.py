@@ -1,20 +1,30 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Mapping, Optional, cast
+from typing import TYPE_CHECKING, AsyncIterator, Mapping, Optional, cast
 
-from ._base import AsyncHTTPRequestAdapter, FormData, HTTPMethod, QueryParams
+from ._base import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncHTTPRequestAdapter,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    memoized_property,
+)
 
 if TYPE_CHECKING:
     from quart import Request
 
 
 class QuartHTTPRequestAdapter(AsyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: Request) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        return self.request.args.to_dict()
+        return QueryParams(self.request.args)
 
     @property
     def path_params(self) -> Mapping[str, str]:
@@ -24,26 +34,33 @@ class QuartHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def method(self) -> HTTPMethod:
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         return self.request.content_type
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return self.request.headers  # type: ignore
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers(self.request.headers)
 
     async def get_body(self) -> bytes:
         return await self.request.data
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        # Iterating Quart's body yields the data received so far
+        async for chunk in self.request.body:
+            yield chunk
+
     async def get_form_data(self) -> FormData:
         files = await self.request.files
         form = await self.request.form
         return FormData(files=files, form=form)
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return self.request.url
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return self.request.cookies
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Mapping, Optional, Union, cast
-
-from ._base import AsyncHTTPRequestAdapter, FormData, HTTPMethod, QueryParams
+from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping, Optional, Union, cast
+
+from ._base import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncHTTPRequestAdapter,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    iter_chunks,
+    memoized_property,
+)
 
 if TYPE_CHECKING:
     from sanic.request import File, Request
@@ -39,18 +48,16 @@ def convert_request_to_files_dict(request: Request) -> dict[str, Any]:
 
 
 class SanicHTTPRequestAdapter(AsyncHTTPRequestAdapter):
+    __slots__ = ("request",)
+
     def __init__(self, request: Request) -> None:
         self.request = request
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        # Just a heads up, Sanic's request.args uses urllib.parse.parse_qs
-        # to parse query string parameters. This returns a dictionary where
-        # the keys are the unique variable names and the values are lists
-        # of values for each variable name. To ensure consistency, we're
-        # enforcing the use of the first value in each list.
-        args = self.request.get_args(keep_blank_values=True)
-        return {k: args.get(k, None) for k in args}
+        # Sanic's parameters map each name to a list of values, QueryParams
+        # returns the first one when indexed, like `RequestParameters.get`
+        return QueryParams(self.request.get_args(keep_blank_values=True))
 
     @property
     def path_params(self) -> Mapping[str, Any]:
@@ -60,17 +67,31 @@ class SanicHTTPRequestAdapter(AsyncHTTPRequestAdapter):
     def method(self) -> HTTPMethod:
         return cast("HTTPMethod", self.request.method.upper())
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        return self.request.headers
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers(self.request.headers)
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         return self.request.content_type
 
     async def get_body(self) -> bytes:
         return self.request.body
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        # Sanic only leaves the body unread on streaming routes (`stream=True`),
+        # everywhere else it has already been buffered into `request.body`
+        if self.request.body or self.request.stream is None:
+            for chunk in iter_chunks(self.request.body, chunk_size):
+                yield chunk
+            return
+
+        # Both the HTTP/1.1 and the ASGI streams support async iteration
+        async for chunk in self.request.stream:  # type: ignore[attr-defined]
+            yield chunk
+
     async def get_form_data(self) -> FormData:
         assert self.request.form is not None
 
@@ -78,10 +99,10 @@ class SanicHTTPRequestAdapter(AsyncHTTPRequestAdapter):
 
         return FormData(form=self.request.form, files=files)
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return self.request.url
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return self.request.cookies
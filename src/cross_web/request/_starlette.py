@@ -1,43 +1,45 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Mapping, Optional, cast
-
-from ._base import AsyncHTTPRequestAdapter, FormData, HTTPMethod, QueryParams
+from typing import TYPE_CHECKING, AsyncIterator, Mapping, Optional, cast
+
+from ._base import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncHTTPRequestAdapter,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    memoized_property,
+)
 
 if TYPE_CHECKING:
     from starlette.requests import Request
 
 
 class StarletteRequestAdapter(AsyncHTTPRequestAdapter):
+    __slots__ = ("_request",)
+
     def __init__(self, request: Request) -> None:
         self._request = request
-        # Starlette Headers are case-insensitive Mapping
-        self._headers: Optional[Mapping[str, str]] = None
 
     @property
     def method(self) -> HTTPMethod:
         # Starlette method is already uppercase string
         return cast(HTTPMethod, self._request.method)
 
-    @property
+    @memoized_property
     def query_params(self) -> QueryParams:
-        # Starlette QueryParams behaves like a MultiDict Mapping
-        return cast(QueryParams, self._request.query_params)
+        return QueryParams(self._request.query_params)
 
     @property
     def path_params(self) -> Mapping[str, str]:
         return cast(Mapping[str, str], self._request.path_params)
 
-    @property
-    def headers(self) -> Mapping[str, str]:
-        # Cache the immutable headers object for direct access
-        # Starlette Headers are case-insensitive
-        if self._headers is None:
-            self._headers = self._request.headers
-
-        return self._headers
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers(self._request.headers)
 
-    @property
+    @memoized_property
     def content_type(self) -> Optional[str]:
         # Access directly via headers property for consistency
         return self.headers.get("content-type")
@@ -45,6 +47,14 @@ class StarletteRequestAdapter(AsyncHTTPRequestAdapter):
     async def get_body(self) -> bytes:
         return await self._request.body()
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        # Starlette yields the chunks as received from the ASGI server
+        async for chunk in self._request.stream():
+            if chunk:
+                yield chunk
+
     async def get_form_data(self) -> FormData:
         multipart_data = await self._request.form()
 
@@ -53,10 +63,10 @@ class StarletteRequestAdapter(AsyncHTTPRequestAdapter):
             form=multipart_data,
         )
 
-    @property
+    @memoized_property
     def url(self) -> str:
         return str(self._request.url)
 
-    @property
+    @memoized_property
     def cookies(self) -> Mapping[str, str]:
         return cast(Mapping[str, str], self._request.cookies)
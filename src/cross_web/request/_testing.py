@@ -3,17 +3,34 @@ from __future__ import annotations
 import json
 from typing import Any, Mapping, Optional
 
-from ._base import AsyncHTTPRequestAdapter, FormData, HTTPMethod, QueryParams
+from ._base import (
+    AsyncHTTPRequestAdapter,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+)
 
 
 class TestingRequestAdapter(AsyncHTTPRequestAdapter):
     __test__ = False
+    __slots__ = (
+        "_method",
+        "_query_params",
+        "_path_params",
+        "_headers",
+        "_content_type",
+        "_url",
+        "_cookies",
+        "_form_data",
+        "_json",
+    )
 
     def __init__(
         self,
         *,
         method: HTTPMethod = "POST",
-        query_params: QueryParams | None = None,
+        query_params: Mapping[str, Optional[str]] | None = None,
         path_params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         content_type: str | None = None,
@@ -23,9 +40,9 @@ class TestingRequestAdapter(AsyncHTTPRequestAdapter):
         json: dict[str, Any] | None = None,
     ) -> None:
         self._method = method
-        self._query_params = query_params or {}
+        self._query_params = QueryParams(query_params)
         self._path_params = path_params or {}
-        self._headers = headers or {}
+        self._headers = Headers(headers)
         self._content_type = content_type
         self._url = url
         self._cookies = cookies or {}
@@ -45,7 +62,7 @@ class TestingRequestAdapter(AsyncHTTPRequestAdapter):
         return self._path_params
 
     @property
-    def headers(self) -> Mapping[str, str]:
+    def headers(self) -> Headers:
         return self._headers
 
     @property
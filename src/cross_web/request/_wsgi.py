@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, Mapping, Optional, Union, cast
+from urllib.parse import parse_qsl
+from wsgiref.util import request_uri
+
+from ._base import (
+    DEFAULT_CHUNK_SIZE,
+    FormData,
+    Headers,
+    HTTPMethod,
+    QueryParams,
+    SyncHTTPRequestAdapter,
+    iter_chunks,
+    memoized_property,
+    parse_cookie_header,
+)
+
+WSGIEnvironment = Mapping[str, Any]
+
+
+class WSGIRequestAdapter(SyncHTTPRequestAdapter):
+    """
+    Reads the request straight from a WSGI `environ`, without building a
+    framework request first. Every property is decoded on first access and
+    the body is read from `wsgi.input` in chunks.
+
+    Only URL-encoded form data is supported, multipart bodies need a
+    framework adapter.
+    """
+
+    __slots__ = ("environ", "_body", "_stream_consumed")
+
+    def __init__(self, environ: WSGIEnvironment) -> None:
+        self.environ = environ
+        self._body: Optional[bytes] = None
+        self._stream_consumed = False
+
+    @property
+    def method(self) -> HTTPMethod:
+        return cast(HTTPMethod, self.environ["REQUEST_METHOD"].upper())
+
+    @memoized_property
+    def query_params(self) -> QueryParams:
+        # WSGI strings hold the raw bytes decoded as latin-1
+        query_string = self.environ.get("QUERY_STRING", "")
+        return QueryParams.from_query_string(query_string.encode("latin-1"))
+
+    @property
+    def path_params(self) -> Mapping[str, Any]:
+        # Set by routers following the wsgiorg.routing_args specification
+        _, kwargs = self.environ.get("wsgiorg.routing_args", ((), {}))
+        return cast(Mapping[str, Any], kwargs)
+
+    @memoized_property
+    def headers(self) -> Headers:
+        return Headers.from_wsgi(self.environ)
+
+    @memoized_property
+    def content_type(self) -> Optional[str]:
+        return self.environ.get("CONTENT_TYPE") or None
+
+    @memoized_property
+    def url(self) -> str:
+        return request_uri(cast(dict[str, Any], self.environ))
+
+    @memoized_property
+    def cookies(self) -> Mapping[str, str]:
+        return parse_cookie_header(self.environ.get("HTTP_COOKIE"))
+
+    @property
+    def content_length(self) -> Optional[int]:
+        try:
+            return int(self.environ["CONTENT_LENGTH"])
+        except (KeyError, ValueError):
+            return None
+
+    @property
+    def body(self) -> Union[str, bytes]:
+        if self._body is None:
+            self._body = b"".join(self.stream())
+
+        return self._body
+
+    def stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        if self._body is not None:
+            return iter_chunks(self._body, chunk_size)
+
+        if self._stream_consumed:
+            raise RuntimeError("The request body has already been consumed")
+
+        self._stream_consumed = True
+
+        return self._read_input(chunk_size)
+
+    def _read_input(self, chunk_size: int) -> Iterator[bytes]:
+        stream = self.environ["wsgi.input"]
+        remaining = self.content_length
+
+        if remaining is None:
+            # Reading past CONTENT_LENGTH may block, unless the server marks
+            # the input as terminated (e.g. for chunked requests)
+            if not self.environ.get("wsgi.input_terminated", False):
+                return
+
+            while chunk := stream.read(chunk_size):
+                yield chunk
+            return
+
+        while remaining > 0:
+            chunk = stream.read(min(chunk_size, remaining))
+
+            if not chunk:
+                break
+
+            remaining -= len(chunk)
+            yield chunk
+
+    @memoized_property
+    def post_data(self) -> Mapping[str, Union[str, bytes]]:
+        content_type = self.content_type or ""
+
+        if content_type.startswith("multipart/form-data"):
+            raise NotImplementedError(
+                "WSGIRequestAdapter does not support multipart form data"
+            )
+
+        if not content_type.startswith("application/x-www-form-urlencoded"):
+            return {}
+
+        body = cast(bytes, self.body)
+        return dict(parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True))
+
+    @property
+    def files(self) -> Mapping[str, Any]:
+        if (self.content_type or "").startswith("multipart/form-data"):
+            raise NotImplementedError(
+                "WSGIRequestAdapter does not support multipart form data"
+            )
+
+        return {}
+
+    def get_form_data(self) -> FormData:
+        return FormData(files=self.files, form=self.post_data)
@@ -1,20 +1,50 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, Mapping, List, Union, cast
-from typing_extensions import Self
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import field
+from functools import lru_cache
+from http.cookies import SimpleCookie
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Union,
+    cast,
+)
 from urllib.parse import urlencode
 
+from ._compat import slotted_dataclass
+from .codecs import get_json_codec
+
 if TYPE_CHECKING:
+    from aiohttp import web
+    from chalice.app import Response as ChaliceResponse
+    from django.http import HttpResponse, StreamingHttpResponse
     from fastapi import Response as FastAPIResponse
+    from fastapi.responses import StreamingResponse as FastAPIStreamingResponse
+    from flask import Response as FlaskResponse
+    from litestar import Response as LitestarResponse
+    from litestar.datastructures import Cookie as LitestarCookie
+    from litestar.response import Stream
+    from quart import Response as QuartResponse
+    from sanic.response import HTTPResponse, ResponseStream
+    from typing_extensions import Self
 
 JsonType = Union[
     str, int, float, bool, None, Mapping[str, "JsonType"], List["JsonType"]
 ]
+Body = Union[str, bytes, bytearray, memoryview]
+BodyStream = Union[Iterable[bytes], AsyncIterable[bytes]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
 
 
-@dataclass
+@slotted_dataclass(frozen=True)
 class Cookie:
     name: str
     value: str
@@ -25,13 +55,74 @@ class Cookie:
     httponly: bool = True
     samesite: Literal["lax", "strict", "none"] = "lax"
 
+    def to_header(self) -> str:
+        """
+        Return the RFC 6265 `Set-Cookie` header value. Cookies are immutable,
+        so the value is cached and equal cookies share the same string.
+        """
+        return _serialize_cookie(self)
+
 
-@dataclass
+@slotted_dataclass
 class Response:
     status_code: int
-    body: str | None = None
+    body: Body | None = None
     cookies: list[Cookie] | None = None
     headers: Mapping[str, str] | None = None
+    # The body and the object it was serialized from, set by `json_response`
+    _json_source: tuple[Body, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # A `str` body and its encoded length, see `content_length`
+    _str_length: tuple[str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def content_length(self) -> int | None:
+        """
+        Length of the encoded body in bytes, always that of the current body.
+        Encoding a non-ASCII `str` body is cached until the body is replaced.
+        """
+        body = self.body
+
+        if not isinstance(body, str) or body.isascii():
+            return _body_length(body)
+
+        if self._str_length is None or self._str_length[0] is not body:
+            self._str_length = (body, len(body.encode("utf-8")))
+
+        return self._str_length[1]
+
+    @classmethod
+    def json_response(
+        cls,
+        data: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        cookies: list[Cookie] | None = None,
+    ) -> Self:
+        """
+        Serialize `data` to bytes with the configured JSON codec. `json()`
+        returns `data` itself instead of decoding the body again.
+        """
+        body = get_json_codec().dumps(data)
+
+        # A content type passed in any case replaces the default
+        if headers is None or _get_header(headers, "content-type") is None:
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        else:
+            headers = dict(headers)
+
+        response = cls(
+            status_code=status_code,
+            body=body,
+            headers=headers,
+            cookies=cookies,
+        )
+        response._json_source = (body, data)
+
+        return response
 
     @classmethod
     def redirect(
@@ -40,14 +131,16 @@ class Response:
         query_params: Mapping[str, str | list[str]] | None = None,
         headers: Mapping[str, str] | None = None,
         cookies: list[Cookie] | None = None,
+        status_code: int = 302,
     ) -> Self:
+        _check_redirect_status(status_code)
         headers = headers or {}
 
         if query_params:
-            url = url + "?" + urlencode(query_params)
+            url = url + "?" + urlencode(query_params, doseq=True)
 
         return cls(
-            status_code=302,
+            status_code=status_code,
             headers={"Location": url, **headers},
             cookies=cookies,
         )
@@ -56,7 +149,11 @@ class Response:
         if self.body is None:
             return None
 
-        return cast(JsonType, json.loads(self.body))
+        # Only valid as long as the body was not replaced
+        if self._json_source is not None and self._json_source[0] is self.body:
+            return cast(JsonType, self._json_source[1])
+
+        return cast(JsonType, get_json_codec().loads(self.body))
 
     def to_fastapi(self) -> FastAPIResponse:
         from fastapi import Response as FastAPIResponse
@@ -64,19 +161,537 @@ class Response:
         response = FastAPIResponse(
             status_code=self.status_code,
             headers=self.headers,
-            content=self.body,
-        )
-
-        for cookie in self.cookies or []:
-            response.set_cookie(
-                cookie.name,
-                cookie.value,
-                secure=cookie.secure,
-                path=cookie.path,
-                domain=cookie.domain,
-                max_age=cookie.max_age,
-                httponly=cookie.httponly,
-                samesite=cookie.samesite,
+            content=_native_body(self.body),
+        )
+        response.raw_headers.extend(_raw_cookie_headers(self.cookies))
+
+        return response
+
+    def to_django(self) -> HttpResponse:
+        from django.http import HttpResponse
+
+        body = _native_body(self.body)
+        response = HttpResponse(
+            b"" if body is None else body,
+            status=self.status_code,
+            headers=self.headers,
+        )
+        _set_cookies(response.set_cookie, self.cookies)
+
+        return response
+
+    def to_flask(self) -> FlaskResponse:
+        from flask import Response as FlaskResponse
+
+        response = FlaskResponse(
+            _encoded_body(self.body),
+            status=self.status_code,
+            headers=self.headers,
+        )
+        response.headers.extend(_cookie_headers(self.cookies))
+
+        return response
+
+    def to_aiohttp(self) -> web.Response:
+        from aiohttp import web
+
+        body = _native_body(self.body)
+
+        if isinstance(body, str):
+            response = web.Response(
+                text=body, status=self.status_code, headers=self.headers
+            )
+        else:
+            response = web.Response(
+                body=body, status=self.status_code, headers=self.headers
             )
 
+        response.headers.extend(_cookie_headers(self.cookies))
+
+        return response
+
+    def to_sanic(self) -> HTTPResponse:
+        from sanic.response import HTTPResponse
+
+        response = HTTPResponse(
+            _native_body(self.body),
+            status=self.status_code,
+            # Any mapping works, Sanic copies it into a multidict
+            headers=cast("dict[str, str] | None", self.headers),
+        )
+        response.headers.extend(_cookie_headers(self.cookies))
+
+        return response
+
+    def to_quart(self) -> QuartResponse:
+        from quart import Response as QuartResponse
+
+        response = QuartResponse(
+            _encoded_body(self.body),
+            status=self.status_code,
+            # Any mapping works, Quart copies it into `Headers`
+            headers=cast("dict[str, str] | None", self.headers),
+        )
+        response.headers.extend(_cookie_headers(self.cookies))
+
+        return response
+
+    def to_litestar(self) -> LitestarResponse[Union[bytes, str]]:
+        from litestar import Response as LitestarResponse
+
+        return LitestarResponse(
+            _encoded_body(self.body),
+            status_code=self.status_code,
+            headers=self.headers,
+            cookies=_litestar_cookies(self.cookies),
+        )
+
+    def to_chalice(self) -> ChaliceResponse:
+        from chalice.app import Response as ChaliceResponse
+
+        return ChaliceResponse(
+            _encoded_body(self.body),
+            headers=_chalice_headers(self.headers, self.cookies),
+            status_code=self.status_code,
+        )
+
+    async def send_asgi(self, send: Send) -> None:
+        """
+        Write the response straight to an ASGI `send` callable, without
+        building a framework response: a start message with the encoded
+        headers followed by a single body message.
+        """
+        if _status_allows_body(self.status_code):
+            # The length of exactly what is sent, even if `body` was replaced
+            body = _asgi_body(self.body)
+            content_length = len(body)
+        else:
+            body, content_length = b"", None
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": _asgi_headers(self.headers, self.cookies, content_length),
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class RedirectTemplate:
+    """
+    Builds redirects to a fixed URL, for redirects issued at high rates such
+    as login or OAuth flows. The URL is split and the static query parameters
+    are encoded once, so each call only encodes its own parameters.
+
+        authorize = RedirectTemplate(
+            "https://auth.example.com/authorize", {"client_id": "app"}
+        )
+        response = authorize({"state": state})
+    """
+
+    __slots__ = ("url", "status_code", "headers", "_base", "_separator", "_fragment")
+
+    def __init__(
+        self,
+        url: str,
+        query_params: Mapping[str, str | list[str]] | None = None,
+        *,
+        status_code: int = 302,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        _check_redirect_status(status_code)
+
+        self.url = url
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+
+        # The query goes before the fragment, keep it aside
+        base, hash_sign, fragment = url.partition("#")
+
+        if query_params:
+            base += _query_separator(base) + urlencode(query_params, doseq=True)
+
+        self._base = base
+        self._separator = _query_separator(base)
+        self._fragment = hash_sign + fragment
+
+    def __call__(
+        self,
+        query_params: Mapping[str, str | list[str]] | None = None,
+        *,
+        headers: Mapping[str, str] | None = None,
+        cookies: list[Cookie] | None = None,
+    ) -> Response:
+        location = self._base
+
+        if query_params:
+            location += self._separator + urlencode(query_params, doseq=True)
+
+        return Response(
+            status_code=self.status_code,
+            headers={
+                "Location": location + self._fragment,
+                **self.headers,
+                **(headers or {}),
+            },
+            cookies=cookies,
+        )
+
+    def __repr__(self) -> str:
+        return f"RedirectTemplate({self.url!r}, status_code={self.status_code})"
+
+
+@slotted_dataclass
+class StreamingResponse(Response):
+    """
+    A response whose body is produced by a sync or async iterable of bytes,
+    so large exports or server-sent events never have to be fully buffered.
+    The converters return each framework's native streaming response.
+    """
+
+    stream: BodyStream = ()
+
+    def to_fastapi(self) -> FastAPIStreamingResponse:
+        from fastapi.responses import StreamingResponse as FastAPIStreamingResponse
+
+        response = FastAPIStreamingResponse(
+            self.stream,
+            status_code=self.status_code,
+            headers=self.headers,
+        )
+        response.raw_headers.extend(_raw_cookie_headers(self.cookies))
+
+        return response
+
+    def to_django(self) -> StreamingHttpResponse:
+        from django.http import StreamingHttpResponse
+
+        # Django accepts async iterators too when served over ASGI
+        response = StreamingHttpResponse(
+            self.stream,
+            status=self.status_code,
+            headers=self.headers,
+        )
+        _set_cookies(response.set_cookie, self.cookies)
+
+        return response
+
+    def to_flask(self) -> FlaskResponse:
+        from flask import Response as FlaskResponse
+
+        if isinstance(self.stream, AsyncIterable):
+            raise TypeError("Flask responses can only stream sync iterables")
+
+        response = FlaskResponse(
+            self.stream,
+            status=self.status_code,
+            headers=self.headers,
+        )
+        response.headers.extend(_cookie_headers(self.cookies))
+
+        return response
+
+    def to_aiohttp(self) -> web.Response:
+        from aiohttp import web
+
+        # aiohttp writes async iterable bodies chunk by chunk
+        response = web.Response(
+            body=_as_async_iterator(self.stream),
+            status=self.status_code,
+            headers=self.headers,
+        )
+        response.headers.extend(_cookie_headers(self.cookies))
+
+        return response
+
+    def to_sanic(self) -> ResponseStream:  # type: ignore[override]
+        from sanic.response import ResponseStream
+
+        async def write_stream(response: Any) -> None:
+            async for chunk in _as_async_iterator(self.stream):
+                await response.write(chunk)
+
+        response = ResponseStream(
+            write_stream,
+            status=self.status_code,
+            headers=cast("dict[str, str] | None", self.headers),
+            content_type=None,
+        )
+        response.headers.extend(_cookie_headers(self.cookies))
+
         return response
+
+    def to_quart(self) -> QuartResponse:
+        from quart import Response as QuartResponse
+
+        # Quart runs sync iterables in a thread and awaits async ones
+        response = QuartResponse(
+            self.stream,
+            status=self.status_code,
+            headers=cast("dict[str, str] | None", self.headers),
+        )
+        response.headers.extend(_cookie_headers(self.cookies))
+
+        return response
+
+    def to_litestar(self) -> Stream:  # type: ignore[override]
+        from litestar.response import Stream
+
+        return Stream(
+            self.stream,
+            status_code=self.status_code,
+            headers=self.headers,
+            cookies=_litestar_cookies(self.cookies),
+        )
+
+    def to_chalice(self) -> ChaliceResponse:
+        if isinstance(self.stream, AsyncIterable):
+            raise TypeError("Chalice responses can only stream sync iterables")
+
+        from chalice.app import Response as ChaliceResponse
+
+        # Lambda responses are always buffered, there is nothing to stream to
+        return ChaliceResponse(
+            b"".join(self.stream),
+            headers=_chalice_headers(self.headers, self.cookies),
+            status_code=self.status_code,
+        )
+
+    async def send_asgi(self, send: Send) -> None:
+        # Sync iterables are iterated on the event loop, they must not block
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": _asgi_headers(self.headers, self.cookies, None),
+            }
+        )
+
+        async for chunk in _as_async_iterator(self.stream):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+        await send({"type": "http.response.body", "body": b""})
+
+
+def _set_cookies(set_cookie: Callable[..., Any], cookies: list[Cookie] | None) -> None:
+    # For frameworks that only emit cookies set through their own API
+    for cookie in cookies or ():
+        set_cookie(
+            cookie.name,
+            cookie.value,
+            secure=cookie.secure,
+            path=cookie.path or "/",
+            domain=cookie.domain,
+            max_age=cookie.max_age,
+            httponly=cookie.httponly,
+            samesite=cookie.samesite,
+        )
+
+
+def _litestar_cookies(cookies: list[Cookie] | None) -> list[LitestarCookie]:
+    from litestar.datastructures import Cookie as LitestarCookie
+
+    return [
+        LitestarCookie(
+            key=cookie.name,
+            value=cookie.value,
+            secure=cookie.secure,
+            path=cookie.path or "/",
+            domain=cookie.domain,
+            max_age=cookie.max_age,
+            httponly=cookie.httponly,
+            samesite=cookie.samesite,
+        )
+        for cookie in cookies or ()
+    ]
+
+
+def _chalice_headers(
+    headers: Mapping[str, str] | None, cookies: list[Cookie] | None
+) -> dict[str, str | list[str]]:
+    chalice_headers: dict[str, str | list[str]] = dict(headers or {})
+
+    if cookies:
+        # Chalice sends list values as multiple headers
+        chalice_headers["Set-Cookie"] = [cookie.to_header() for cookie in cookies]
+
+    return chalice_headers
+
+
+def _cookie_headers(cookies: list[Cookie] | None) -> list[tuple[str, str]]:
+    return [("Set-Cookie", cookie.to_header()) for cookie in cookies or ()]
+
+
+def _raw_cookie_headers(cookies: list[Cookie] | None) -> list[tuple[bytes, bytes]]:
+    return [(b"set-cookie", _encode_cookie(cookie)) for cookie in cookies or ()]
+
+
+_REDIRECT_STATUS_CODES = frozenset({301, 302, 303, 307, 308})
+
+
+def _check_redirect_status(status_code: int) -> None:
+    if status_code not in _REDIRECT_STATUS_CODES:
+        raise ValueError(f"Invalid redirect status code: {status_code}")
+
+
+def _query_separator(url: str) -> str:
+    if "?" not in url:
+        return "?"
+
+    return "" if url.endswith(("?", "&")) else "&"
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> str | None:
+    """Case-insensitive lookup of a lowercase `name` in response headers."""
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+
+    return None
+
+
+def _asgi_headers(
+    headers: Mapping[str, str] | None,
+    cookies: list[Cookie] | None,
+    content_length: int | None,
+) -> list[tuple[bytes, bytes]]:
+    raw_headers = []
+
+    for name, value in (headers or {}).items():
+        raw_name = name.lower().encode("latin-1")
+
+        if raw_name == b"content-length":
+            content_length = None
+
+        raw_headers.append((raw_name, value.encode("latin-1")))
+
+    if content_length is not None:
+        raw_headers.append((b"content-length", b"%d" % content_length))
+
+    raw_headers.extend(_raw_cookie_headers(cookies))
+
+    return raw_headers
+
+
+def _asgi_body(body: Body | None) -> bytes:
+    # ASGI servers only accept `bytes` bodies
+    if body is None:
+        return b""
+
+    if isinstance(body, str):
+        return body.encode("utf-8")
+
+    return body if isinstance(body, bytes) else bytes(body)
+
+
+def _status_allows_body(status_code: int) -> bool:
+    return status_code >= 200 and status_code not in (204, 304)
+
+
+# token from RFC 7230, section 3.2.6
+_COOKIE_NAME_RE = re.compile(r"[!#$%&'*+\-.^_`|~0-9A-Za-z]+")
+# cookie-octet from RFC 6265, section 4.1.1
+_COOKIE_VALUE_RE = re.compile(r"[\x21\x23-\x2b\x2d-\x3a\x3c-\x5b\x5d-\x7e]*")
+_ATTRIBUTE_VALUE_RE = re.compile(r"[^\x00-\x1f\x7f;]*")
+
+
+@lru_cache(maxsize=256)
+def _serialize_cookie(cookie: Cookie) -> str:
+    if not _COOKIE_NAME_RE.fullmatch(cookie.name):
+        raise ValueError(f"Invalid cookie name: {cookie.name!r}")
+
+    if _COOKIE_VALUE_RE.fullmatch(cookie.value):
+        value = cookie.value
+    else:
+        # Quoted and escaped the same way as `http.cookies`, which is how
+        # Starlette, Django and Werkzeug send such values too
+        _, value = SimpleCookie().value_encode(cookie.value)
+
+    parts = [f"{cookie.name}={value}"]
+
+    # Without a path, the cookie is scoped to the whole site, like the
+    # converters that set cookies through the framework's own API
+    for attribute, attribute_value in (
+        ("Domain", cookie.domain),
+        ("Path", cookie.path or "/"),
+    ):
+        if attribute_value is None:
+            continue
+
+        if not _ATTRIBUTE_VALUE_RE.fullmatch(attribute_value):
+            raise ValueError(f"Invalid cookie {attribute}: {attribute_value!r}")
+
+        parts.append(f"{attribute}={attribute_value}")
+
+    if cookie.max_age is not None:
+        parts.append(f"Max-Age={int(cookie.max_age)}")
+    if cookie.secure:
+        parts.append("Secure")
+    if cookie.httponly:
+        parts.append("HttpOnly")
+
+    parts.append(f"SameSite={cookie.samesite.capitalize()}")
+
+    return "; ".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _encode_cookie(cookie: Cookie) -> bytes:
+    return cookie.to_header().encode("latin-1")
+
+
+def _body_length(body: Body | None) -> int | None:
+    if body is None:
+        return None
+
+    if isinstance(body, str):
+        # Most bodies are ASCII, where the encoded length is the str length
+        return len(body) if body.isascii() else len(body.encode("utf-8"))
+
+    if isinstance(body, memoryview):
+        return body.nbytes
+
+    return len(body)
+
+
+def _encoded_body(body: Body | None) -> str | bytes:
+    """
+    Return `body` for frameworks that only accept `str` or `bytes`, other
+    binary types have to be copied.
+    """
+    if body is None:
+        return b""
+
+    if isinstance(body, (str, bytes)):
+        return body
+
+    return bytes(body)
+
+
+def _native_body(body: Body | None) -> str | bytes | memoryview | None:
+    """
+    Return `body` in a form every framework accepts, without copying binary
+    data: frameworks take `bytes` and flat, contiguous byte-format
+    `memoryview`s, but not `bytearray`s.
+    """
+    if isinstance(body, bytearray):
+        return memoryview(body)
+
+    if isinstance(body, memoryview) and not (
+        body.format == "B" and body.ndim == 1 and body.c_contiguous
+    ):
+        # Frameworks take len() as the length, which counts the items of the
+        # first dimension. Views with gaps can't be cast and must be copied.
+        return body.cast("B") if body.c_contiguous else body.tobytes()
+
+    return body
+
+
+async def _as_async_iterator(stream: BodyStream) -> AsyncIterator[bytes]:
+    if isinstance(stream, AsyncIterable):
+        async for chunk in stream:
+            yield chunk
+    else:
+        for chunk in stream:
+            yield chunk
@@ -1,9 +1,23 @@
-from .clients.base import HttpClient, JSON, RequestData, Response, UploadedFile
+from .clients.base import (
+    HttpClient,
+    JSON,
+    RequestData,
+    RequestSpec,
+    Response,
+    SyncHttpClient,
+    UploadedFile,
+)
+from .load import LatencyHistogram, LoadResult, run_load
 
 __all__ = [
     "HttpClient",
     "JSON",
+    "LatencyHistogram",
+    "LoadResult",
     "RequestData",
+    "RequestSpec",
     "Response",
+    "SyncHttpClient",
     "UploadedFile",
+    "run_load",
 ]
@@ -1,9 +1,19 @@
-from .base import HttpClient, JSON, RequestData, Response, UploadedFile
+from .base import (
+    HttpClient,
+    JSON,
+    RequestData,
+    RequestSpec,
+    Response,
+    SyncHttpClient,
+    UploadedFile,
+)
 
 __all__ = [
     "HttpClient",
     "JSON",
     "RequestData",
+    "RequestSpec",
     "Response",
+    "SyncHttpClient",
     "UploadedFile",
 ]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
-from aiohttp import FormData, web
+from aiohttp import DummyCookieJar, FormData, web
 from aiohttp.test_utils import TestClient, TestServer
 
 from .base import HttpClient, RequestData, Response, UploadedFile
@@ -13,6 +14,14 @@ class AiohttpHttpClient(HttpClient):
     def __init__(self, app: web.Application) -> None:
         self.app = app
 
+    @asynccontextmanager
+    async def _create_session(self) -> AsyncIterator[TestClient[Any, Any]]:
+        # Cookies are passed per request so none are kept between requests
+        async with TestClient(
+            TestServer(self.app), cookie_jar=DummyCookieJar()
+        ) as client:
+            yield client
+
     def _build_data(
         self,
         data: RequestData | None,
@@ -56,7 +65,7 @@ class AiohttpHttpClient(HttpClient):
         if cookies is not None:
             kwargs["cookies"] = dict(cookies)
 
-        async with TestClient(TestServer(self.app)) as client:
+        async with self._get_session() as client:
             response = await getattr(client, method)(url, headers=headers, **kwargs)
 
             return Response(
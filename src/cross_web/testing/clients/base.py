@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 import abc
-import json
-from collections.abc import Mapping
+import asyncio
+import contextvars
+import functools
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Any, Literal, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    Literal,
+    Optional,
+    Union,
+    cast,
+)
+
+from ...codecs import get_json_codec
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 JSON = Union[dict[str, "JSON"], list["JSON"], str, int, float, bool, None]
 RequestData = Union[bytes, str, Mapping[str, object]]
@@ -35,16 +52,98 @@ class Response:
 
     @property
     def json(self) -> JSON:
-        return cast(JSON, json.loads(self.data))
+        return cast(JSON, get_json_codec().loads(self.data))
+
+
+@dataclass
+class RequestSpec:
+    """
+    A request for `HttpClient.gather()`, with the same arguments as
+    `HttpClient.request()`.
+    """
+
+    url: str
+    method: RequestMethod
+    headers: dict[str, str] | None
+    kwargs: dict[str, Any]
+
+    def __init__(
+        self,
+        url: str,
+        method: RequestMethod = "get",
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.url = url
+        self.method = method
+        self.headers = headers
+        self.kwargs = kwargs
+
+
+_Send = Callable[[RequestSpec], Awaitable[Response]]
 
 
 class HttpClient(abc.ABC):
+    """
+    Sends requests to an app through its framework's test harness.
+
+    By default every request sets up and tears down its own harness (test
+    client, test server, lifespan). Inside `async with client:` a single
+    harness is started once and reused by every request until the block
+    exits, which is much faster for many requests. Cookies are never carried
+    over from one request to the next, in either mode.
+    """
+
     supports_form_data = True
+    # Upper bound for `gather()`, for frameworks that handle one request at a time
+    max_concurrency: Optional[int] = None
+
+    _session: Any = None
+    _exit_stack: Optional[AsyncExitStack] = None
 
     @abc.abstractmethod
     def __init__(self, app: Any) -> None:
         raise NotImplementedError
 
+    async def __aenter__(self) -> Self:
+        if self._exit_stack is not None:
+            raise RuntimeError(f"{type(self).__name__} is already open")
+
+        exit_stack = AsyncExitStack()
+        self._session = await exit_stack.enter_async_context(self._create_session())
+        self._exit_stack = exit_stack
+
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the session opened by `async with client:`, if any. Requests
+        sent afterwards get their own harness again.
+        """
+        exit_stack = self._exit_stack
+        self._exit_stack = self._session = None
+
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    def _create_session(self) -> AsyncContextManager[Any]:
+        """
+        Return a context manager that starts the test harness shared by the
+        requests of a session. Clients without a harness yield `None`.
+        """
+        return _no_session()
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[Any]:
+        if self._exit_stack is not None:
+            yield self._session
+        else:
+            async with self._create_session() as session:
+                yield session
+
     @abc.abstractmethod
     async def request(
         self,
@@ -55,6 +154,57 @@ class HttpClient(abc.ABC):
     ) -> Response:
         raise NotImplementedError
 
+    async def gather(
+        self, requests: Iterable[RequestSpec], *, concurrency: int = 10
+    ) -> list[Response]:
+        """
+        Send `requests` concurrently, at most `concurrency` at a time, and
+        return their responses in the same order.
+
+        The requests share one test harness, the client's own when called
+        inside `async with client:`, or one opened for the batch otherwise.
+        """
+        concurrency = self._check_concurrency(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with self._concurrent(concurrency) as send:
+
+            async def send_bounded(spec: RequestSpec) -> Response:
+                async with semaphore:
+                    return await send(spec)
+
+            return list(await asyncio.gather(*map(send_bounded, requests)))
+
+    def _check_concurrency(self, concurrency: int) -> int:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        if self.max_concurrency is not None:
+            return min(concurrency, self.max_concurrency)
+
+        return concurrency
+
+    @asynccontextmanager
+    async def _batch_session(self) -> AsyncIterator[None]:
+        # Reuse the client's session, or open one for the batch
+        if self._exit_stack is not None:
+            yield
+        else:
+            async with self:
+                yield
+
+    @asynccontextmanager
+    async def _concurrent(self, concurrency: int) -> AsyncIterator[_Send]:
+        """
+        Yield a function that sends a request without blocking the event
+        loop, for up to `concurrency` requests in flight at once.
+        """
+        async with self._batch_session():
+            yield self._send
+
+    async def _send(self, spec: RequestSpec) -> Response:
+        return await self.request(spec.url, spec.method, spec.headers, **spec.kwargs)
+
     async def get(
         self,
         url: str,
@@ -83,6 +233,62 @@ class HttpClient(abc.ABC):
         )
 
 
+class SyncHttpClient(HttpClient):
+    """
+    A client for a sync framework, whose requests block until the app has
+    responded. `gather()` sends them from a pool of `concurrency` threads.
+    """
+
+    @abc.abstractmethod
+    def _request_sync(
+        self,
+        session: Any,
+        url: str,
+        method: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        raise NotImplementedError
+
+    async def request(
+        self,
+        url: str,
+        method: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        async with self._get_session() as session:
+            return self._request_sync(session, url, method, headers, **kwargs)
+
+    @asynccontextmanager
+    async def _concurrent(self, concurrency: int) -> AsyncIterator[_Send]:
+        loop = asyncio.get_running_loop()
+
+        async with self._batch_session():
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+                async def send(spec: RequestSpec) -> Response:
+                    return await loop.run_in_executor(
+                        executor,
+                        functools.partial(
+                            contextvars.copy_context().run,
+                            self._request_sync,
+                            self._session,
+                            spec.url,
+                            spec.method,
+                            spec.headers,
+                            **spec.kwargs,
+                        ),
+                    )
+
+                yield send
+
+
+@asynccontextmanager
+async def _no_session() -> AsyncIterator[None]:
+    yield None
+
+
 def merge_cookies(
     headers: dict[str, str] | None, cookies: Mapping[str, str] | None
 ) -> dict[str, str] | None:
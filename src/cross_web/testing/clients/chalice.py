@@ -1,22 +1,32 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from chalice.app import Chalice
 from chalice.test import Client
 
-from .base import HttpClient, Response, merge_cookies
+from .base import Response, SyncHttpClient, merge_cookies
 
 
-class ChaliceHttpClient(HttpClient):
+class ChaliceHttpClient(SyncHttpClient):
     supports_form_data = False
+    # Chalice stores the request being handled on the app
+    max_concurrency = 1
 
     def __init__(self, app: Chalice) -> None:
         self.app = app
 
-    async def request(
+    @asynccontextmanager
+    async def _create_session(self) -> AsyncIterator[Client]:
+        with Client(self.app) as client:
+            yield client
+
+    def _request_sync(
         self,
+        session: Client,
         url: str,
         method: str,
         headers: dict[str, str] | None = None,
@@ -46,8 +56,7 @@ class ChaliceHttpClient(HttpClient):
         if body is not None:
             request_kwargs["body"] = body
 
-        with Client(self.app) as client:
-            response = getattr(client.http, method)(url, **request_kwargs)
+        response = getattr(session.http, method)(url, **request_kwargs)
 
         response_body = response.body
         if isinstance(response_body, str):
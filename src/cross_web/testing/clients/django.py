@@ -11,7 +11,14 @@ from django.http import Http404, HttpRequest, HttpResponse, StreamingHttpRespons
 from django.test.client import AsyncRequestFactory, RequestFactory
 from django.urls import Resolver404, ResolverMatch, resolve
 
-from .base import HttpClient, RequestData, Response, UploadedFile, merge_cookies
+from .base import (
+    HttpClient,
+    RequestData,
+    Response,
+    SyncHttpClient,
+    UploadedFile,
+    merge_cookies,
+)
 
 
 def resolve_view_match(view: object, url: str) -> ResolverMatch | None:
@@ -25,7 +32,7 @@ def resolve_view_match(view: object, url: str) -> ResolverMatch | None:
         return None
 
 
-class DjangoHttpClient(HttpClient):
+class DjangoHttpClient(SyncHttpClient):
     def __init__(self, view: Callable[..., HttpResponse]) -> None:
         self.view = view
 
@@ -71,7 +78,7 @@ class DjangoHttpClient(HttpClient):
 
         return request_data, request_kwargs
 
-    async def _do_request(self, request: HttpRequest) -> Response:
+    def _do_request(self, request: HttpRequest) -> Response:
         try:
             resolver_match = request.resolver_match
             if resolver_match is None:
@@ -93,8 +100,9 @@ class DjangoHttpClient(HttpClient):
             headers=dict(response.headers),
         )
 
-    async def request(
+    def _request_sync(
         self,
+        session: None,
         url: str,
         method: str,
         headers: dict[str, str] | None = None,
@@ -123,7 +131,7 @@ class DjangoHttpClient(HttpClient):
         if cookies is not None:
             request.COOKIES = dict(cookies)
 
-        return await self._do_request(request)
+        return self._do_request(request)
 
 
 class AsyncDjangoHttpClient(HttpClient):
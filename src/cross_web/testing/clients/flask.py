@@ -4,17 +4,77 @@ import asyncio
 import contextvars
 import functools
 import io
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, NamedTuple, Optional
 
 from flask import Flask
+from flask.testing import FlaskClient
+
+from .base import (
+    RequestData,
+    Response,
+    SyncHttpClient,
+    UploadedFile,
+    _Send,
+    merge_cookies,
+)
+
+
+class _FlaskSession(NamedTuple):
+    client: FlaskClient
+    executor: ThreadPoolExecutor
+
+
+class FlaskHttpClient(SyncHttpClient):
+    """
+    Sends requests to a Flask app from a thread pool of its own, so they
+    don't compete with other blocking work for the event loop's default
+    executor. The pool has `max_workers` threads, named with
+    `thread_name_prefix`. It belongs to the session: inside
+    `async with client:` one pool serves every request and is shut down when
+    the block exits or `aclose()` is called, otherwise each request gets a
+    pool that is shut down when the request completes.
+
+    With `native_async=True`, async views run on the calling event loop
+    instead of a new loop in the worker thread, so they can share
+    loop-bound resources, such as connection pools, with the test. This
+    needs asgiref, which Flask already requires for async views.
+    """
+
+    native_async = False
+
+    def __init__(
+        self,
+        app: Flask,
+        *,
+        max_workers: Optional[int] = None,
+        thread_name_prefix: str = "cross-web-flask",
+        native_async: Optional[bool] = None,
+    ) -> None:
+        self.app = app
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
 
-from .base import HttpClient, RequestData, Response, UploadedFile
+        if native_async is not None:
+            self.native_async = native_async
 
+    @asynccontextmanager
+    async def _create_session(self) -> AsyncIterator[_FlaskSession]:
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=self.thread_name_prefix,
+        )
 
-class FlaskHttpClient(HttpClient):
-    def __init__(self, app: Flask) -> None:
-        self.app = app
+        try:
+            # Cookies are sent as a header so none are kept between requests
+            yield _FlaskSession(self.app.test_client(use_cookies=False), executor)
+        finally:
+            # Waiting would block the event loop, which a worker running a
+            # native async view may itself be waiting on. Idle workers exit
+            # right away.
+            executor.shutdown(wait=False)
 
     def _build_request_kwargs(
         self,
@@ -48,8 +108,9 @@ class FlaskHttpClient(HttpClient):
         request_kwargs["data"] = multipart_data
         return request_kwargs
 
-    def _do_request(
+    def _request_sync(
         self,
+        session: FlaskClient,
         url: str,
         method: str,
         headers: dict[str, str] | None = None,
@@ -66,16 +127,12 @@ class FlaskHttpClient(HttpClient):
             **kwargs,
         )
 
-        with self.app.test_client() as client:
-            for key, value in (cookies or {}).items():
-                client.set_cookie(key, value)
-
-            response = client.open(
-                url,
-                method=method.upper(),
-                headers=headers,
-                **request_kwargs,
-            )
+        response = session.open(
+            url,
+            method=method.upper(),
+            headers=merge_cookies(headers, cookies),
+            **request_kwargs,
+        )
 
         return Response(
             status_code=response.status_code,
@@ -90,18 +147,43 @@ class FlaskHttpClient(HttpClient):
         headers: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> Response:
+        async with self._get_session() as session:
+            return await self._run_in_executor(
+                session.executor,
+                functools.partial(
+                    self._request_sync,
+                    session.client,
+                    url=url,
+                    method=method,
+                    headers=headers,
+                    **kwargs,
+                ),
+            )
+
+    async def _run_in_executor(
+        self, executor: ThreadPoolExecutor, func: Callable[[], Response]
+    ) -> Response:
+        if self.native_async:
+            from asgiref.sync import sync_to_async
+
+            # asgiref runs the async views called from this thread on the
+            # current event loop
+            return await sync_to_async(
+                func, thread_sensitive=False, executor=executor
+            )()
+
         loop = asyncio.get_running_loop()
         ctx = contextvars.copy_context()
-        func_call = functools.partial(
-            ctx.run,
-            self._do_request,
-            url=url,
-            method=method,
-            headers=headers,
-            **kwargs,
-        )
-        return await loop.run_in_executor(None, func_call)
+
+        return await loop.run_in_executor(executor, functools.partial(ctx.run, func))
+
+    @asynccontextmanager
+    async def _concurrent(self, concurrency: int) -> AsyncIterator[_Send]:
+        # Batches also go through the session's pool, which caps concurrency
+        # at `max_workers`
+        async with self._batch_session():
+            yield self._send
 
 
 class AsyncFlaskHttpClient(FlaskHttpClient):
-    pass
+    native_async = True
@@ -1,34 +1,53 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
 from litestar import Litestar
 from litestar.testing import TestClient
 
-from .base import HttpClient, Response
+from .base import Response, SyncHttpClient, merge_cookies
 
+_REJECT_ALL = DefaultCookiePolicy(allowed_domains=[])
+
+
+class LitestarHttpClient(SyncHttpClient):
+    """
+    Sends requests to a Litestar app through its test client,
+    `litestar.testing.TestClient`. The test client blocks until the app has
+    responded, even though the app is async. `request()` therefore blocks
+    the event loop, and `gather()` sends requests from a pool of
+    `concurrency` threads instead of running them as asyncio tasks.
+    """
 
-class LitestarHttpClient(HttpClient):
     def __init__(self, app: Litestar) -> None:
         self.app = app
 
-    async def request(
+    @asynccontextmanager
+    async def _create_session(self) -> AsyncIterator[TestClient[Litestar]]:
+        # Entering the client runs the app's lifespan
+        with TestClient(app=self.app) as client:
+            # Cookies are sent as a header so none are kept between requests
+            client.cookies.jar.set_policy(_REJECT_ALL)
+            yield client
+
+    def _request_sync(
         self,
+        session: TestClient[Litestar],
         url: str,
         method: str,
         headers: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> Response:
         cookies = kwargs.pop("cookies", None)
-
-        with TestClient(app=self.app) as client:
-            client.cookies.update(dict(cookies or {}))
-            response = client.request(
-                method.upper(),
-                url,
-                headers=headers,
-                **kwargs,
-            )
+        response = session.request(
+            method.upper(),
+            url,
+            headers=merge_cookies(headers, cookies),
+            **kwargs,
+        )
 
         return Response(
             status_code=response.status_code,
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import io
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
 from quart import Quart
 from quart.datastructures import FileStorage
+from quart.typing import TestAppProtocol
 
 from .base import HttpClient, RequestData, Response, UploadedFile
 
@@ -14,6 +16,12 @@ class QuartHttpClient(HttpClient):
     def __init__(self, app: Quart) -> None:
         self.app = app
 
+    @asynccontextmanager
+    async def _create_session(self) -> AsyncIterator[TestAppProtocol]:
+        # Entering the test app runs the app's startup and shutdown hooks
+        async with self.app.test_app() as test_app:
+            yield test_app
+
     def _build_request_kwargs(
         self,
         data: RequestData | None,
@@ -67,7 +75,7 @@ class QuartHttpClient(HttpClient):
             **kwargs,
         )
 
-        async with self.app.test_app() as test_app, self.app.app_context():
+        async with self._get_session() as test_app, self.app.app_context():
             client = test_app.test_client()
             for key, value in (cookies or {}).items():
                 client.set_cookie("localhost", key, value)
@@ -1,14 +1,54 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
+import httpx
+from sanic import Sanic
+from sanic.asgi import Lifespan
+
 from .base import HttpClient, Response, merge_cookies
 
+# The client address and base URL used by sanic-testing's ASGI client
+_ASGI_HOST = "mockserver"
+_ASGI_PORT = 1234
+_REJECT_ALL = DefaultCookiePolicy(allowed_domains=[])
+
 
 class SanicHttpClient(HttpClient):
     def __init__(self, app: Any) -> None:
         self.app = app
 
+    @asynccontextmanager
+    async def _create_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        # Test mode lets Sanic start the same app more than once, as
+        # sanic-testing's clients do
+        Sanic.test_mode = True
+        self.app.asgi = True
+        if self.app.router.finalized:
+            self.app.router.reset()
+            self.app.signal_router.reset()
+
+        # The lifespan runs the app's startup and server start and stop
+        # listeners, requests then go straight to the ASGI app
+        lifespan = Lifespan(self.app, {"type": "lifespan"}, None, None)  # type: ignore[arg-type]
+        await lifespan.startup()
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(
+                    app=self.app,
+                    client=(_ASGI_HOST, _ASGI_PORT),
+                ),
+                base_url=f"http://{_ASGI_HOST}:{_ASGI_PORT}",
+            ) as client:
+                # Cookies are sent as a header so none are kept between requests
+                client.cookies.jar.set_policy(_REJECT_ALL)
+                yield client
+        finally:
+            await lifespan.shutdown()
+
     async def request(
         self,
         url: str,
@@ -19,15 +59,16 @@ class SanicHttpClient(HttpClient):
         cookies = kwargs.pop("cookies", None)
         request_headers = merge_cookies(headers, cookies)
 
-        _, response = await self.app.asgi_client.request(
-            method.upper(),
-            url,
-            headers=request_headers,
-            **kwargs,
-        )
+        async with self._get_session() as client:
+            response = await client.request(
+                method.upper(),
+                url,
+                headers=request_headers,
+                **kwargs,
+            )
 
         return Response(
-            status_code=response.status,
-            data=response.body,
+            status_code=response.status_code,
+            data=response.content,
             headers=dict(response.headers),
         )
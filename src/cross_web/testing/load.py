@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .clients.base import HttpClient, RequestSpec
+
+# 2**8 sub-buckets per power of two keep every bucket within 1% of its values
+_SUB_BUCKET_BITS = 8
+_SUB_BUCKET_MASK = (1 << _SUB_BUCKET_BITS) - 1
+
+_Timed = Callable[[int], Awaitable[None]]
+
+
+class LatencyHistogram:
+    """
+    Records latencies in nanoseconds into log-linear buckets, like an HDR
+    histogram. Memory grows with the range of values, not with their number,
+    and percentiles are accurate to within 1%.
+    """
+
+    __slots__ = ("count", "min", "max", "_total", "_counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.min = 0
+        self.max = 0
+        self._total = 0
+        self._counts: Counter[int] = Counter()
+
+    def record(self, value: int) -> None:
+        """Record one latency, in nanoseconds."""
+        value = max(value, 0)
+        shift = max(value.bit_length() - _SUB_BUCKET_BITS, 0)
+
+        self._counts[(shift << _SUB_BUCKET_BITS) + (value >> shift)] += 1
+        self.min = value if self.count == 0 else min(self.min, value)
+        self.max = max(self.max, value)
+        self.count += 1
+        self._total += value
+
+    @property
+    def mean(self) -> float:
+        return self._total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Return the latency, in nanoseconds, below which `percentile` percent
+        of the recorded latencies fall. Returns 0 when nothing was recorded.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+
+        if self.count == 0:
+            return 0
+
+        target = max(math.ceil(self.count * percentile / 100), 1)
+        seen = 0
+
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+
+            if seen >= target:
+                # The highest value that falls into the bucket, capped by the
+                # largest value actually recorded
+                shift = index >> _SUB_BUCKET_BITS
+                highest = ((index & _SUB_BUCKET_MASK) << shift) + (1 << shift) - 1
+
+                return min(highest, self.max)
+
+        return self.max
+
+
+@dataclass
+class LoadResult:
+    """
+    Throughput and latency of a `run_load()` workload. `duration` is the
+    wall-clock duration in seconds, and `errors` counts the requests that
+    raised instead of returning a response.
+    """
+
+    duration: float
+    latency: LatencyHistogram
+    status_codes: Counter[int] = field(default_factory=Counter)
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.latency.count
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def p50(self) -> int:
+        return self.latency.percentile(50)
+
+    @property
+    def p95(self) -> int:
+        return self.latency.percentile(95)
+
+    @property
+    def p99(self) -> int:
+        return self.latency.percentile(99)
+
+    @property
+    def p999(self) -> int:
+        return self.latency.percentile(99.9)
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests:,} requests in {self.duration:.2f} s "
+            f"({self.throughput:,.1f} req/s), {self.errors:,} errors\n"
+            f"latency p50 {_format_ns(self.p50)}, p95 {_format_ns(self.p95)}, "
+            f"p99 {_format_ns(self.p99)}, p99.9 {_format_ns(self.p999)}, "
+            f"max {_format_ns(self.latency.max)}"
+        )
+
+
+async def run_load(
+    client: HttpClient,
+    request: RequestSpec,
+    *,
+    duration: Optional[float] = None,
+    count: Optional[int] = None,
+    concurrency: int = 10,
+    rate: Optional[float] = None,
+) -> LoadResult:
+    """
+    Send `request` through `client` for `duration` seconds, or `count` times,
+    and measure the throughput and latency.
+
+    Without a `rate` the workload is a closed loop: `concurrency` workers
+    each send the next request as soon as the previous one has completed.
+    With a `rate` it is an open loop: requests start at `rate` per second,
+    whether or not the earlier ones have completed, and each latency is
+    measured from the time its request was due to start, so a slow app is
+    not hidden by requests starting late. Sync frameworks send requests from
+    a pool of `concurrency` threads in both modes.
+    """
+    if (duration is None) == (count is None):
+        raise ValueError("Pass either duration or count")
+
+    if rate is not None and rate <= 0:
+        raise ValueError("rate must be positive")
+
+    concurrency = client._check_concurrency(concurrency)
+    result = LoadResult(duration=0.0, latency=LatencyHistogram())
+
+    async with client._concurrent(concurrency) as send:
+
+        async def timed(started: int) -> None:
+            try:
+                response = await send(request)
+            except Exception:
+                result.errors += 1
+                return
+
+            result.latency.record(time.perf_counter_ns() - started)
+            result.status_codes[response.status_code] += 1
+
+        start = time.perf_counter_ns()
+
+        if rate is None:
+            await _closed_loop(timed, start, duration, count, concurrency)
+        else:
+            total = count if count is not None else int((duration or 0) * rate)
+            await _open_loop(timed, start, total, rate)
+
+        result.duration = (time.perf_counter_ns() - start) / 1e9
+
+    return result
+
+
+async def _closed_loop(
+    timed: _Timed,
+    start: int,
+    duration: Optional[float],
+    count: Optional[int],
+    concurrency: int,
+) -> None:
+    deadline = math.inf if duration is None else start + duration * 1e9
+    remaining = math.inf if count is None else count
+
+    async def worker() -> None:
+        nonlocal remaining
+
+        while remaining > 0 and time.perf_counter_ns() < deadline:
+            remaining -= 1
+            await timed(time.perf_counter_ns())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def _open_loop(timed: _Timed, start: int, total: int, rate: float) -> None:
+    interval = 1e9 / rate
+    tasks = []
+
+    for index in range(total):
+        due = start + int(index * interval)
+        delay = due - time.perf_counter_ns()
+
+        if delay > 0:
+            await asyncio.sleep(delay / 1e9)
+
+        tasks.append(asyncio.ensure_future(timed(due)))
+
+    await asyncio.gather(*tasks)
+
+
+def _format_ns(value: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f} {unit}"
+
+    return f"{value:.0f} ns"
+
+
+__all__ = ["LatencyHistogram", "LoadResult", "run_load"]
@@ -0,0 +1,27 @@
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import Union
+
+import pytest
+
+StreamFactory = Callable[
+    [Iterable[bytes]], Union[Iterator[bytes], AsyncIterator[bytes]]
+]
+
+
+def sync_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    yield from chunks
+
+
+async def async_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture(params=["sync", "async"])
+def stream(request: pytest.FixtureRequest) -> StreamFactory:
+    """
+    Build a sync or async iterator over the given chunks, to run a test with
+    both kinds of streaming body. Parametrize `stream` indirectly with
+    `["async"]` to only run the async case.
+    """
+    return sync_chunks if request.param == "sync" else async_chunks
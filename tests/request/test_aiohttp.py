@@ -1,7 +1,10 @@
+import asyncio
+from typing import Any, Optional
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from cross_web import AiohttpHTTPRequestAdapter
+from cross_web import AiohttpHTTPRequestAdapter, HTTPException
 
 pytestmark = [pytest.mark.aiohttp]
 
@@ -36,12 +39,14 @@ async def test_aiohttp_adapter_multipart_on_demand() -> None:
     mock_field1 = AsyncMock(spec=BodyPartReader)
     mock_field1.name = "field1"
     mock_field1.filename = None
-    mock_field1.text = AsyncMock(return_value="value1")
+    mock_field1.read_chunk = AsyncMock(side_effect=[b"value1", b""])
+    mock_field1.decode = MagicMock(side_effect=lambda data: data)
+    mock_field1.get_charset = MagicMock(return_value="utf-8")
 
     mock_field2 = AsyncMock(spec=BodyPartReader)
     mock_field2.name = "file1"
     mock_field2.filename = "test.txt"
-    mock_field2.read = AsyncMock(return_value=b"file content")
+    mock_field2.read_chunk = AsyncMock(side_effect=[b"file content", b""])
 
     # Set up reader to return fields then None
     mock_reader.next = AsyncMock(side_effect=[mock_field1, mock_field2, None])
@@ -53,7 +58,7 @@ async def test_aiohttp_adapter_multipart_on_demand() -> None:
     # Call get_form_data() - this should process multipart data on-demand
     form_data = await adapter.get_form_data()
     assert form_data.form["field1"] == "value1"
-    assert "file1" in form_data.files
+    assert form_data.files["file1"].read() == b"file content"
     mock_request.multipart.assert_called_once()
 
 
@@ -90,3 +95,211 @@ async def test_aiohttp_adapter_urlencoded_form() -> None:
     assert form_data.form == {"field1": "value1", "field2": "value2"}
     assert form_data.files == {}
     mock_request.post.assert_called_once()
+
+
+MULTIPART_BOUNDARY = "cross-web-boundary"
+
+
+def _multipart_request(
+    parts: list[tuple[str, Optional[str], bytes]], *, content_length: bool = True
+) -> Any:
+    from aiohttp import streams
+    from aiohttp.test_utils import make_mocked_request
+
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename:
+            disposition += f'; filename="{filename}"'
+        body += (
+            (
+                f"--{MULTIPART_BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n"
+            ).encode()
+            + content
+            + b"\r\n"
+        )
+    body += f"--{MULTIPART_BOUNDARY}--\r\n".encode()
+
+    protocol = MagicMock(_reading_paused=False)
+    payload = streams.StreamReader(protocol, 2**16, loop=asyncio.get_running_loop())
+    payload.feed_data(body)
+    payload.feed_eof()
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={MULTIPART_BOUNDARY}"}
+    if content_length:
+        headers["Content-Length"] = str(len(body))
+
+    return make_mocked_request("POST", "/", headers=headers, payload=payload)
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_spools_large_files_to_disk() -> None:
+    from cross_web.request._aiohttp import MultipartLimits
+
+    request = _multipart_request(
+        [("name", None, "Grüße".encode()), ("upload", "big.bin", b"x" * 4096)]
+    )
+
+    adapter = await AiohttpHTTPRequestAdapter.create(
+        request, multipart_limits=MultipartLimits(spool_max_size=1024, chunk_size=512)
+    )
+    form_data = await adapter.get_form_data()
+
+    upload = form_data.files["upload"]
+    assert form_data.form == {"name": "Grüße"}
+    assert upload._rolled is True
+    assert upload.read() == b"x" * 4096
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_small_files_stay_in_memory() -> None:
+    request = _multipart_request([("upload", "small.txt", b"hello")])
+
+    adapter = await AiohttpHTTPRequestAdapter.create(request)
+    form_data = await adapter.get_form_data()
+
+    upload = form_data.files["upload"]
+    assert upload._rolled is False
+    assert upload.read() == b"hello"
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_repeated_file_field_closes_replaced_file() -> None:
+    from tempfile import SpooledTemporaryFile
+
+    spooled: list[Any] = []
+
+    class RecordingFile(SpooledTemporaryFile):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            spooled.append(self)
+
+    request = _multipart_request(
+        [("upload", "first.txt", b"first"), ("upload", "second.txt", b"second")]
+    )
+
+    with patch("cross_web.request._aiohttp.SpooledTemporaryFile", RecordingFile):
+        adapter = await AiohttpHTTPRequestAdapter.create(request)
+        form_data = await adapter.get_form_data()
+
+    first, second = spooled
+    assert first.closed
+    assert form_data.files == {"upload": second}
+    assert second.read() == b"second"
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_part_too_large() -> None:
+    from cross_web.request._aiohttp import MultipartLimits
+
+    request = _multipart_request(
+        [("small", "a.txt", b"a" * 10), ("large", "b.txt", b"b" * 2048)]
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await AiohttpHTTPRequestAdapter.create(
+            request, multipart_limits=MultipartLimits(max_part_size=1024)
+        )
+
+    assert exc_info.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_total_too_large() -> None:
+    from cross_web.request._aiohttp import MultipartLimits
+
+    # Without Content-Length the limit can only be enforced while reading
+    request = _multipart_request(
+        [("first", "a.txt", b"a" * 600), ("second", "b.txt", b"b" * 600)],
+        content_length=False,
+    )
+    adapter = AiohttpHTTPRequestAdapter(
+        request,
+        multipart_limits=MultipartLimits(max_part_size=1000, max_size=1000),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await adapter.get_form_data()
+
+    assert exc_info.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_content_length_checked_up_front() -> None:
+    from cross_web.request._aiohttp import MultipartLimits
+
+    request = _multipart_request([("upload", "a.txt", b"a" * 2048)])
+    request.multipart = AsyncMock()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await AiohttpHTTPRequestAdapter.create(
+            request, multipart_limits=MultipartLimits(max_size=1024)
+        )
+
+    assert exc_info.value.status_code == 413
+    request.multipart.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_urlencoded_form_is_cached() -> None:
+    mock_request = AsyncMock()
+    mock_request.headers = {"content-type": "application/x-www-form-urlencoded"}
+    mock_request.post = AsyncMock(return_value={"field1": "value1"})
+    mock_request.read = AsyncMock(return_value=b"field1=value1")
+
+    adapter = AiohttpHTTPRequestAdapter(mock_request)
+
+    form_data = await adapter.get_form_data()
+    assert await adapter.get_form_data() is form_data
+    assert await adapter.get_body() == b"field1=value1"
+    mock_request.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_retain_body() -> None:
+    request = _multipart_request([("name", None, b"value"), ("upload", "a.txt", b"a")])
+
+    adapter = await AiohttpHTTPRequestAdapter.create(request, retain_body=True)
+    form_data = await adapter.get_form_data()
+    body = await adapter.get_body()
+
+    assert form_data.form == {"name": "value"}
+    assert form_data.files["upload"].read() == b"a"
+    assert body.startswith(f"--{MULTIPART_BOUNDARY}".encode())
+    assert body.endswith(f"--{MULTIPART_BOUNDARY}--\r\n".encode())
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_retain_large_body_keeps_reading() -> None:
+    upload = b"x" * (512 * 1024)
+    request = _multipart_request([("upload", "big.bin", upload)])
+    request.protocol._reading_paused = False
+
+    adapter = await AiohttpHTTPRequestAdapter.create(request, retain_body=True)
+    form_data = await adapter.get_form_data()
+
+    assert form_data.files["upload"].read() == upload
+    # Parsing the retained body must not pause reading from the connection
+    request.protocol.pause_reading.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_without_retain_body() -> None:
+    request = _multipart_request([("name", None, b"value")])
+
+    adapter = await AiohttpHTTPRequestAdapter.create(request)
+
+    assert (await adapter.get_form_data()).form == {"name": "value"}
+    assert await adapter.get_body() == b""
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_multipart_after_get_body() -> None:
+    request = _multipart_request([("name", None, b"value")])
+
+    adapter = AiohttpHTTPRequestAdapter(request)
+    body = await adapter.get_body()
+    form_data = await adapter.get_form_data()
+
+    assert form_data.form == {"name": "value"}
+    assert await adapter.get_body() is body
@@ -0,0 +1,152 @@
+from collections.abc import Iterable
+from typing import Any
+
+import pytest
+
+from cross_web import ASGIRequestAdapter, HTTPException
+from cross_web.request import AsyncHTTPRequest
+
+
+def make_scope(**overrides: Any) -> dict[str, Any]:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "scheme": "https",
+        "path": "/graphql",
+        "query_string": b"tag=a&tag=b&page=2",
+        "headers": [
+            (b"host", b"api.example.com"),
+            (b"content-type", b"application/json"),
+            (b"cookie", b'session=abc; theme="dark"'),
+        ],
+        "server": ("127.0.0.1", 8000),
+    }
+    scope.update(overrides)
+    return scope
+
+
+def make_receive(chunks: Iterable[bytes]) -> Any:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks
+    ]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop(0)
+
+    return receive
+
+
+async def no_receive() -> dict[str, Any]:
+    raise AssertionError("receive should not be called")
+
+
+def test_asgi_adapter_properties() -> None:
+    adapter = ASGIRequestAdapter(make_scope(), no_receive)
+
+    assert adapter.method == "POST"
+    assert adapter.query_params == {"tag": "b", "page": "2"}
+    assert adapter.query_params.getlist("tag") == ["a", "b"]
+    assert adapter.path_params == {}
+    assert adapter.headers["Content-Type"] == "application/json"
+    assert adapter.content_type == "application/json"
+    assert adapter.url == "https://api.example.com/graphql?tag=a&tag=b&page=2"
+    assert adapter.cookies == {"session": "abc", "theme": "dark"}
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"server": ("example.com", 443)}, "https://example.com/"),
+        ({"server": ("example.com", 8443)}, "https://example.com:8443/"),
+        ({"server": None}, "/"),
+    ],
+)
+def test_asgi_adapter_url_without_host_header(
+    overrides: dict[str, Any], expected: str
+) -> None:
+    scope = make_scope(path="/", query_string=b"", headers=[], **overrides)
+
+    assert ASGIRequestAdapter(scope, no_receive).url == expected
+
+
+@pytest.mark.asyncio
+async def test_asgi_adapter_body() -> None:
+    request = AsyncHTTPRequest.from_asgi(
+        make_scope(), make_receive([b'{"query": ', b'"{ a }"}'])
+    )
+
+    assert await request.get_body() == b'{"query": "{ a }"}'
+    assert await request.get_json() == {"query": "{ a }"}
+    assert [chunk async for chunk in request.stream()] == [b'{"query": "{ a }"}']
+
+
+@pytest.mark.asyncio
+async def test_asgi_adapter_stream() -> None:
+    adapter = ASGIRequestAdapter(make_scope(), make_receive([b"first", b"second"]))
+
+    assert [chunk async for chunk in adapter.stream()] == [b"first", b"second"]
+
+    with pytest.raises(RuntimeError, match="already been consumed"):
+        await adapter.get_body()
+
+
+@pytest.mark.asyncio
+async def test_asgi_adapter_client_disconnect() -> None:
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.disconnect"}
+
+    adapter = ASGIRequestAdapter(make_scope(), receive)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await adapter.get_body()
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_asgi_adapter_urlencoded_form() -> None:
+    scope = make_scope(
+        headers=[(b"content-type", b"application/x-www-form-urlencoded")]
+    )
+    adapter = ASGIRequestAdapter(scope, make_receive([b"name=J%C3%BCrgen&empty="]))
+
+    form_data = await adapter.get_form_data()
+
+    assert form_data.form == {"name": "Jürgen", "empty": ""}
+    assert form_data.files == {}
+
+
+@pytest.mark.asyncio
+async def test_asgi_adapter_json_body_is_not_form_data() -> None:
+    adapter = ASGIRequestAdapter(make_scope(), make_receive([b'{"a": 1}']))
+
+    form_data = await adapter.get_form_data()
+
+    assert form_data.form == {}
+    assert form_data.files == {}
+    assert await adapter.get_body() == b'{"a": 1}'
+
+
+@pytest.mark.asyncio
+@pytest.mark.starlette
+async def test_asgi_adapter_multipart_form() -> None:
+    body = (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="name"\r\n\r\n'
+        b"value\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="upload"; filename="a.txt"\r\n'
+        b"Content-Type: text/plain\r\n\r\n"
+        b"content\r\n"
+        b"--boundary--\r\n"
+    )
+    scope = make_scope(
+        headers=[(b"content-type", b"multipart/form-data; boundary=boundary")]
+    )
+    adapter = ASGIRequestAdapter(scope, make_receive([body]))
+
+    form_data = await adapter.get_form_data()
+
+    assert form_data.get("name") == "value"
+    assert await form_data.files["upload"].read() == b"content"
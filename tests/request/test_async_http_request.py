@@ -1,4 +1,5 @@
 import pytest
+from cross_web.exceptions import HTTPException
 from cross_web.request import AsyncHTTPRequest
 from cross_web.request._base import FormData
 from cross_web.request._testing import TestingRequestAdapter
@@ -41,6 +42,27 @@ async def test_async_http_request_get_body() -> None:
     assert body == b'{"data": "test"}'
 
 
+@pytest.mark.asyncio
+async def test_async_http_request_get_json() -> None:
+    adapter = TestingRequestAdapter(json={"data": "test"})
+    request = AsyncHTTPRequest(adapter)
+
+    result = await request.get_json()
+    assert result == {"data": "test"}
+    assert await request.get_json() is result
+
+
+@pytest.mark.asyncio
+async def test_async_http_request_get_json_invalid() -> None:
+    adapter = TestingRequestAdapter()  # empty body
+    request = AsyncHTTPRequest(adapter)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await request.get_json()
+
+    assert exc_info.value.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_async_http_request_get_form_data() -> None:
     form_data = FormData(
@@ -1,4 +1,15 @@
-from cross_web.request._base import FormData
+from typing import Any
+
+import pytest
+
+from cross_web.request._base import (
+    FormData,
+    Headers,
+    MemoizedMixin,
+    QueryParams,
+    memoized_property,
+    parse_cookie_header,
+)
 
 
 def test_form_data_creation() -> None:
@@ -42,3 +53,181 @@ def test_form_data_empty() -> None:
     assert form_data.files == {}
     assert form_data.form == {}
     assert form_data.get("anything") is None
+
+
+class Counter(MemoizedMixin):
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @memoized_property
+    def value(self) -> int:
+        """The number of times the getter ran."""
+        self.calls += 1
+        return self.calls
+
+
+def test_memoized_property_computes_once() -> None:
+    counter = Counter()
+
+    assert counter.value == 1
+    assert counter.value == 1
+    assert counter.calls == 1
+
+
+def test_memoized_property_is_per_instance() -> None:
+    first, second = Counter(), Counter()
+
+    assert first.value == 1
+    assert second.value == 1
+    assert second.calls == 1
+
+
+def test_memoized_property_works_with_slots() -> None:
+    counter = Counter()
+
+    assert counter.value == 1
+    assert not hasattr(counter, "__dict__")
+
+
+def test_memoized_property_on_class_returns_descriptor() -> None:
+    descriptor = Counter.value
+
+    assert isinstance(descriptor, memoized_property)
+    assert descriptor.__doc__ == "The number of times the getter ran."
+
+
+def test_query_params_wraps_mapping() -> None:
+    query_params = QueryParams({"a": "1", "b": "2"})
+
+    assert query_params["a"] == "1"
+    assert query_params.get("missing") is None
+    assert "b" in query_params
+    assert len(query_params) == 2
+    assert query_params == {"a": "1", "b": "2"}
+    assert query_params.getlist("a") == ["1"]
+    assert query_params.getlist("missing") == []
+    assert QueryParams() == {}
+
+    with pytest.raises(KeyError):
+        query_params["missing"]
+
+
+def _native_query_params(framework: str) -> Any:
+    items = [("a", "1"), ("a", "2"), ("b", "3")]
+
+    if framework == "starlette":
+        from starlette.datastructures import QueryParams as StarletteQueryParams
+
+        return StarletteQueryParams(items)
+    if framework == "flask":
+        from werkzeug.datastructures import ImmutableMultiDict
+
+        return ImmutableMultiDict(items)
+    if framework == "aiohttp":
+        from multidict import MultiDict, MultiDictProxy
+
+        return MultiDictProxy(MultiDict(items))
+    if framework == "sanic":
+        from sanic.request.parameters import RequestParameters
+
+        return RequestParameters({"a": ["1", "2"], "b": ["3"]})
+    if framework == "chalice":
+        from chalice.app import MultiDict as ChaliceMultiDict
+
+        return ChaliceMultiDict({"a": ["1", "2"], "b": ["3"]})
+
+    raise AssertionError(framework)
+
+
+@pytest.mark.parametrize(
+    ("framework", "first"),
+    [
+        pytest.param("starlette", "2", marks=pytest.mark.starlette),
+        pytest.param("flask", "1", marks=pytest.mark.flask),
+        pytest.param("aiohttp", "1", marks=pytest.mark.aiohttp),
+        pytest.param("sanic", "1", marks=pytest.mark.sanic),
+        pytest.param("chalice", "2", marks=pytest.mark.chalice),
+    ],
+)
+def test_query_params_multi_values(framework: str, first: str) -> None:
+    query_params = QueryParams(_native_query_params(framework))
+
+    # Single values keep each framework's own choice for repeated keys
+    assert query_params["a"] == first
+    assert query_params.getlist("a") == ["1", "2"]
+    assert query_params.getlist("missing") == []
+    assert list(query_params) == ["a", "b"]
+    assert len(query_params) == 2
+    assert query_params.multi_items() == [("a", "1"), ("a", "2"), ("b", "3")]
+
+
+def test_headers_case_insensitive() -> None:
+    headers = Headers({"Content-Type": "text/plain", "X-Custom": "value"})
+
+    assert headers["content-type"] == "text/plain"
+    assert headers.get("CONTENT-TYPE") == "text/plain"
+    assert headers.get("missing") is None
+    assert headers.get("missing", "default") == "default"
+    assert "x-custom" in headers
+    assert list(headers) == ["content-type", "x-custom"]
+    assert headers == {"content-type": "text/plain", "X-CUSTOM": "value"}
+    assert Headers() == {}
+
+    with pytest.raises(KeyError):
+        headers["missing"]
+
+
+def test_headers_from_raw_is_lazy() -> None:
+    raw = [(b"Accept", b"text/html"), (b"accept", b"application/json")]
+    headers = Headers.from_raw(raw)
+
+    assert headers._items is None
+    assert headers["accept"] == "text/html"
+    assert headers.getlist("Accept") == ["text/html", "application/json"]
+    assert headers.getlist("missing") == []
+    assert len(headers) == 1
+    assert headers.multi_items() == [
+        ("accept", "text/html"),
+        ("accept", "application/json"),
+    ]
+
+
+def test_headers_from_wsgi() -> None:
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": "",
+        "HTTP_X_REQUEST_ID": "abc",
+        "HTTP_USER_AGENT": "test",
+    }
+    headers = Headers.from_wsgi(environ)
+
+    assert headers == {
+        "Content-Type": "application/json",
+        "X-Request-Id": "abc",
+        "User-Agent": "test",
+    }
+
+
+def test_query_params_from_query_string() -> None:
+    query_params = QueryParams.from_query_string(b"a=1&a=2&b=&c=%C3%BC")
+
+    assert query_params == {"a": "2", "b": "", "c": "ü"}
+    assert query_params.getlist("a") == ["1", "2"]
+    assert query_params.getlist("missing") == []
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, {}),
+        ("", {}),
+        ("a=1", {"a": "1"}),
+        (" a = 1 ; b=2;c", {"a": "1", "b": "2"}),
+        ('token="x=y"', {"token": "x=y"}),
+    ],
+)
+def test_parse_cookie_header(header: str, expected: dict[str, str]) -> None:
+    assert parse_cookie_header(header) == expected
@@ -74,3 +74,13 @@ async def test_litestar_adapter_empty_form() -> None:
     form_data = await adapter.get_form_data()
     assert form_data.form == {}
     assert form_data.files == {}
+
+
+def test_litestar_adapter_content_type_is_memoized() -> None:
+    mock_request = Mock()
+    mock_request.content_type = ("text/plain", {"charset": "utf-8"})
+
+    adapter = LitestarRequestAdapter(mock_request)
+
+    assert adapter.content_type is adapter.content_type
+    assert adapter.content_type == "text/plain; charset=utf-8"
@@ -80,3 +80,20 @@ async def test_starlette_adapter_form_only() -> None:
     assert (
         form_data.files == mock_form_data
     )  # In Starlette adapter, both point to same data
+
+
+def test_starlette_adapter_query_params_getlist() -> None:
+    """Test that repeated query parameters are kept"""
+    from starlette.requests import Request
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"tag=a&tag=b&page=2",
+        "headers": [],
+    }
+    adapter = StarletteRequestAdapter(Request(scope))
+
+    assert adapter.query_params == {"tag": "b", "page": "2"}
+    assert adapter.query_params.getlist("tag") == ["a", "b"]
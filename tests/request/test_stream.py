@@ -0,0 +1,168 @@
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from cross_web.request import AsyncHTTPRequest
+from cross_web.request._base import iter_chunks
+from cross_web.request._testing import TestingRequestAdapter
+
+CHUNKS = [b"first ", b"second ", b"third"]
+
+
+def make_receive(chunks: list[bytes]) -> Any:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop(0)
+
+    return receive
+
+
+def make_scope() -> dict[str, Any]:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [],
+    }
+
+
+async def collect(stream: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+def test_iter_chunks() -> None:
+    assert list(iter_chunks(b"abcdefg", 3)) == [b"abc", b"def", b"g"]
+    assert list(iter_chunks(b"abc", 3)) == [b"abc"]
+    assert list(iter_chunks(b"", 3)) == []
+
+
+def test_iter_chunks_does_not_copy_small_bodies() -> None:
+    body = b"small body"
+
+    assert next(iter_chunks(body)) is body
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_to_buffered_body() -> None:
+    request = AsyncHTTPRequest(TestingRequestAdapter(json={"key": "value"}))
+
+    chunks = await collect(request.stream(chunk_size=4))
+
+    assert chunks == [b'{"ke', b'y": ', b'"val', b'ue"}']
+
+
+@pytest.mark.asyncio
+@pytest.mark.starlette
+async def test_starlette_stream() -> None:
+    from starlette.requests import Request
+
+    request = AsyncHTTPRequest.from_starlette(
+        Request(make_scope(), make_receive(CHUNKS))
+    )
+
+    assert await collect(request.stream()) == CHUNKS
+
+
+@pytest.mark.asyncio
+@pytest.mark.litestar
+async def test_litestar_stream() -> None:
+    from litestar import Request
+
+    scope = make_scope()
+    scope["route_handler"] = Mock(resolve_request_max_body_size=Mock(return_value=None))
+    request = AsyncHTTPRequest.from_litestar(Request(scope, make_receive(CHUNKS)))
+
+    assert await collect(request.stream()) == CHUNKS
+
+
+@pytest.mark.asyncio
+@pytest.mark.aiohttp
+async def test_aiohttp_stream_reads_incrementally() -> None:
+    from aiohttp.test_utils import make_mocked_request
+
+    content = Mock()
+
+    async def iter_chunked(chunk_size: int) -> AsyncIterator[bytes]:
+        assert chunk_size == 6
+        for chunk in CHUNKS:
+            yield chunk
+
+    content.iter_chunked = iter_chunked
+    request = AsyncHTTPRequest.from_aiohttp(
+        make_mocked_request("POST", "/", payload=content)
+    )
+
+    assert await collect(request.stream(chunk_size=6)) == CHUNKS
+
+
+@pytest.mark.asyncio
+@pytest.mark.aiohttp
+async def test_aiohttp_stream_uses_pre_read_body() -> None:
+    from aiohttp.test_utils import make_mocked_request
+
+    from cross_web.request._aiohttp import AiohttpHTTPRequestAdapter
+
+    adapter = AiohttpHTTPRequestAdapter(
+        make_mocked_request("POST", "/"), body=b"".join(CHUNKS)
+    )
+
+    assert await collect(adapter.stream(chunk_size=6)) == [
+        b"first ",
+        b"second",
+        b" third",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.quart
+async def test_quart_stream() -> None:
+    from quart import Quart, request
+
+    from cross_web.request._quart import QuartHTTPRequestAdapter
+
+    app = Quart(__name__)
+    received: list[bytes] = []
+
+    @app.post("/")
+    async def index() -> str:
+        received.extend(await collect(QuartHTTPRequestAdapter(request).stream()))
+        return "ok"
+
+    response = await app.test_client().post("/", data=b"".join(CHUNKS))
+
+    assert response.status_code == 200
+    assert b"".join(received) == b"".join(CHUNKS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.sanic
+async def test_sanic_stream_on_streaming_route() -> None:
+    from cross_web.request._sanic import SanicHTTPRequestAdapter
+
+    async def stream() -> AsyncIterator[bytes]:
+        for chunk in CHUNKS:
+            yield chunk
+
+    sanic_request = Mock(body=b"", stream=stream())
+
+    assert await collect(SanicHTTPRequestAdapter(sanic_request).stream()) == CHUNKS
+
+
+@pytest.mark.asyncio
+@pytest.mark.sanic
+async def test_sanic_stream_on_buffered_route() -> None:
+    from cross_web.request._sanic import SanicHTTPRequestAdapter
+
+    sanic_request = Mock(body=b"buffered body", stream=Mock())
+
+    assert await collect(SanicHTTPRequestAdapter(sanic_request).stream(8)) == [
+        b"buffered",
+        b" body",
+    ]
@@ -0,0 +1,145 @@
+from io import BytesIO
+from typing import Any, Optional
+
+import pytest
+
+from cross_web import HTTPException, SyncHTTPRequest, WSGIRequestAdapter
+
+
+def make_environ(
+    body: bytes = b"", content_type: Optional[str] = None, **overrides: Any
+) -> dict[str, Any]:
+    environ = {
+        "REQUEST_METHOD": "post",
+        "SCRIPT_NAME": "",
+        "PATH_INFO": "/webhook",
+        "QUERY_STRING": "tag=a&tag=b&page=2",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "8000",
+        "HTTP_HOST": "api.example.com",
+        "HTTP_COOKIE": "session=abc; theme=dark",
+        "HTTP_X_SIGNATURE": "sha256=123",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.url_scheme": "https",
+        "wsgi.input": BytesIO(body),
+    }
+    if content_type is not None:
+        environ["CONTENT_TYPE"] = content_type
+    environ.update(overrides)
+    return environ
+
+
+def test_wsgi_adapter_properties() -> None:
+    adapter = WSGIRequestAdapter(
+        make_environ(
+            content_type="application/json",
+            **{"wsgiorg.routing_args": ((), {"id": "1"})},
+        )
+    )
+
+    assert adapter.method == "POST"
+    assert adapter.query_params == {"tag": "b", "page": "2"}
+    assert adapter.query_params.getlist("tag") == ["a", "b"]
+    assert adapter.path_params == {"id": "1"}
+    assert adapter.headers["X-Signature"] == "sha256=123"
+    assert adapter.content_type == "application/json"
+    assert adapter.url == "https://api.example.com/webhook?tag=a&tag=b&page=2"
+    assert adapter.cookies == {"session": "abc", "theme": "dark"}
+
+
+def test_wsgi_adapter_defaults() -> None:
+    environ = {"REQUEST_METHOD": "GET", "wsgi.input": BytesIO()}
+    adapter = WSGIRequestAdapter(environ)
+
+    assert adapter.query_params == {}
+    assert adapter.path_params == {}
+    assert adapter.headers == {}
+    assert adapter.content_type is None
+    assert adapter.cookies == {}
+    assert adapter.body == b""
+
+
+def test_wsgi_adapter_stream_is_bounded_by_content_length() -> None:
+    environ = make_environ(b"0123456789")
+    environ["wsgi.input"] = BytesIO(b"0123456789 trailing data")
+    adapter = WSGIRequestAdapter(environ)
+
+    assert list(adapter.stream(chunk_size=4)) == [b"0123", b"4567", b"89"]
+
+    with pytest.raises(RuntimeError, match="already been consumed"):
+        adapter.body
+
+
+def test_wsgi_adapter_without_content_length() -> None:
+    environ = make_environ(b"chunked")
+    del environ["CONTENT_LENGTH"]
+
+    assert WSGIRequestAdapter(environ).body == b""
+
+    environ["wsgi.input"].seek(0)
+    environ["wsgi.input_terminated"] = True
+
+    assert WSGIRequestAdapter(environ).body == b"chunked"
+
+
+def test_wsgi_adapter_urlencoded_form() -> None:
+    adapter = WSGIRequestAdapter(
+        make_environ(
+            b"name=J%C3%BCrgen&empty=",
+            content_type="application/x-www-form-urlencoded",
+        )
+    )
+
+    form_data = adapter.get_form_data()
+
+    assert form_data.form == {"name": "Jürgen", "empty": ""}
+    assert form_data.files == {}
+    # The body stays available after parsing the form
+    assert adapter.body == b"name=J%C3%BCrgen&empty="
+
+
+def test_wsgi_adapter_multipart_not_supported() -> None:
+    adapter = WSGIRequestAdapter(
+        make_environ(b"", content_type="multipart/form-data; boundary=x")
+    )
+
+    with pytest.raises(NotImplementedError):
+        adapter.get_form_data()
+
+
+def test_sync_http_request_from_wsgi() -> None:
+    request = SyncHTTPRequest.from_wsgi(
+        make_environ(b'{"event": "push"}', content_type="application/json")
+    )
+
+    assert request.method == "POST"
+    assert request.headers.get("x-signature") == "sha256=123"
+    assert request.get_body() == b'{"event": "push"}'
+    assert request.get_json() == {"event": "push"}
+    assert request.get_json() is request.get_json()
+    assert list(request.stream(chunk_size=8)) == [b'{"event"', b': "push"', b"}"]
+
+
+def test_sync_http_request_invalid_json() -> None:
+    request = SyncHTTPRequest.from_wsgi(make_environ(b"{invalid"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        request.get_json()
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.flask
+def test_sync_http_request_from_flask() -> None:
+    from flask import Flask
+
+    app = Flask(__name__)
+
+    with app.test_request_context(
+        "/items?tag=a&tag=b", method="POST", data=b"payload"
+    ) as context:
+        request = SyncHTTPRequest.from_flask(context.request)
+
+        assert request.method == "POST"
+        assert request.query_params.getlist("tag") == ["a", "b"]
+        assert request.get_body() == b"payload"
@@ -0,0 +1,181 @@
+import pytest
+
+from cross_web import Cookie, Response
+
+
+def make_response() -> Response:
+    return Response(
+        status_code=201,
+        body=bytearray(b"created"),
+        headers={"Content-Type": "text/plain", "X-Request-Id": "42"},
+        cookies=[
+            Cookie(name="session", value="abc", secure=True, max_age=60),
+            Cookie(name="theme", value="dark", secure=False, samesite="strict"),
+        ],
+    )
+
+
+@pytest.mark.django
+def test_to_django() -> None:
+    from django.http import HttpResponse
+
+    django_response = make_response().to_django()
+
+    assert isinstance(django_response, HttpResponse)
+    assert django_response.status_code == 201
+    assert django_response["Content-Type"] == "text/plain"
+    assert django_response["X-Request-Id"] == "42"
+    assert django_response.content == b"created"
+    assert django_response.cookies["session"].value == "abc"
+    assert django_response.cookies["session"]["max-age"] == 60
+    assert django_response.cookies["session"]["path"] == "/"
+    assert django_response.cookies["theme"]["samesite"] == "strict"
+
+
+@pytest.mark.django
+def test_to_django_without_body() -> None:
+    assert Response(status_code=204).to_django().content == b""
+
+
+@pytest.mark.flask
+def test_to_flask() -> None:
+    from flask import Flask
+
+    app = Flask(__name__)
+    app.add_url_rule("/", "view", lambda: make_response().to_flask())
+
+    response = app.test_client().get("/")
+
+    assert response.status_code == 201
+    assert response.headers["Content-Type"] == "text/plain"
+    assert response.headers["X-Request-Id"] == "42"
+    assert response.data == b"created"
+
+    cookies = response.headers.getlist("Set-Cookie")
+    assert "session=abc" in cookies[0]
+    assert "Max-Age=60" in cookies[0]
+    assert "SameSite=Strict" in cookies[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.aiohttp
+async def test_to_aiohttp() -> None:
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def view(request: web.Request) -> web.Response:
+        return make_response().to_aiohttp()
+
+    app = web.Application()
+    app.router.add_get("/", view)
+
+    async with TestClient(TestServer(app)) as client:
+        response = await client.get("/")
+
+        assert response.status == 201
+        assert response.headers["Content-Type"] == "text/plain"
+        assert response.headers["X-Request-Id"] == "42"
+        assert response.cookies["session"].value == "abc"
+        assert response.cookies["theme"]["samesite"] == "Strict"
+        assert await response.read() == b"created"
+
+
+@pytest.mark.aiohttp
+def test_to_aiohttp_text_body() -> None:
+    aiohttp_response = Response(status_code=200, body="héllo").to_aiohttp()
+
+    assert aiohttp_response.body == "héllo".encode()
+    assert aiohttp_response.content_type == "text/plain"
+
+
+@pytest.mark.asyncio
+@pytest.mark.sanic
+async def test_to_sanic() -> None:
+    from sanic import Request, Sanic
+    from sanic.response import HTTPResponse
+
+    app = Sanic("test_to_sanic")
+
+    @app.get("/")
+    async def view(request: Request) -> HTTPResponse:
+        return make_response().to_sanic()
+
+    _, response = await app.asgi_client.get("/")
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "text/plain"
+    assert response.headers["x-request-id"] == "42"
+    assert response.cookies["session"] == "abc"
+    assert response.content == b"created"
+
+
+@pytest.mark.asyncio
+@pytest.mark.quart
+async def test_to_quart() -> None:
+    from quart import Quart
+    from quart import Response as QuartResponse
+
+    app = Quart(__name__)
+
+    @app.route("/")
+    async def view() -> QuartResponse:
+        return make_response().to_quart()
+
+    response = await app.test_client().get("/")
+
+    assert response.status_code == 201
+    assert response.headers["Content-Type"] == "text/plain"
+    assert response.headers["X-Request-Id"] == "42"
+    assert await response.get_data() == b"created"
+    assert "session=abc" in response.headers.getlist("Set-Cookie")[0]
+
+
+@pytest.mark.litestar
+def test_to_litestar() -> None:
+    from litestar import Litestar, get
+    from litestar import Response as LitestarResponse
+    from litestar.testing import TestClient
+
+    @get("/")
+    async def view() -> LitestarResponse[bytes]:
+        return make_response().to_litestar()
+
+    with TestClient(Litestar([view])) as client:
+        response = client.get("/")
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "text/plain"
+    assert response.headers["x-request-id"] == "42"
+    assert response.cookies["session"] == "abc"
+    assert response.content == b"created"
+
+
+@pytest.mark.chalice
+def test_to_chalice() -> None:
+    chalice_response = make_response().to_chalice().to_dict()
+
+    assert chalice_response["statusCode"] == 201
+    assert chalice_response["body"] == b"created"
+    assert chalice_response["headers"] == {
+        "Content-Type": "text/plain",
+        "X-Request-Id": "42",
+    }
+    assert chalice_response["multiValueHeaders"]["Set-Cookie"] == [
+        "session=abc; Path=/; Max-Age=60; Secure; HttpOnly; SameSite=Lax",
+        "theme=dark; Path=/; HttpOnly; SameSite=Strict",
+    ]
+
+
+@pytest.mark.chalice
+def test_to_chalice_quotes_cookie_values() -> None:
+    response = Response(
+        status_code=200,
+        cookies=[Cookie(name="name", value="a b;c", secure=False)],
+    )
+
+    chalice_response = response.to_chalice().to_dict()
+
+    assert chalice_response["body"] == b""
+    assert chalice_response["multiValueHeaders"]["Set-Cookie"] == [
+        'name="a b\\073c"; Path=/; HttpOnly; SameSite=Lax'
+    ]
@@ -33,3 +33,41 @@ def test_redirect() -> None:
 
     assert fastapi_response.status_code == 302
     assert fastapi_response.headers["Location"] == "https://example.com"
+
+
+def test_binary_bodies_are_not_copied() -> None:
+    payload = bytearray(b"x" * 1024)
+
+    fastapi_response = Response(status_code=200, body=payload).to_fastapi()
+
+    assert isinstance(fastapi_response.body, memoryview)
+    assert fastapi_response.body.obj is payload
+    assert fastapi_response.headers["content-length"] == "1024"
+
+    data = b"y" * 1024
+    assert Response(status_code=200, body=data).to_fastapi().body is data
+
+
+def test_non_byte_memoryview_body() -> None:
+    from array import array
+
+    fastapi_response = Response(
+        status_code=200, body=memoryview(array("H", [1, 2]))
+    ).to_fastapi()
+
+    assert fastapi_response.headers["content-length"] == "4"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        memoryview(b"abcd").cast("B", (2, 2)),
+        memoryview(b"aabbccdd")[::2],
+    ],
+    ids=["2d", "non_contiguous"],
+)
+def test_irregular_memoryview_body(body: memoryview) -> None:
+    fastapi_response = Response(status_code=200, body=body).to_fastapi()
+
+    assert fastapi_response.headers["content-length"] == "4"
+    assert bytes(fastapi_response.body) == body.tobytes()
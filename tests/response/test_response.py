@@ -1,4 +1,8 @@
-from cross_web import Response
+from __future__ import annotations
+
+import pytest
+
+from cross_web import RedirectTemplate, Response
 
 
 def test_redirect() -> None:
@@ -21,3 +25,79 @@ def test_redirect_with_headers() -> None:
     assert response.headers is not None
     assert response.headers["Location"] == "https://example.com"
     assert response.headers["X-Test"] == "test"
+
+
+def test_redirect_with_list_query_params() -> None:
+    response = Response.redirect("https://example.com", {"scope": ["a", "b"]})
+    assert response.headers is not None
+    assert response.headers["Location"] == "https://example.com?scope=a&scope=b"
+
+
+@pytest.mark.parametrize("status_code", [301, 302, 303, 307, 308])
+def test_redirect_status_code(status_code: int) -> None:
+    response = Response.redirect("/login", status_code=status_code)
+    assert response.status_code == status_code
+
+
+def test_redirect_rejects_non_redirect_status() -> None:
+    with pytest.raises(ValueError):
+        Response.redirect("/login", status_code=200)
+
+
+def test_redirect_template() -> None:
+    authorize = RedirectTemplate(
+        "https://auth.example.com/authorize",
+        {"client_id": "app", "scope": ["openid", "email"]},
+        status_code=303,
+        headers={"Cache-Control": "no-store"},
+    )
+
+    response = authorize({"state": "a b"}, cookies=[])
+
+    assert response.status_code == 303
+    assert response.cookies == []
+    assert response.headers == {
+        "Location": (
+            "https://auth.example.com/authorize"
+            "?client_id=app&scope=openid&scope=email&state=a+b"
+        ),
+        "Cache-Control": "no-store",
+    }
+
+
+def test_redirect_template_matches_redirect() -> None:
+    template = RedirectTemplate("https://example.com")
+
+    assert template({"a": "1"}) == Response.redirect("https://example.com", {"a": "1"})
+    assert template() == Response.redirect("https://example.com")
+
+
+@pytest.mark.parametrize(
+    ("url", "query_params", "location"),
+    [
+        ("/next?page=2", {"a": "1"}, "/next?page=2&a=1"),
+        ("/next?", {"a": "1"}, "/next?a=1"),
+        ("/next#section", {"a": "1"}, "/next?a=1#section"),
+        ("/next?page=2#section", None, "/next?page=2#section"),
+    ],
+)
+def test_redirect_template_url_parts(
+    url: str, query_params: dict[str, str] | None, location: str
+) -> None:
+    response = RedirectTemplate(url)(query_params)
+
+    assert response.headers is not None
+    assert response.headers["Location"] == location
+
+
+def test_redirect_template_static_and_extra_headers() -> None:
+    template = RedirectTemplate("/done#top", {"from": "login"}, headers={"X-A": "1"})
+
+    response = template({"user": "1"}, headers={"X-A": "2"})
+
+    assert response.headers == {"Location": "/done?from=login&user=1#top", "X-A": "2"}
+
+
+def test_redirect_template_rejects_non_redirect_status() -> None:
+    with pytest.raises(ValueError):
+        RedirectTemplate("/login", status_code=404)
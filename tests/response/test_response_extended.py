@@ -1,3 +1,9 @@
+from array import array
+from dataclasses import FrozenInstanceError
+from typing import Any, Optional
+
+import pytest
+
 from cross_web.response import Cookie, Response
 
 
@@ -36,6 +42,60 @@ def test_cookie_defaults() -> None:
     assert cookie.samesite == "lax"  # Default
 
 
+def test_cookie_is_frozen_and_hashable() -> None:
+    cookie = Cookie(name="session", value="abc", secure=True)
+
+    with pytest.raises(FrozenInstanceError):
+        cookie.value = "changed"  # type: ignore[misc]
+
+    assert {cookie, Cookie(name="session", value="abc", secure=True)} == {cookie}
+
+
+def test_cookie_to_header() -> None:
+    cookie = Cookie(
+        name="session",
+        value="abc123",
+        secure=True,
+        path="/admin",
+        domain="example.com",
+        max_age=3600,
+        samesite="strict",
+    )
+
+    assert cookie.to_header() == (
+        "session=abc123; Domain=example.com; Path=/admin; Max-Age=3600; "
+        "Secure; HttpOnly; SameSite=Strict"
+    )
+
+
+def test_cookie_to_header_is_shared_between_equal_cookies() -> None:
+    first = Cookie(name="csrf", value="token", secure=True)
+    second = Cookie(name="csrf", value="token", secure=True)
+
+    assert first is not second
+    assert first.to_header() is second.to_header()
+
+
+def test_cookie_to_header_quotes_values() -> None:
+    cookie = Cookie(name="data", value='a "b";c', secure=False, httponly=False)
+
+    assert cookie.to_header() == 'data="a \\"b\\"\\073c"; Path=/; SameSite=Lax'
+
+
+@pytest.mark.parametrize(
+    "cookie",
+    [
+        Cookie(name="bad name", value="value", secure=True),
+        Cookie(name="", value="value", secure=True),
+        Cookie(name="name", value="value", secure=True, path="/a;b"),
+        Cookie(name="name", value="value", secure=True, domain="example.com\n"),
+    ],
+)
+def test_cookie_to_header_rejects_invalid_cookies(cookie: Cookie) -> None:
+    with pytest.raises(ValueError):
+        cookie.to_header()
+
+
 def test_response_json_valid() -> None:
     response = Response(status_code=200, body='{"key": "value", "number": 42}')
 
@@ -65,6 +125,58 @@ def test_response_json_array() -> None:
     assert result == [1, 2, 3]
 
 
+def test_json_response() -> None:
+    data = {"key": "value", "items": [1, 2]}
+
+    response = Response.json_response(
+        data, status_code=201, headers={"X-Custom": "value"}
+    )
+
+    assert response.status_code == 201
+    assert response.body == b'{"key": "value", "items": [1, 2]}'
+    assert response.content_length == len(response.body)
+    assert response.headers == {
+        "Content-Type": "application/json",
+        "X-Custom": "value",
+    }
+    assert response.json() is data
+
+
+def test_json_response_header_override() -> None:
+    response = Response.json_response(
+        [], headers={"Content-Type": "application/problem+json"}
+    )
+
+    assert response.headers == {"Content-Type": "application/problem+json"}
+
+
+def test_json_response_lowercase_header_override() -> None:
+    response = Response.json_response(
+        {"a": 1}, headers={"content-type": "application/problem+json"}
+    )
+
+    assert response.headers == {"content-type": "application/problem+json"}
+
+
+def test_json_response_decodes_replaced_body() -> None:
+    response = Response.json_response({"key": "value"})
+    response.body = b'{"key": "other"}'
+
+    assert response.json() == {"key": "other"}
+
+
+def test_json_response_uses_configured_codec() -> None:
+    from cross_web.codecs import set_json_codec
+
+    set_json_codec("msgspec")
+    try:
+        response = Response.json_response({"key": "value"})
+    finally:
+        set_json_codec("json")
+
+    assert response.body == b'{"key":"value"}'
+
+
 def test_response_with_cookies() -> None:
     cookies = [
         Cookie(name="session", value="123", secure=True),
@@ -117,3 +229,38 @@ def test_to_fastapi_with_cookies() -> None:
     assert len(response.cookies) > 0
     assert response.cookies[0].name == "auth"
     assert response.cookies[0].secure is True
+
+
+@pytest.mark.parametrize(
+    ("body", "content_length"),
+    [
+        (None, None),
+        ("", 0),
+        ("hello", 5),
+        ("héllo", 6),
+        (b"hello", 5),
+        (bytearray(b"hello"), 5),
+        (memoryview(b"hello"), 5),
+        (memoryview(array("H", [1, 2, 3])), 6),
+    ],
+)
+def test_response_content_length(body: Any, content_length: Optional[int]) -> None:
+    assert Response(status_code=200, body=body).content_length == content_length
+
+
+def test_response_content_length_follows_the_body() -> None:
+    response = Response(status_code=200, body="héllo")
+    assert response.content_length == 6
+
+    response.body = "héllo, wörld"
+    assert response.content_length == 14
+
+    response.body = None
+    assert response.content_length is None
+
+
+@pytest.mark.parametrize(
+    "body", [b"[1, 2]", bytearray(b"[1, 2]"), memoryview(b"[1, 2]")]
+)
+def test_response_json_binary_body(body: Any) -> None:
+    assert Response(status_code=200, body=body).json() == [1, 2]
@@ -45,31 +45,17 @@ async def test_to_fastapi_with_all_cookie_params() -> None:
             status_code=200, headers={"X-Custom": "Header"}, content="Success"
         )
 
-        # Verify set_cookie was called for each cookie with all params
-        assert mock_fastapi_response.set_cookie.call_count == 2
-
-        # First cookie call
-        mock_fastapi_response.set_cookie.assert_any_call(
-            "session",
-            "abc123",
-            secure=True,
-            path="/api",
-            domain="example.com",
-            max_age=3600,
-            httponly=True,
-            samesite="strict",
-        )
-
-        # Second cookie call
-        mock_fastapi_response.set_cookie.assert_any_call(
-            "prefs",
-            "dark_mode",
-            secure=False,
-            path=None,
-            domain=None,
-            max_age=None,
-            httponly=False,
-            samesite="lax",
+        # Cookies are appended as pre-serialized Set-Cookie headers
+        mock_fastapi_response.set_cookie.assert_not_called()
+        mock_fastapi_response.raw_headers.extend.assert_called_once_with(
+            [
+                (
+                    b"set-cookie",
+                    b"session=abc123; Domain=example.com; Path=/api; "
+                    b"Max-Age=3600; Secure; HttpOnly; SameSite=Strict",
+                ),
+                (b"set-cookie", b"prefs=dark_mode; Path=/; SameSite=Lax"),
+            ]
         )
 
         assert result is mock_fastapi_response
@@ -0,0 +1,129 @@
+from typing import Any
+
+import pytest
+
+from cross_web.response import Cookie, Response, StreamingResponse
+
+
+class Sent:
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        self.messages.append(message)
+
+
+@pytest.mark.asyncio
+async def test_send_asgi() -> None:
+    response = Response(
+        status_code=201,
+        body="héllo",
+        headers={"Content-Type": "text/plain; charset=utf-8"},
+        cookies=[Cookie(name="session", value="abc", secure=True)],
+    )
+    send = Sent()
+
+    await response.send_asgi(send)
+
+    assert send.messages == [
+        {
+            "type": "http.response.start",
+            "status": 201,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", b"6"),
+                (b"set-cookie", b"session=abc; Path=/; Secure; HttpOnly; SameSite=Lax"),
+            ],
+        },
+        {"type": "http.response.body", "body": "héllo".encode()},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_asgi_binary_body() -> None:
+    send = Sent()
+
+    await Response(status_code=200, body=memoryview(b"data")).send_asgi(send)
+
+    assert send.messages[0]["headers"] == [(b"content-length", b"4")]
+    assert send.messages[1]["body"] == b"data"
+    assert type(send.messages[1]["body"]) is bytes
+
+
+@pytest.mark.asyncio
+async def test_send_asgi_body_replaced_after_construction() -> None:
+    send = Sent()
+    response = Response(status_code=200, body=b"old")
+    response.body = b"longer"
+
+    await response.send_asgi(send)
+
+    assert send.messages[0]["headers"] == [(b"content-length", b"6")]
+    assert send.messages[1]["body"] == b"longer"
+
+
+@pytest.mark.asyncio
+async def test_send_asgi_keeps_explicit_content_length() -> None:
+    send = Sent()
+    response = Response(status_code=200, headers={"Content-Length": "0"})
+
+    await response.send_asgi(send)
+
+    assert send.messages[0]["headers"] == [(b"content-length", b"0")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [204, 304])
+async def test_send_asgi_without_body(status_code: int) -> None:
+    send = Sent()
+
+    await Response(status_code=status_code, body="ignored").send_asgi(send)
+
+    assert send.messages[0]["headers"] == []
+    assert send.messages[1]["body"] == b""
+
+
+@pytest.mark.asyncio
+async def test_streaming_send_asgi(stream: Any) -> None:
+    response = StreamingResponse(
+        status_code=200,
+        headers={"Content-Type": "text/csv"},
+        stream=stream([b"a,", b"b"]),
+    )
+    send = Sent()
+
+    await response.send_asgi(send)
+
+    assert send.messages == [
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/csv")],
+        },
+        {"type": "http.response.body", "body": b"a,", "more_body": True},
+        {"type": "http.response.body", "body": b"b", "more_body": True},
+        {"type": "http.response.body", "body": b""},
+    ]
+
+
+@pytest.mark.starlette
+def test_send_asgi_from_asgi_app() -> None:
+    from starlette.testclient import TestClient
+
+    response = Response(
+        status_code=200,
+        body=b'{"ok": true}',
+        headers={"Content-Type": "application/json"},
+        cookies=[Cookie(name="session", value="abc", secure=False)],
+    )
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        await response.send_asgi(send)
+
+    client_response = TestClient(app).get("/")
+
+    assert client_response.status_code == 200
+    assert client_response.headers["content-type"] == "application/json"
+    assert client_response.headers["content-length"] == "12"
+    assert client_response.cookies["session"] == "abc"
+    assert client_response.json() == {"ok": True}
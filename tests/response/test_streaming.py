@@ -0,0 +1,188 @@
+from typing import Any
+
+import pytest
+
+from cross_web import Cookie
+from cross_web.response import StreamingResponse
+
+CHUNKS = [b"first,", b"second,", b"third"]
+
+
+def make_response(stream: object) -> StreamingResponse:
+    return StreamingResponse(
+        status_code=200,
+        headers={"Content-Type": "text/csv"},
+        cookies=[Cookie(name="session", value="abc", secure=True)],
+        stream=stream,  # type: ignore[arg-type]
+    )
+
+
+def test_streaming_response_defaults() -> None:
+    response = StreamingResponse(status_code=204)
+
+    assert list(response.stream) == []  # type: ignore[arg-type]
+    assert response.body is None
+
+
+@pytest.mark.fastapi
+def test_to_fastapi(stream: Any) -> None:
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse as FastAPIStreamingResponse
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+
+    @app.get("/")
+    def export() -> FastAPIStreamingResponse:
+        return make_response(stream(CHUNKS)).to_fastapi()
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv"
+    assert response.cookies["session"] == "abc"
+    assert response.content == b"".join(CHUNKS)
+
+
+@pytest.mark.django
+def test_to_django() -> None:
+    from django.http import StreamingHttpResponse
+
+    django_response = make_response(iter(CHUNKS)).to_django()
+
+    assert isinstance(django_response, StreamingHttpResponse)
+    assert django_response.status_code == 200
+    assert django_response["Content-Type"] == "text/csv"
+    assert django_response.cookies["session"].value == "abc"
+    assert django_response.cookies["session"]["path"] == "/"
+    assert b"".join(django_response.streaming_content) == b"".join(CHUNKS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django
+@pytest.mark.parametrize("stream", ["async"], indirect=True)
+async def test_to_django_async_iterator(stream: Any) -> None:
+    django_response = make_response(stream(CHUNKS)).to_django()
+
+    assert django_response.is_async
+    assert [chunk async for chunk in django_response.streaming_content] == CHUNKS
+
+
+@pytest.mark.flask
+def test_to_flask() -> None:
+    from flask import Flask
+
+    app = Flask(__name__)
+    app.add_url_rule("/", "export", lambda: make_response(iter(CHUNKS)).to_flask())
+
+    response = app.test_client().get("/")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/csv"
+    assert response.is_streamed
+    assert response.data == b"".join(CHUNKS)
+    assert "session=abc" in response.headers["Set-Cookie"]
+
+
+@pytest.mark.flask
+@pytest.mark.parametrize("stream", ["async"], indirect=True)
+def test_to_flask_rejects_async_iterators(stream: Any) -> None:
+    with pytest.raises(TypeError):
+        make_response(stream(CHUNKS)).to_flask()
+
+
+@pytest.mark.asyncio
+@pytest.mark.aiohttp
+async def test_to_aiohttp(stream: Any) -> None:
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def export(request: web.Request) -> web.Response:
+        return make_response(stream(CHUNKS)).to_aiohttp()
+
+    app = web.Application()
+    app.router.add_get("/", export)
+
+    async with TestClient(TestServer(app)) as client:
+        response = await client.get("/")
+
+        assert response.status == 200
+        assert response.headers["Content-Type"] == "text/csv"
+        assert response.cookies["session"].value == "abc"
+        assert await response.read() == b"".join(CHUNKS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.sanic
+async def test_to_sanic(stream: Any) -> None:
+    from sanic import Request, Sanic
+    from sanic.response import ResponseStream
+
+    app = Sanic(f"test_to_sanic_{stream.__name__}")
+
+    @app.get("/")
+    async def export(request: Request) -> ResponseStream:
+        return make_response(stream(CHUNKS)).to_sanic()
+
+    _, response = await app.asgi_client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv"
+    assert response.cookies["session"] == "abc"
+    assert response.content == b"".join(CHUNKS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.quart
+async def test_to_quart(stream: Any) -> None:
+    from quart import Quart
+    from quart import Response as QuartResponse
+
+    app = Quart(__name__)
+
+    @app.route("/")
+    async def export() -> QuartResponse:
+        return make_response(stream(CHUNKS)).to_quart()
+
+    response = await app.test_client().get("/")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/csv"
+    assert "session=abc" in response.headers["Set-Cookie"]
+    assert await response.get_data() == b"".join(CHUNKS)
+
+
+@pytest.mark.litestar
+def test_to_litestar(stream: Any) -> None:
+    from litestar import Litestar, get
+    from litestar.response import Stream
+    from litestar.testing import TestClient
+
+    @get("/")
+    async def export() -> Stream:
+        return make_response(stream(CHUNKS)).to_litestar()
+
+    with TestClient(Litestar([export])) as client:
+        response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv"
+    assert response.cookies["session"] == "abc"
+    assert response.content == b"".join(CHUNKS)
+
+
+@pytest.mark.chalice
+def test_to_chalice_buffers_sync_iterables() -> None:
+    chalice_response = make_response(iter(CHUNKS)).to_chalice().to_dict()
+
+    assert chalice_response["body"] == b"".join(CHUNKS)
+    assert chalice_response["multiValueHeaders"]["Set-Cookie"] == [
+        "session=abc; Path=/; Secure; HttpOnly; SameSite=Lax"
+    ]
+
+
+@pytest.mark.chalice
+@pytest.mark.parametrize("stream", ["async"], indirect=True)
+def test_to_chalice_rejects_async_iterators(stream: Any) -> None:
+    with pytest.raises(TypeError):
+        make_response(stream(CHUNKS)).to_chalice()
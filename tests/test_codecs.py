@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+
+import pytest
+
+from cross_web.codecs import (
+    MsgspecJSONCodec,
+    StdlibJSONCodec,
+    get_json_codec,
+    register_json_codec,
+    set_json_codec,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_codec() -> Iterator[None]:
+    yield
+    set_json_codec("json")
+
+
+def test_default_codec_is_stdlib() -> None:
+    assert isinstance(get_json_codec(), StdlibJSONCodec)
+
+
+def test_set_codec_by_name() -> None:
+    set_json_codec("msgspec")
+
+    assert isinstance(get_json_codec(), MsgspecJSONCodec)
+
+
+def test_set_codec_instance() -> None:
+    codec = StdlibJSONCodec()
+    set_json_codec(codec)
+
+    assert get_json_codec() is codec
+
+
+def test_set_unknown_codec() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON codec: 'nope'"):
+        set_json_codec("nope")
+
+
+def test_register_codec() -> None:
+    register_json_codec("custom", StdlibJSONCodec)
+    set_json_codec("custom")
+
+    assert isinstance(get_json_codec(), StdlibJSONCodec)
+
+
+@pytest.mark.parametrize("name", ["json", "msgspec", "orjson"])
+def test_codec_round_trip(name: str) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+
+    set_json_codec(name)
+    codec = get_json_codec()
+
+    data = {"a": [1, 2.5, None, True], "b": "ü"}
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == data
+    assert codec.loads(encoded.decode()) == data
+    assert codec.loads(memoryview(encoded)) == data
+
+
+@pytest.mark.parametrize("name", ["json", "msgspec", "orjson"])
+def test_codec_invalid_json_raises_value_error(name: str) -> None:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+
+    set_json_codec(name)
+
+    with pytest.raises(ValueError):
+        get_json_codec().loads(b"{invalid")
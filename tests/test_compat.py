@@ -0,0 +1,116 @@
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from typing import Optional
+
+import pytest
+
+from cross_web._compat import _add_slots, slotted_dataclass
+from cross_web.request import AsyncHTTPRequest
+from cross_web.request._aiohttp import AiohttpHTTPRequestAdapter
+from cross_web.request._base import FormData
+from cross_web.request._chalice import ChaliceHTTPRequestAdapter
+from cross_web.request._django import (
+    AsyncDjangoHTTPRequestAdapter,
+    DjangoHTTPRequestAdapter,
+)
+from cross_web.request._flask import (
+    AsyncFlaskHTTPRequestAdapter,
+    FlaskHTTPRequestAdapter,
+)
+from cross_web.request._litestar import LitestarRequestAdapter
+from cross_web.request._quart import QuartHTTPRequestAdapter
+from cross_web.request._sanic import SanicHTTPRequestAdapter
+from cross_web.request._starlette import StarletteRequestAdapter
+from cross_web.request._testing import TestingRequestAdapter
+from cross_web.response import Cookie, Response
+
+
+@slotted_dataclass
+class Point:
+    x: int
+    y: int = 0
+
+
+def test_slotted_dataclass() -> None:
+    point = Point(1)
+
+    assert point == Point(1, 0)
+    assert repr(point) == "Point(x=1, y=0)"
+    assert not hasattr(point, "__dict__")
+
+
+def test_frozen_slotted_dataclass() -> None:
+    @slotted_dataclass(frozen=True)
+    class FrozenPoint:
+        x: int
+        y: int = 0
+
+    point = FrozenPoint(1)
+
+    assert hash(point) == hash(FrozenPoint(1, 0))
+    assert not hasattr(point, "__dict__")
+
+    with pytest.raises(FrozenInstanceError):
+        point.x = 2  # type: ignore[misc]
+
+
+def test_add_slots_fallback() -> None:
+    @dataclass
+    class Base:
+        name: str
+        value: Optional[int] = None
+
+    SlottedBase = _add_slots(Base)
+
+    @dataclass
+    class Child(SlottedBase):  # type: ignore[valid-type,misc]
+        extra: bool = False
+
+    SlottedChild = _add_slots(Child)
+
+    instance = SlottedChild("a", extra=True)
+
+    assert SlottedBase.__slots__ == ("name", "value")
+    assert SlottedChild.__slots__ == ("extra",)
+    assert [field.name for field in fields(instance)] == ["name", "value", "extra"]
+    assert instance == SlottedChild("a", None, True)
+    assert not hasattr(instance, "__dict__")
+
+    with pytest.raises(AttributeError):
+        instance.other = 1
+
+
+def test_add_slots_fallback_sets_init_false_defaults() -> None:
+    @dataclass(frozen=True)
+    class Base:
+        name: str
+        cached: Optional[int] = field(default=None, init=False)
+
+    instance = _add_slots(Base)("a")
+
+    assert instance.cached is None
+    assert not hasattr(instance, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        FormData(files={}, form={}),
+        Response(status_code=200),
+        Cookie(name="session", value="abc", secure=True),
+        AsyncHTTPRequest(TestingRequestAdapter()),
+        TestingRequestAdapter(),
+        AiohttpHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        ChaliceHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        DjangoHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        AsyncDjangoHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        FlaskHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        AsyncFlaskHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        LitestarRequestAdapter(None),  # type: ignore[arg-type]
+        QuartHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        SanicHTTPRequestAdapter(None),  # type: ignore[arg-type]
+        StarletteRequestAdapter(None),  # type: ignore[arg-type]
+    ],
+    ids=lambda instance: type(instance).__name__,
+)
+def test_per_request_types_have_no_instance_dict(instance: object) -> None:
+    assert not hasattr(instance, "__dict__")
@@ -0,0 +1,238 @@
+import asyncio
+import zlib
+from io import BytesIO
+from typing import Any, Optional
+
+import pytest
+
+import cross_web.compression
+from cross_web import AsyncHTTPRequest, SyncHTTPRequest
+from cross_web.compression import Compression, _GzipEncoder
+from cross_web.request._testing import TestingRequestAdapter
+from cross_web.response import Response, StreamingResponse
+
+BODY = b"cross-web " * 200
+
+
+def make_request(accept_encoding: Optional[str] = "gzip") -> AsyncHTTPRequest:
+    headers = {} if accept_encoding is None else {"Accept-Encoding": accept_encoding}
+    return AsyncHTTPRequest(TestingRequestAdapter(headers=headers))
+
+
+def gunzip(data: bytes) -> bytes:
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "encoding"),
+    [
+        (None, None),
+        ("", None),
+        ("gzip", "gzip"),
+        ("GZIP, deflate", "gzip"),
+        ("deflate", None),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("*, gzip;q=0", None),
+        ("identity;q=1, gzip;q=0.5", "gzip"),
+        ("gzip;q=invalid", None),
+    ],
+)
+def test_negotiate(accept_encoding: Optional[str], encoding: Optional[str]) -> None:
+    compression = Compression(encodings=["gzip"])
+
+    assert compression.negotiate(accept_encoding) == encoding
+
+
+def test_negotiate_prefers_client_quality_then_server_order(monkeypatch: Any) -> None:
+    # Negotiation does not depend on brotli or zstandard being installed
+    monkeypatch.setitem(cross_web.compression._ENCODERS, "br", _GzipEncoder)
+    monkeypatch.setitem(cross_web.compression._ENCODERS, "zstd", _GzipEncoder)
+    compression = Compression()
+
+    assert compression.negotiate("gzip, br, zstd") == "br"
+    assert compression.negotiate("gzip, br;q=0.5, zstd;q=0.8") == "gzip"
+    assert compression.negotiate("br;q=0.5, zstd;q=0.5") == "br"
+
+
+def test_unsupported_encoding() -> None:
+    with pytest.raises(ValueError, match="Unsupported encoding: 'deflate'"):
+        Compression(encodings=["deflate"])
+
+
+def test_encodings_without_library_are_skipped(monkeypatch: Any) -> None:
+    def missing(level: int) -> Any:
+        raise ImportError
+
+    monkeypatch.setitem(cross_web.compression._ENCODERS, "br", missing)
+
+    assert Compression(encodings=["br", "gzip"]).encodings == ("gzip",)
+
+
+@pytest.mark.asyncio
+async def test_compress() -> None:
+    response = Response(
+        status_code=200,
+        body=BODY.decode(),
+        headers={"Content-Type": "text/plain", "content-length": "2000"},
+    )
+
+    compressed = await Compression().compress(make_request(), response)
+
+    assert compressed is not response
+    assert gunzip(compressed.body) == BODY  # type: ignore[arg-type]
+    assert compressed.content_length == len(compressed.body)  # type: ignore[arg-type]
+    assert compressed.headers == {
+        "Content-Type": "text/plain",
+        "Content-Encoding": "gzip",
+        "Vary": "Accept-Encoding",
+    }
+
+
+@pytest.mark.asyncio
+async def test_compress_keeps_json() -> None:
+    data = {"items": list(range(1_000))}
+
+    compressed = await Compression().compress(
+        make_request(), Response.json_response(data)
+    )
+
+    assert compressed.headers is not None
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.json() is data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response",
+    [
+        Response(status_code=200, body=b"small"),
+        Response(status_code=200),
+        Response(status_code=204, body=BODY),
+        Response(status_code=200, body=BODY, headers={"Content-Encoding": "br"}),
+    ],
+)
+async def test_compress_skips(response: Response) -> None:
+    assert await Compression().compress(make_request(), response) is response
+
+
+@pytest.mark.asyncio
+async def test_compress_skips_when_not_accepted() -> None:
+    response = Response(status_code=200, body=BODY)
+
+    assert await Compression().compress(make_request(None), response) is response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("vary", "expected"),
+    [
+        ("Cookie", "Cookie, Accept-Encoding"),
+        ("accept-encoding", "accept-encoding"),
+        ("*", "*"),
+    ],
+)
+async def test_compress_merges_vary(vary: str, expected: str) -> None:
+    response = Response(status_code=200, body=BODY, headers={"vary": vary})
+
+    compressed = await Compression().compress(make_request(), response)
+
+    assert compressed.headers is not None
+    assert compressed.headers["Vary"] == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("etag", "expected"), [('"abc"', 'W/"abc"'), ('W/"abc"', 'W/"abc"')]
+)
+async def test_compress_weakens_etags(etag: str, expected: str) -> None:
+    response = Response(status_code=200, body=BODY, headers={"ETag": etag})
+
+    compressed = await Compression().compress(make_request(), response)
+
+    assert compressed.headers is not None
+    assert compressed.headers["ETag"] == expected
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_compressed_in_a_thread(monkeypatch: Any) -> None:
+    calls = []
+    to_thread = asyncio.to_thread
+
+    async def record(func: Any, *args: Any) -> Any:
+        calls.append(func)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", record)
+    compression = Compression(thread_threshold=len(BODY))
+
+    await compression.compress(make_request(), Response(status_code=200, body=BODY))
+    assert len(calls) == 1
+
+    await compression.compress(
+        make_request(), Response(status_code=200, body=BODY[:-1])
+    )
+    assert len(calls) == 1
+
+
+CHUNKS = [BODY, b"", BODY]
+
+
+@pytest.mark.asyncio
+async def test_compress_stream(stream: Any) -> None:
+    response = StreamingResponse(status_code=200, stream=stream(CHUNKS))
+
+    compressed = await Compression().compress(make_request(), response)
+
+    assert isinstance(compressed, StreamingResponse)
+    assert compressed.headers == {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    chunks = [decompressor.decompress(chunk) async for chunk in compressed.stream]  # type: ignore[union-attr]
+
+    # Every chunk is flushed, so it can be decoded as soon as it arrives
+    assert chunks[0] == BODY
+    assert b"".join(chunks) == BODY * 2
+    assert decompressor.eof
+
+
+def test_compress_sync() -> None:
+    request = SyncHTTPRequest.from_wsgi(
+        {
+            "REQUEST_METHOD": "GET",
+            "HTTP_ACCEPT_ENCODING": "gzip",
+            "wsgi.input": BytesIO(),
+        }
+    )
+    compression = Compression()
+
+    compressed = compression.compress_sync(
+        request, Response(status_code=200, body=BODY)
+    )
+    assert gunzip(compressed.body) == BODY  # type: ignore[arg-type]
+
+    streamed = compression.compress_sync(
+        request, StreamingResponse(status_code=200, stream=iter(CHUNKS))
+    )
+    assert gunzip(b"".join(streamed.stream)) == BODY * 2  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("encoding", "module"), [("br", "brotli"), ("zstd", "zstandard")]
+)
+async def test_optional_encodings(encoding: str, module: str) -> None:
+    library = pytest.importorskip(module)
+    compression = Compression(encodings=[encoding])
+
+    compressed = await compression.compress(
+        make_request(encoding), Response(status_code=200, body=BODY)
+    )
+
+    assert compressed.headers is not None
+    assert compressed.headers["Content-Encoding"] == encoding
+
+    if module == "brotli":
+        assert library.decompress(compressed.body) == BODY
+    else:
+        assert library.ZstdDecompressor().decompress(compressed.body) == BODY
@@ -0,0 +1,243 @@
+from datetime import datetime, timezone
+from io import BytesIO
+from typing import Any, Optional
+
+import pytest
+
+from cross_web import AsyncHTTPRequest, SyncHTTPRequest
+from cross_web.conditional import (
+    compute_etag,
+    conditional_response,
+    conditional_response_sync,
+)
+from cross_web.request._base import HTTPMethod
+from cross_web.request._testing import TestingRequestAdapter
+from cross_web.response import Cookie, Response, StreamingResponse
+
+BODY = b'{"items": [1, 2, 3]}'
+ETAG = compute_etag(BODY)
+LAST_MODIFIED = datetime(2024, 5, 1, 12, 30, 15, 500, tzinfo=timezone.utc)
+
+
+def make_request(method: HTTPMethod = "GET", **headers: str) -> AsyncHTTPRequest:
+    headers = {name.replace("_", "-"): value for name, value in headers.items()}
+    return AsyncHTTPRequest(TestingRequestAdapter(method=method, headers=headers))
+
+
+def make_response(**headers: str) -> Response:
+    return Response(
+        status_code=200,
+        body=BODY,
+        headers={"Content-Type": "application/json", **headers},
+        cookies=[Cookie(name="session", value="abc", secure=True)],
+    )
+
+
+def test_compute_etag() -> None:
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert len(ETAG) == 34
+    assert compute_etag(BODY, weak=True) == f"W/{ETAG}"
+    assert compute_etag(BODY.decode()) == ETAG
+    assert compute_etag(bytearray(BODY)) == ETAG
+    assert compute_etag(memoryview(BODY)) == ETAG
+    assert compute_etag(None) == compute_etag(b"")
+    assert compute_etag(b"other") != ETAG
+
+
+@pytest.mark.asyncio
+async def test_adds_etag() -> None:
+    response = await conditional_response(make_request(), make_response())
+
+    assert response.status_code == 200
+    assert response.body == BODY
+    assert response.headers == {"Content-Type": "application/json", "ETag": ETAG}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "if_none_match",
+    [ETAG, f"W/{ETAG}", f'"other", {ETAG}', "*"],
+)
+async def test_if_none_match(if_none_match: str) -> None:
+    response = await conditional_response(
+        make_request(If_None_Match=if_none_match),
+        make_response(**{"Cache-Control": "max-age=60", "X-Extra": "1"}),
+    )
+
+    assert response.status_code == 304
+    assert response.body is None
+    assert response.headers == {"Cache-Control": "max-age=60", "ETag": ETAG}
+    assert response.cookies == [Cookie(name="session", value="abc", secure=True)]
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_mismatch() -> None:
+    response = await conditional_response(
+        make_request(If_None_Match='"other"'), make_response()
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_uses_existing_etag() -> None:
+    response = await conditional_response(
+        make_request(If_None_Match='"v2"'), make_response(etag='"v2"')
+    )
+
+    assert response.status_code == 304
+    assert response.headers == {"ETag": '"v2"'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("if_modified_since", "status_code"),
+    [
+        ("Wed, 01 May 2024 12:30:15 GMT", 304),
+        ("Thu, 02 May 2024 00:00:00 GMT", 304),
+        ("Wed, 01 May 2024 12:30:14 GMT", 200),
+        ("not a date", 200),
+    ],
+)
+async def test_if_modified_since(if_modified_since: str, status_code: int) -> None:
+    response = await conditional_response(
+        make_request(If_Modified_Since=if_modified_since),
+        make_response(),
+        last_modified=LAST_MODIFIED,
+    )
+
+    assert response.status_code == status_code
+
+    if status_code == 200:
+        assert response.headers is not None
+        assert response.headers["Last-Modified"] == "Wed, 01 May 2024 12:30:15 GMT"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("if_modified_since", "status_code"),
+    [
+        ("Wed, 01 May 2024 12:30:15 GMT", 304),
+        ("Wed, 01 May 2024 12:30:14 GMT", 200),
+    ],
+)
+async def test_if_modified_since_naive_last_modified(
+    if_modified_since: str, status_code: int
+) -> None:
+    response = await conditional_response(
+        make_request(If_Modified_Since=if_modified_since),
+        make_response(),
+        last_modified=LAST_MODIFIED.replace(tzinfo=None),
+    )
+
+    assert response.status_code == status_code
+
+    if status_code == 200:
+        assert response.headers is not None
+        assert response.headers["Last-Modified"] == "Wed, 01 May 2024 12:30:15 GMT"
+
+
+@pytest.mark.asyncio
+async def test_if_modified_since_from_header() -> None:
+    response = await conditional_response(
+        make_request(If_Modified_Since="Wed, 01 May 2024 12:30:15 GMT"),
+        make_response(**{"Last-Modified": "Wed, 01 May 2024 12:30:15 GMT"}),
+    )
+
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_takes_precedence() -> None:
+    response = await conditional_response(
+        make_request(
+            If_None_Match='"other"',
+            If_Modified_Since="Wed, 01 May 2024 12:30:15 GMT",
+        ),
+        make_response(),
+        last_modified=LAST_MODIFIED,
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method", "status_code"), [("POST", 200), ("GET", 404), ("GET", 304)]
+)
+async def test_skips_uncacheable(method: HTTPMethod, status_code: int) -> None:
+    response = Response(status_code=status_code, body=BODY)
+
+    result = await conditional_response(
+        make_request(method, If_None_Match="*"), response
+    )
+
+    assert result is response
+
+
+CHUNKS = [BODY[:5], BODY[5:]]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response(stream: Any) -> None:
+    response = await conditional_response(
+        make_request(), StreamingResponse(status_code=200, stream=stream(CHUNKS))
+    )
+
+    assert isinstance(response, StreamingResponse)
+    assert response.headers == {"ETag": ETAG}
+    assert b"".join(response.stream) == BODY  # type: ignore[arg-type]
+
+    not_modified = await conditional_response(
+        make_request(If_None_Match=ETAG),
+        StreamingResponse(status_code=200, stream=stream(CHUNKS)),
+    )
+
+    assert not_modified.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_with_etag_is_not_buffered() -> None:
+    chunks = iter(CHUNKS)
+
+    response = await conditional_response(
+        make_request(),
+        StreamingResponse(status_code=200, stream=chunks, headers={"ETag": '"v1"'}),
+    )
+
+    assert isinstance(response, StreamingResponse)
+    assert response.stream is chunks
+    assert response.headers == {"ETag": '"v1"'}
+
+
+def make_sync_request(if_none_match: Optional[str] = None) -> SyncHTTPRequest:
+    environ: dict[str, Any] = {"REQUEST_METHOD": "GET", "wsgi.input": BytesIO()}
+
+    if if_none_match is not None:
+        environ["HTTP_IF_NONE_MATCH"] = if_none_match
+
+    return SyncHTTPRequest.from_wsgi(environ)
+
+
+def test_conditional_response_sync() -> None:
+    response = conditional_response_sync(make_sync_request(), make_response())
+    assert response.headers is not None
+    assert response.headers["ETag"] == ETAG
+
+    response = conditional_response_sync(make_sync_request(ETAG), make_response())
+    assert response.status_code == 304
+
+    streamed = conditional_response_sync(
+        make_sync_request(ETAG),
+        StreamingResponse(status_code=200, stream=iter(CHUNKS)),
+    )
+    assert streamed.status_code == 304
+
+
+@pytest.mark.parametrize("stream", ["async"], indirect=True)
+def test_conditional_response_sync_rejects_async_streams(stream: Any) -> None:
+    with pytest.raises(TypeError):
+        conditional_response_sync(
+            make_sync_request(),
+            StreamingResponse(status_code=200, stream=stream(CHUNKS)),
+        )
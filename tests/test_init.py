@@ -0,0 +1,36 @@
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import cross_web
+
+
+def test_all_exports_resolve() -> None:
+    for name in cross_web.__all__:
+        module = import_module(cross_web._LAZY_IMPORTS[name], "cross_web")
+
+        assert getattr(cross_web, name) is getattr(module, name)
+
+
+def test_exports_are_listed_in_dir() -> None:
+    assert set(cross_web.__all__) <= set(dir(cross_web))
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        cross_web.Missing  # type: ignore[attr-defined]
+
+
+def test_importing_response_does_not_load_adapters() -> None:
+    code = (
+        "import sys\n"
+        "from cross_web import Response\n"
+        "print(sorted(m for m in sys.modules if m.startswith('cross_web.request')))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.strip() == "[]"
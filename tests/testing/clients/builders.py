@@ -6,13 +6,7 @@ from collections.abc import Mapping
 from typing import Any
 from urllib.parse import urlsplit
 
-
-def get_content_type(headers: Mapping[str, str]) -> str | None:
-    for key, value in headers.items():
-        if key.lower() == "content-type":
-            return value
-
-    return None
+from cross_web.request._base import Headers
 
 
 def normalize_cookies(cookies: Mapping[str, object]) -> dict[str, str]:
@@ -43,12 +37,15 @@ def build_result(
     post_form_value: object | None = None,
     files_has_file: bool | None = None,
 ) -> dict[str, object]:
+    # Every adapter exposes the same case-insensitive header view
+    assert isinstance(adapter.headers, Headers)
+
     url = urlsplit(str(adapter.url))
     result: dict[str, object] = {
         "query_params": dict(adapter.query_params),
         "path_params": dict(adapter.path_params),
         "method": adapter.method,
-        "header_content_type": get_content_type(dict(adapter.headers)),
+        "header_content_type": adapter.headers.get("Content-Type"),
         "content_type": adapter.content_type,
         "url_path": url.path,
         "url_query": url.query,
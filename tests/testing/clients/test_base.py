@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, cast
 
 import pytest
 
-from cross_web.testing.clients.base import HttpClient, Response, merge_cookies
+from cross_web.testing.clients.base import (
+    HttpClient,
+    RequestSpec,
+    Response,
+    SyncHttpClient,
+    merge_cookies,
+)
 
 
 class DummyHttpClient:
@@ -97,3 +107,128 @@ def test_merge_cookies_merges_existing_cookie_header() -> None:
         "X-Test": "1",
         "Cookie": "session=new; theme=dark; user=patrick",
     }
+
+
+class SessionHttpClient(HttpClient):
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.events: list[str] = []
+
+    @asynccontextmanager
+    async def _create_session(self) -> AsyncIterator[str]:
+        self.events.append("open")
+        yield f"session {len(self.events)}"
+        self.events.append("close")
+
+    async def request(
+        self,
+        url: str,
+        method: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        async with self._get_session() as session:
+            return Response(status_code=200, data=session.encode())
+
+
+@pytest.mark.asyncio
+async def test_http_client_session_lifecycle() -> None:
+    client = SessionHttpClient(app=None)
+
+    assert (await client.get("/")).text == "session 1"
+    assert client.events == ["open", "close"]
+
+    async with client:
+        assert (await client.get("/")).text == "session 3"
+        assert (await client.get("/")).text == "session 3"
+
+        with pytest.raises(RuntimeError, match="SessionHttpClient is already open"):
+            await client.__aenter__()
+
+    assert client.events == ["open", "close", "open", "close"]
+    assert (await client.get("/")).text == "session 5"
+
+
+class ConcurrencyHttpClient(HttpClient):
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def request(
+        self,
+        url: str,
+        method: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+        return Response(status_code=200, data=f"{method} {url}".encode())
+
+
+@pytest.mark.asyncio
+async def test_http_client_gather_limits_concurrency() -> None:
+    client = ConcurrencyHttpClient(app=None)
+
+    responses = await client.gather(
+        [RequestSpec(f"/{index}", "post") for index in range(20)], concurrency=3
+    )
+
+    assert [response.text for response in responses] == [
+        f"post /{index}" for index in range(20)
+    ]
+    assert client.most_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_http_client_gather_respects_max_concurrency() -> None:
+    client = ConcurrencyHttpClient(app=None)
+    client.max_concurrency = 1
+
+    await client.gather([RequestSpec("/") for _ in range(5)], concurrency=3)
+
+    assert client.most_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_http_client_gather_rejects_invalid_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await ConcurrencyHttpClient(app=None).gather([], concurrency=0)
+
+
+class ThreadedHttpClient(SyncHttpClient):
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.threads: set[int] = set()
+        self.barrier = threading.Barrier(2)
+
+    def _request_sync(
+        self,
+        session: Any,
+        url: str,
+        method: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        # Both requests must be in flight at once to pass the barrier
+        self.barrier.wait(timeout=5)
+        self.threads.add(threading.get_ident())
+
+        return Response(status_code=200, data=url.encode())
+
+
+@pytest.mark.asyncio
+async def test_sync_http_client_gather_uses_threads() -> None:
+    client = ThreadedHttpClient(app=None)
+
+    responses = await client.gather(
+        [RequestSpec("/a"), RequestSpec("/b")], concurrency=2
+    )
+
+    assert [response.text for response in responses] == ["/a", "/b"]
+    assert len(client.threads) == 2
+    assert threading.get_ident() not in client.threads
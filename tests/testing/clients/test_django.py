@@ -45,27 +45,25 @@ def test_sync_build_request_data_preserves_content_type_for_bytes() -> None:
     assert request_kwargs == {"content_type": "application/octet-stream"}
 
 
-@pytest.mark.asyncio
-async def test_sync_do_request_handles_http404() -> None:
+def test_sync_do_request_handles_http404() -> None:
     def view(request: HttpRequest) -> HttpResponse:
         raise Http404
 
     client = DjangoHttpClient(view)
 
-    response = await client._do_request(RequestFactory().get("/"))
+    response = client._do_request(RequestFactory().get("/"))
 
     assert response.status_code == 404
     assert response.data == b"Not found"
 
 
-@pytest.mark.asyncio
-async def test_sync_do_request_handles_bad_request() -> None:
+def test_sync_do_request_handles_bad_request() -> None:
     def view(request: HttpRequest) -> HttpResponse:
         raise BadRequest("bad request")
 
     client = DjangoHttpClient(view)
 
-    response = await client._do_request(RequestFactory().get("/"))
+    response = client._do_request(RequestFactory().get("/"))
 
     assert response.status_code == 400
     assert response.data == b"bad request"
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
 import pytest
 
 pytest.importorskip("flask")
 
 from flask import Flask
 
-from cross_web.testing.clients.flask import FlaskHttpClient
+from cross_web.testing import RequestSpec
+from cross_web.testing.clients.flask import AsyncFlaskHttpClient, FlaskHttpClient
 
 pytestmark = [pytest.mark.flask]
 
@@ -31,3 +37,128 @@ def test_build_request_kwargs_requires_mapping_for_files() -> None:
             json_data=None,
             files={"file": ("test.txt", b"body", None)},
         )
+
+
+def create_loop_app() -> tuple[Flask, dict[str, object]]:
+    app = Flask(__name__)
+    seen: dict[str, object] = {}
+
+    @app.get("/sync")
+    def sync_view() -> str:
+        seen["thread"] = threading.current_thread().name
+        return "ok"
+
+    @app.get("/async")
+    async def async_view() -> str:
+        seen["loop"] = asyncio.get_running_loop()
+        return "ok"
+
+    return app, seen
+
+
+def pool_threads(prefix: str) -> list[threading.Thread]:
+    threads = [
+        thread for thread in threading.enumerate() if thread.name.startswith(prefix)
+    ]
+
+    # Shut down pools don't wait for their workers, give them time to exit
+    for thread in threads:
+        thread.join(timeout=1)
+
+    return [thread for thread in threads if thread.is_alive()]
+
+
+@pytest.mark.asyncio
+async def test_session_uses_its_own_executor() -> None:
+    app, seen = create_loop_app()
+    client = FlaskHttpClient(app, max_workers=2, thread_name_prefix="flask-session")
+
+    async with client:
+        response = await client.get("/sync")
+        executor = client._session.executor
+
+        assert response.status_code == 200
+        assert str(seen["thread"]).startswith("flask-session")
+        assert executor._max_workers == 2
+
+    assert executor._shutdown
+    assert pool_threads("flask-session") == []
+
+
+@pytest.mark.asyncio
+async def test_aclose_shuts_down_the_executor() -> None:
+    app, _ = create_loop_app()
+    client = await FlaskHttpClient(app, thread_name_prefix="flask-aclose").__aenter__()
+    await client.get("/sync")
+    executor = client._session.executor
+
+    await client.aclose()
+
+    assert executor._shutdown
+    assert pool_threads("flask-aclose") == []
+
+    # Requests after closing get their own executor
+    assert (await client.get("/sync")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_per_call_requests_leave_no_threads() -> None:
+    app, _ = create_loop_app()
+
+    for _ in range(5):
+        response = await FlaskHttpClient(app, thread_name_prefix="flask-call").get(
+            "/sync"
+        )
+        assert response.status_code == 200
+
+    assert pool_threads("flask-call") == []
+
+
+@pytest.mark.asyncio
+async def test_native_async_session_closes() -> None:
+    app, _ = create_loop_app()
+
+    async with AsyncFlaskHttpClient(app, thread_name_prefix="flask-native") as client:
+        responses = await client.gather([RequestSpec("/async")] * 5)
+
+    assert [response.status_code for response in responses] == [200] * 5
+    assert pool_threads("flask-native") == []
+
+
+@pytest.mark.asyncio
+async def test_gather_is_bounded_by_the_executor() -> None:
+    app, _ = create_loop_app()
+    client = FlaskHttpClient(app, max_workers=1)
+    threads: set[str] = set()
+
+    @app.get("/thread")
+    def thread_view() -> str:
+        threads.add(threading.current_thread().name)
+        return "ok"
+
+    responses = await client.gather([RequestSpec("/thread")] * 10, concurrency=5)
+
+    assert [response.status_code for response in responses] == [200] * 10
+    assert len(threads) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("client_class", "native_async", "expected"),
+    [
+        (FlaskHttpClient, None, False),
+        (FlaskHttpClient, True, True),
+        (AsyncFlaskHttpClient, None, True),
+        (AsyncFlaskHttpClient, False, False),
+    ],
+)
+async def test_native_async_views_run_on_the_calling_loop(
+    client_class: type[FlaskHttpClient], native_async: bool | None, expected: bool
+) -> None:
+    app, seen = create_loop_app()
+    client = client_class(app, native_async=native_async)
+
+    response = await client.get("/async")
+
+    assert response.status_code == 200
+    assert (seen["loop"] is asyncio.get_running_loop()) is expected
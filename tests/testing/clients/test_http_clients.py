@@ -2,7 +2,7 @@ from typing import Any, Optional, cast
 
 import pytest
 
-from cross_web.testing import HttpClient
+from cross_web.testing import HttpClient, RequestSpec, run_load
 
 
 @pytest.mark.asyncio
@@ -61,3 +61,67 @@ async def test_request_adapter_form_data(http_client: HttpClient) -> None:
 
     if "files_has_file" in result:
         assert result["files_has_file"] is True
+
+
+@pytest.mark.asyncio
+async def test_session_reuses_client_without_keeping_cookies(
+    http_client: HttpClient,
+) -> None:
+    async with http_client as client:
+        assert client is http_client
+
+        first = await client.post(
+            "/request/abc", json={"key": "value"}, cookies={"session": "123"}
+        )
+        second = await client.post("/request/abc", json={"key": "value"})
+
+    assert first.status_code == second.status_code == 200
+    assert cast(dict[str, Any], first.json)["cookies"] == {"session": "123"}
+    assert cast(dict[str, Any], second.json)["cookies"] == {}
+
+    # Requests outside the block set up their own harness again
+    response = await http_client.post("/request/abc", json={"key": "value"})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_gather(http_client: HttpClient) -> None:
+    responses = await http_client.gather(
+        [
+            RequestSpec(
+                f"/request/item{index}?query={index}",
+                "post",
+                json={"index": index},
+                cookies={"session": str(index)},
+            )
+            for index in range(12)
+        ],
+        concurrency=4,
+    )
+
+    results = [cast(dict[str, Any], response.json) for response in responses]
+
+    assert [response.status_code for response in responses] == [200] * 12
+    assert [result["path_params"] for result in results] == [
+        {"item_id": f"item{index}"} for index in range(12)
+    ]
+    assert [result["cookies"] for result in results] == [
+        {"session": str(index)} for index in range(12)
+    ]
+    assert [result["body_json"] for result in results] == [
+        {"index": index} for index in range(12)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_load(http_client: HttpClient) -> None:
+    result = await run_load(
+        http_client,
+        RequestSpec("/request/abc", "post", json={"key": "value"}),
+        count=20,
+        concurrency=4,
+    )
+
+    assert result.status_codes == {200: 20}
+    assert result.errors == 0
+    assert 0 < result.p50 <= result.p99
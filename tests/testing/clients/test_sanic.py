@@ -0,0 +1,58 @@
+import uuid
+
+import pytest
+
+pytest.importorskip("sanic")
+
+from sanic import Sanic
+from sanic.request import Request
+from sanic.response import HTTPResponse, text
+
+from cross_web.testing.clients.sanic import SanicHttpClient
+
+pytestmark = [pytest.mark.sanic]
+
+
+def create_app(starts: list[str]) -> Sanic:
+    app = Sanic(f"CrossWeb_{uuid.uuid4().hex[:8]}")
+
+    @app.before_server_start
+    async def start(app: Sanic) -> None:
+        starts.append("start")
+
+    async def ping(request: Request) -> HTTPResponse:
+        return text("pong")
+
+    app.add_route(ping, "/ping")
+    return app
+
+
+@pytest.mark.asyncio
+async def test_session_starts_app_once() -> None:
+    starts: list[str] = []
+    client = SanicHttpClient(create_app(starts))
+
+    async with client:
+        for _ in range(3):
+            response = await client.get("/ping")
+
+            assert response.status_code == 200
+            assert response.text == "pong"
+
+    assert starts == ["start"]
+
+
+@pytest.mark.asyncio
+async def test_app_can_be_started_again() -> None:
+    starts: list[str] = []
+    client = SanicHttpClient(create_app(starts))
+
+    async with client:
+        assert (await client.get("/ping")).status_code == 200
+
+    assert (await client.get("/ping")).status_code == 200
+
+    async with client:
+        assert (await client.get("/ping")).status_code == 200
+
+    assert starts == ["start"] * 3
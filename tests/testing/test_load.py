@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from cross_web.testing import (
+    HttpClient,
+    LatencyHistogram,
+    RequestSpec,
+    Response,
+    SyncHttpClient,
+    run_load,
+)
+
+
+def test_histogram_percentiles() -> None:
+    histogram = LatencyHistogram()
+
+    for value in range(1, 10_001):
+        histogram.record(value * 1_000)
+
+    assert histogram.count == 10_000
+    assert histogram.min == 1_000
+    assert histogram.max == 10_000_000
+    assert histogram.mean == pytest.approx(5_000_500)
+
+    for percentile, expected in [(50, 5_000_000), (99, 9_900_000), (99.9, 9_990_000)]:
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.01)
+
+    assert histogram.percentile(0) == pytest.approx(1_000, rel=0.01)
+    assert histogram.percentile(100) == 10_000_000
+
+
+def test_histogram_small_values_are_exact() -> None:
+    histogram = LatencyHistogram()
+
+    for value in [0, 1, 2, 3, 200]:
+        histogram.record(value)
+
+    assert [histogram.percentile(p) for p in (20, 40, 60, 80, 100)] == [
+        0,
+        1,
+        2,
+        3,
+        200,
+    ]
+
+
+def test_histogram_empty_and_invalid() -> None:
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(99) == 0
+    assert histogram.mean == 0.0
+
+    with pytest.raises(ValueError, match="between 0 and 100"):
+        histogram.percentile(101)
+
+
+class SleepingHttpClient(HttpClient):
+    def __init__(self, app: Any, delay: float = 0.001) -> None:
+        self.app = app
+        self.delay = delay
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def request(
+        self,
+        url: str,
+        method: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if url == "/fail":
+            raise RuntimeError("failed")
+
+        return Response(status_code=404 if url == "/missing" else 200, data=b"")
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_count() -> None:
+    client = SleepingHttpClient(app=None)
+
+    result = await run_load(client, RequestSpec("/"), count=50, concurrency=5)
+
+    assert result.requests == 50
+    assert result.status_codes == {200: 50}
+    assert result.errors == 0
+    assert client.most_in_flight == 5
+    assert result.p50 >= 1_000_000
+    assert result.p50 <= result.p95 <= result.p99 <= result.p999
+    assert result.throughput == pytest.approx(50 / result.duration)
+    assert "50 requests in" in result.summary()
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_duration() -> None:
+    result = await run_load(
+        SleepingHttpClient(app=None), RequestSpec("/missing"), duration=0.05
+    )
+
+    assert 0.05 <= result.duration < 0.5
+    assert result.requests > 0
+    assert result.status_codes == {404: result.requests}
+
+
+@pytest.mark.asyncio
+async def test_open_loop_measures_from_the_schedule() -> None:
+    # The app takes 20 ms but requests are due every 5 ms: the open loop keeps
+    # starting them on time, so they overlap
+    client = SleepingHttpClient(app=None, delay=0.02)
+
+    result = await run_load(client, RequestSpec("/"), count=10, rate=200)
+
+    assert result.requests == 10
+    assert client.most_in_flight > 1
+    assert result.p50 >= 20_000_000
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted() -> None:
+    result = await run_load(SleepingHttpClient(app=None), RequestSpec("/fail"), count=3)
+
+    assert result.errors == 3
+    assert result.requests == 0
+    assert result.throughput == 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"count": 1, "duration": 1.0}, {"count": 1, "rate": 0}],
+)
+async def test_invalid_arguments(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        await run_load(SleepingHttpClient(app=None), RequestSpec("/"), **kwargs)
+
+
+class ThreadedHttpClient(SyncHttpClient):
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.threads: set[int] = set()
+
+    def _request_sync(
+        self,
+        session: Any,
+        url: str,
+        method: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        self.threads.add(threading.get_ident())
+        time.sleep(0.001)
+
+        return Response(status_code=200, data=b"")
+
+
+@pytest.mark.asyncio
+async def test_sync_clients_use_threads() -> None:
+    client = ThreadedHttpClient(app=None)
+
+    result = await run_load(client, RequestSpec("/"), count=20, concurrency=4)
+
+    assert result.requests == 20
+    assert 1 < len(client.threads) <= 4
+    assert threading.get_ident() not in client.threads